@@ -0,0 +1,294 @@
+# python -m benchmarks.websocket_throughput --buckets 4 --subscriptions 25
+
+"""
+End-to-end socket-to-callback benchmark for BfxWebSocketClient.
+
+A local server speaking the Bitfinex WebSocket v2 protocol runs in a separate
+process. The client subscribes N buckets x M trades channels and the server
+streams trade executions to every active channel. Each message carries the
+wall-clock time (in nanoseconds) at which the server sent it in the trade id,
+so latency is measured from server send to user-handler entry.
+
+The report is printed as JSON (and optionally written to --output) together
+with the library, interpreter and machine details, so that runs can be compared
+across library versions and machine types.
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import multiprocessing
+import os
+import platform
+import sys
+import time
+from importlib import metadata
+from multiprocessing.connection import Connection as Pipe
+from multiprocessing.synchronize import Event
+from typing import Any, Dict, List, Optional
+
+import websockets.server
+from websockets.server import WebSocketServerProtocol
+
+from bfxapi._version import __version__
+from bfxapi.types import TradingPairTrade
+from bfxapi.websocket import BfxWebSocketClient
+from bfxapi.websocket.subscriptions import Subscription
+
+_MAXIMUM_SUBSCRIPTIONS_PER_BUCKET = 25
+
+# Subscriptions used to pad buckets up to 25 channels when M < 25, so that the
+# client opens exactly N buckets: the server never streams to these channels.
+_IDLE_PREFIX = "tIDLE"
+
+
+async def _server(pipe: Pipe, start: Event, messages: int, rate: float) -> None:
+    loop = asyncio.get_running_loop()
+
+    started = loop.run_in_executor(None, start.wait)
+
+    chan_ids = itertools.count(1)
+
+    async def _stream(websocket: WebSocketServerProtocol, channels: List[int]):
+        await started
+
+        interval = rate and 1.0 / rate or 0.0
+
+        deadline = time.perf_counter()
+
+        for sequence in range(messages):
+            for chan_id in channels:
+                await websocket.send(
+                    f'[{chan_id},"te",[{time.time_ns()},{sequence},0.01,100.5]]'
+                )
+
+            if interval:
+                deadline += interval
+
+                await asyncio.sleep(max(0.0, deadline - time.perf_counter()))
+
+    async def _handler(websocket: WebSocketServerProtocol) -> None:
+        await websocket.send(
+            json.dumps({"event": "info", "version": 2, "platform": {"status": 1}})
+        )
+
+        channels: List[int] = []
+
+        stream: Optional[asyncio.Task] = None
+
+        async for _message in websocket:
+            message = json.loads(_message)
+
+            if message["event"] == "subscribe":
+                chan_id = next(chan_ids)
+
+                await websocket.send(
+                    json.dumps(
+                        {
+                            "event": "subscribed",
+                            "channel": message["channel"],
+                            "chanId": chan_id,
+                            "symbol": message["symbol"],
+                            "pair": message["symbol"][1:],
+                            "subId": message["subId"],
+                        }
+                    )
+                )
+
+                if not message["symbol"].startswith(_IDLE_PREFIX):
+                    channels.append(chan_id)
+
+                    if not stream:
+                        stream = asyncio.create_task(_stream(websocket, channels))
+            elif message["event"] == "conf":
+                await websocket.send(json.dumps({"event": "conf", "status": "OK"}))
+
+    async with websockets.server.serve(_handler, "127.0.0.1", 0) as server:
+        pipe.send(list(server.sockets)[0].getsockname()[1])
+
+        await asyncio.Future()
+
+
+def _serve(pipe: Pipe, start: Event, messages: int, rate: float) -> None:
+    asyncio.run(_server(pipe, start, messages, rate))
+
+
+def _percentile(values: List[int], percentile: float) -> float:
+    index = max(0, -(-len(values) * percentile // 100) - 1)
+
+    return values[min(int(index), len(values) - 1)] / 1_000
+
+
+async def _client(
+    host: str, start: Event, buckets: int, subscriptions: int, messages: int
+) -> Dict[str, Any]:
+    client = BfxWebSocketClient(host)
+
+    expected = buckets * subscriptions * messages
+
+    latencies: List[int] = []
+
+    subscribed, done = asyncio.Event(), asyncio.Event()
+
+    results: Dict[str, Any] = {}
+
+    count = 0
+
+    @client.on("subscribed")
+    def on_subscribed(_subscription: Subscription) -> None:
+        nonlocal count
+
+        count += 1
+
+        if count == buckets * _MAXIMUM_SUBSCRIPTIONS_PER_BUCKET:
+            subscribed.set()
+
+    @client.on("t_trade_execution")
+    def on_t_trade_execution(_subscription: Subscription, trade: TradingPairTrade):
+        latencies.append(time.time_ns() - trade.id)
+
+        if len(latencies) == expected:
+            done.set()
+
+    @client.on("open")
+    async def on_open() -> None:
+        for bucket, index in itertools.product(
+            range(buckets), range(_MAXIMUM_SUBSCRIPTIONS_PER_BUCKET)
+        ):
+            if index < subscriptions:
+                symbol = f"tBENCH{bucket}X{index}"
+            else:
+                symbol = f"{_IDLE_PREFIX}{bucket}X{index}"
+
+            await client.subscribe("trades", symbol=symbol)
+
+        await subscribed.wait()
+
+        wall, cpu = time.perf_counter(), time.process_time()
+
+        start.set()
+
+        await done.wait()
+
+        wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+
+        latencies.sort()
+
+        results.update(
+            {
+                "messages": len(latencies),
+                "elapsed_s": wall,
+                "messages_per_s": len(latencies) / wall,
+                "cpu_s": cpu,
+                "cpu_us_per_message": cpu / len(latencies) * 1_000_000,
+                "latency_us": {
+                    "p50": _percentile(latencies, 50),
+                    "p99": _percentile(latencies, 99),
+                    "p999": _percentile(latencies, 99.9),
+                    "max": latencies[-1] / 1_000,
+                },
+            }
+        )
+
+        await client.close()
+
+    await client.start()
+
+    return results
+
+
+def _environment() -> Dict[str, Any]:
+    return {
+        "bfxapi": __version__,
+        "websockets": metadata.version("websockets"),
+        "pyee": metadata.version("pyee"),
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> Dict[str, Any]:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.websocket_throughput",
+        description="Socket-to-callback throughput and latency of BfxWebSocketClient.",
+    )
+
+    parser.add_argument("--buckets", type=int, default=1, help="number of buckets")
+    parser.add_argument(
+        "--subscriptions",
+        type=int,
+        default=_MAXIMUM_SUBSCRIPTIONS_PER_BUCKET,
+        choices=range(1, _MAXIMUM_SUBSCRIPTIONS_PER_BUCKET + 1),
+        metavar="[1-25]",
+        help="active subscriptions per bucket",
+    )
+    parser.add_argument(
+        "--messages", type=int, default=2_000, help="messages per subscription"
+    )
+    parser.add_argument(
+        "--rate",
+        type=float,
+        default=0.0,
+        help="messages per second per subscription (0 for unthrottled)",
+    )
+    parser.add_argument("--timeout", type=float, default=600.0)
+    parser.add_argument("--output", help="also write the JSON report to this file")
+
+    args = parser.parse_args(argv)
+
+    context = multiprocessing.get_context("spawn")
+
+    receiver, sender = context.Pipe(duplex=False)
+
+    start = context.Event()
+
+    server = context.Process(
+        target=_serve,
+        args=(sender, start, args.messages, args.rate),
+        daemon=True,
+    )
+
+    server.start()
+
+    try:
+        host = f"ws://127.0.0.1:{receiver.recv()}"
+
+        results = asyncio.run(
+            asyncio.wait_for(
+                _client(host, start, args.buckets, args.subscriptions, args.messages),
+                timeout=args.timeout,
+            )
+        )
+    finally:
+        server.terminate()
+
+        server.join()
+
+    report = {
+        "benchmark": "websocket_throughput",
+        "environment": _environment(),
+        "parameters": {
+            "buckets": args.buckets,
+            "subscriptions": args.subscriptions,
+            "messages": args.messages,
+            "rate": args.rate,
+        },
+        "results": results,
+    }
+
+    print(json.dumps(report, indent=2))
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output:
+            json.dump(report, output, indent=2)
+
+    return report
+
+
+if __name__ == "__main__":
+    main()
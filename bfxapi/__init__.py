@@ -1 +1,3 @@
+from ._candle_store import CandleStore
 from ._client import PUB_REST_HOST, PUB_WSS_HOST, REST_HOST, WSS_HOST, Client
+from ._utils.nonce import NonceAllocator, set_nonce_allocator
@@ -0,0 +1,406 @@
+import json
+import mmap
+import os
+import threading
+import time
+from bisect import bisect_left, bisect_right
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
+
+from bfxapi.rest._interface.pagination import Paginator
+from bfxapi.types import Candle, serializers
+
+if TYPE_CHECKING:
+    from bfxapi.rest import BfxRestInterface
+    from bfxapi.websocket import BfxWebSocketClient
+    from bfxapi.websocket.subscriptions import Candles
+
+# Columns of the candles, each one in its own file of 8-byte values
+_COLUMNS = ("mts", "open", "close", "high", "low", "volume")
+
+_FORMATS = ("q", "d", "d", "d", "d", "d")
+
+_MINUTE = 60_000
+
+_DAY = 24 * 60 * _MINUTE
+
+# Milliseconds per timeframe (at most, for 1M): candles younger than that may
+# still change, so the ranges fetched from REST never cover them
+_TIMEFRAMES = {
+    "1m": _MINUTE,
+    "5m": 5 * _MINUTE,
+    "15m": 15 * _MINUTE,
+    "30m": 30 * _MINUTE,
+    "1h": 60 * _MINUTE,
+    "3h": 180 * _MINUTE,
+    "6h": 360 * _MINUTE,
+    "12h": 720 * _MINUTE,
+    "1D": _DAY,
+    "1W": 7 * _DAY,
+    "14D": 14 * _DAY,
+    "1M": 31 * _DAY,
+}
+
+_Row = Tuple[Any, ...]
+
+
+def _to_row(candle: Any) -> _Row:
+    # Candles can be in any output (e.g. dataclasses, tuples or raw lists)
+    if isinstance(candle, (list, tuple)):
+        values = candle[:6]
+    else:
+        values = [getattr(candle, column) for column in _COLUMNS]
+
+    return (int(values[0]), *(float(value) for value in values[1:]))
+
+
+class _Series:
+    """
+    Candles of a symbol and timeframe, sorted by mts, in memory-mapped files
+    (one per column), along with the time ranges already fetched.
+    """
+
+    def __init__(self, path: str) -> None:
+        os.makedirs(path, exist_ok=True)
+
+        self.__fds = [
+            os.open(os.path.join(path, column), os.O_RDWR | os.O_CREAT, 0o644)
+            for column in _COLUMNS
+        ]
+
+        # The shortest file wins, in case a merge was interrupted
+        self.__length = min(os.fstat(fd).st_size for fd in self.__fds) // 8
+
+        self.__maps: List[mmap.mmap] = []
+
+        self.__columns: List[memoryview] = []
+
+        self.__map()
+
+        self.__coverage_path = os.path.join(path, "coverage.json")
+
+        self.coverage: List[List[int]] = []
+
+        if os.path.exists(self.__coverage_path):
+            with open(self.__coverage_path, encoding="utf-8") as file:
+                self.coverage = json.load(file)
+
+    def __len__(self) -> int:
+        return self.__length
+
+    def get_columns(
+        self, start: Optional[int] = None, end: Optional[int] = None
+    ) -> Dict[str, memoryview]:
+        if self.__length == 0:
+            return {
+                column: memoryview(b"").cast(fmt)
+                for column, fmt in zip(_COLUMNS, _FORMATS)
+            }
+
+        mts = self.__columns[0]
+
+        lo = 0 if start is None else bisect_left(mts, start)
+
+        hi = self.__length if end is None else bisect_right(mts, end)
+
+        return {
+            column: values[lo:hi] for column, values in zip(_COLUMNS, self.__columns)
+        }
+
+    def merge(self, rows: Sequence[_Row]) -> None:
+        """
+        Update the candles already stored in place, and add the others.
+        """
+
+        # Sorted by mts, the last candle of each mts winning
+        rows, appended = sorted({row[0]: row for row in rows}.values()), 0
+
+        for index, row in enumerate(rows):
+            if self.__length and row[0] <= self.__columns[0][-1]:
+                position = bisect_left(self.__columns[0], row[0])
+
+                if self.__columns[0][position] != row[0]:
+                    # An older candle is missing: the columns are rewritten
+                    return self.__rewrite(rows)
+
+                self.__write(position, row)
+            else:
+                appended = len(rows) - index
+
+                break
+
+        if appended:
+            start = self.__resize(self.__length + appended)
+
+            for position, row in enumerate(rows[-appended:], start):
+                self.__write(position, row)
+
+    def cover(self, start: int, end: int) -> None:
+        merged: List[List[int]] = []
+
+        for interval in sorted([*self.coverage, [start, end]]):
+            if merged and interval[0] <= merged[-1][1] + 1:
+                merged[-1][1] = max(merged[-1][1], interval[1])
+            else:
+                merged.append(list(interval))
+
+        self.coverage = merged
+
+        with open(f"{self.__coverage_path}.tmp", "w", encoding="utf-8") as file:
+            json.dump(merged, file)
+
+        os.replace(f"{self.__coverage_path}.tmp", self.__coverage_path)
+
+    def get_missing(self, start: int, end: int) -> List[Tuple[int, int]]:
+        missing: List[Tuple[int, int]] = []
+
+        for lo, hi in self.coverage:
+            if hi < start:
+                continue
+
+            if lo > end:
+                break
+
+            if lo > start:
+                missing.append((start, lo - 1))
+
+            start = hi + 1
+
+        if start <= end:
+            missing.append((start, end))
+
+        return missing
+
+    def close(self) -> None:
+        self.__unmap()
+
+        for fd in self.__fds:
+            os.close(fd)
+
+    def __write(self, position: int, row: _Row) -> None:
+        for values, value in zip(self.__columns, row):
+            values[position] = value
+
+    def __rewrite(self, rows: Sequence[_Row]) -> None:
+        candles = {row[0]: row for row in self.__read()}
+
+        candles.update((row[0], row) for row in rows)
+
+        self.__resize(len(candles))
+
+        for position, mts in enumerate(sorted(candles)):
+            self.__write(position, candles[mts])
+
+    def __read(self) -> List[_Row]:
+        return list(zip(*self.__columns))
+
+    def __resize(self, length: int) -> int:
+        # Columns only grow: the views still using the previous maps keep
+        # reading within the files
+        if length < self.__length:
+            raise ValueError("The columns of a series can't shrink.")
+
+        previous, self.__length = self.__length, length
+
+        self.__unmap()
+
+        for fd in self.__fds:
+            os.ftruncate(fd, length * 8)
+
+        self.__map()
+
+        return previous
+
+    def __map(self) -> None:
+        self.__maps = [
+            mmap.mmap(fd, self.__length * 8) for fd in self.__fds if self.__length
+        ]
+
+        self.__columns = [
+            memoryview(map).cast(fmt) for map, fmt in zip(self.__maps, _FORMATS)
+        ]
+
+    def __unmap(self) -> None:
+        for view in self.__columns:
+            view.release()
+
+        for map in self.__maps:
+            try:
+                map.close()
+            except BufferError:
+                # Views returned by get_columns still use it: it's closed once
+                # they are gone
+                pass
+
+        self.__maps, self.__columns = [], []
+
+
+class CandleStore:
+    """
+    Candle history kept in <path>, with a directory per symbol and timeframe
+    holding a memory-mapped file per column (mts, open, close, high, low and
+    volume), so that restarts start warm.
+
+    sync() only fetches, from REST, the time ranges which weren't fetched yet;
+    once attached to a WebSocket client, the candles of its candles channels
+    (snapshots and updates) are merged in place as they arrive.
+    """
+
+    def __init__(
+        self, rest: "BfxRestInterface", path: str, *, limit: int = 10_000
+    ) -> None:
+        self.__rest, self.__path, self.__limit = rest, path, limit
+
+        self.__series: Dict[Tuple[str, str], _Series] = {}
+
+        self.__lock = threading.RLock()
+
+    def attach(self, wss: "BfxWebSocketClient") -> None:
+        wss.on("candles_snapshot", self.__on_snapshot)
+
+        wss.on("candles_update", self.__on_update)
+
+    def sync(
+        self, symbol: str, tf: str = "1m", *, start: int, end: Optional[int] = None
+    ) -> int:
+        """
+        Fetch the candles between <start> and <end> (milliseconds, by default
+        until now) missing from the store, and return how many were fetched.
+        """
+
+        if tf not in _TIMEFRAMES:
+            raise ValueError(f"Unknown timeframe: <{tf}>.")
+
+        # The candles of the last timeframe may still change
+        recent = int(time.time() * 1000) - _TIMEFRAMES[tf]
+
+        end = recent if end is None else min(end, recent)
+
+        fetched = 0
+
+        with self.__lock:
+            series = self.__get_series(symbol, tf)
+
+            missing = series.get_missing(start, end)
+
+        # The raw candles, whatever the output (e.g. numpy) of the client
+        endpoint = f"candles/trade:{tf}:{symbol}/hist"
+
+        def fetch(**window: Any) -> List[Any]:
+            return list(self.__rest.public._m.get(endpoint, params=window, stream=True))
+
+        for lo, hi in missing:
+            candles: Paginator[Any] = Paginator(
+                fetch,
+                serializers.Candle,
+                mts="mts",
+                start=str(lo),
+                end=str(hi),
+                limit=self.__limit,
+            )
+
+            rows = [_to_row(candle) for candle in candles]
+
+            with self.__lock:
+                series.merge(rows)
+
+                series.cover(lo, hi)
+
+            fetched += len(rows)
+
+        return fetched
+
+    def get(
+        self,
+        symbol: str,
+        tf: str = "1m",
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+    ) -> List[Candle]:
+        """
+        Candles stored between <start> and <end> (inclusive), oldest first, in
+        the output of the library.
+        """
+
+        columns = self.get_columns(symbol, tf, start, end)
+
+        return [
+            serializers.Candle.parse(*row)
+            for row in zip(*(columns[column].tolist() for column in _COLUMNS))
+        ]
+
+    def get_columns(
+        self,
+        symbol: str,
+        tf: str = "1m",
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+    ) -> Dict[str, memoryview]:
+        """
+        Columns of the candles stored between <start> and <end>, as views of
+        the files (e.g. for numpy.asarray), without copying them.
+
+        The views must not be used across a merge (by sync or, once attached,
+        by the candles received): candles are updated, and may be moved, in
+        place, and the views don't see the candles added. Copy them (e.g. with
+        numpy.array) to keep them.
+        """
+
+        with self.__lock:
+            return self.__get_series(symbol, tf).get_columns(start, end)
+
+    def close(self) -> None:
+        with self.__lock:
+            for series in self.__series.values():
+                series.close()
+
+            self.__series.clear()
+
+    def __get_series(self, symbol: str, tf: str) -> _Series:
+        if (series := self.__series.get((symbol, tf))) is None:
+            path = os.path.join(self.__path, symbol.replace(":", "_"), tf)
+
+            series = self.__series[(symbol, tf)] = _Series(path)
+
+        return series
+
+    def __on_snapshot(self, subscription: "Candles", candles: List[Any]) -> None:
+        if not candles or (key := CandleStore.__parse_key(subscription)) is None:
+            return
+
+        rows = [_to_row(candle) for candle in candles]
+
+        with self.__lock:
+            series = self.__get_series(*key)
+
+            series.merge(rows)
+
+            # The last candle is still open
+            series.cover(min(rows)[0], max(rows)[0] - 1)
+
+    def __on_update(self, subscription: "Candles", candle: Any) -> None:
+        if (key := CandleStore.__parse_key(subscription)) is None:
+            return
+
+        row = _to_row(candle)
+
+        with self.__lock:
+            series = self.__get_series(*key)
+
+            series.merge([row])
+
+            # A new candle closes the previous one, which extends its range
+            for interval in series.coverage:
+                if interval[1] < row[0] - 1 <= interval[1] + _TIMEFRAMES[key[1]]:
+                    series.cover(interval[0], row[0] - 1)
+
+                    break
+
+    @staticmethod
+    def __parse_key(subscription: "Candles") -> Optional[Tuple[str, str]]:
+        # e.g. trade:1m:tBTCUSD (funding keys carry their period too)
+        _, tf, symbol = subscription["key"].split(":", 2)
+
+        if tf not in _TIMEFRAMES:
+            return None
+
+        return symbol, tf
@@ -6,6 +6,7 @@ from bfxapi.rest import BfxRestInterface
 from bfxapi.websocket import BfxWebSocketClient
 
 if TYPE_CHECKING:
+    from bfxapi.types.labeler import _Output
     from bfxapi.websocket._client.bfx_websocket_client import _Credentials
 
 REST_HOST = "https://api.bitfinex.com/v2"
@@ -26,6 +27,7 @@ class Client:
         filters: Optional[List[str]] = None,
         timeout: Optional[int] = 60 * 15,
         log_filename: Optional[str] = None,
+        output: Optional["_Output"] = None,
     ) -> None:
         credentials: Optional["_Credentials"] = None
 
@@ -44,7 +46,7 @@ class Client:
                 "You must provide both API-KEY and API-SECRET (missing API-SECRET)."
             )
 
-        self.rest = BfxRestInterface(rest_host, api_key, api_secret)
+        self.rest = BfxRestInterface(rest_host, api_key, api_secret, output=output)
 
         logger = ColorLogger("bfxapi", level="INFO")
 
@@ -52,5 +54,9 @@ class Client:
             logger.register(filename=log_filename)
 
         self.wss = BfxWebSocketClient(
-            wss_host, credentials=credentials, timeout=timeout, logger=logger
+            wss_host,
+            credentials=credentials,
+            timeout=timeout,
+            logger=logger,
+            output=output,
         )
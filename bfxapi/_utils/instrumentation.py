@@ -0,0 +1,213 @@
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field, replace
+from typing import Callable, ClassVar, Dict, Iterator, List, Optional, Union
+
+# Upper bounds (in seconds) of the buckets of the latency histograms
+_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+@dataclass
+class RequestMetrics:
+    """
+    Metrics of a REST request, in seconds: <wait> for the rate limiter, <dns>,
+    <connect> and <tls> to open a connection (None when a pooled connection
+    was reused), <first_byte> until the headers of the response, <decode> in
+    JSONDecoder and <parse> in the serializers of the endpoint method.
+
+    <total> runs from get (or post) until the response is decoded, retries
+    included. Streamed responses are decoded and parsed as they arrive: their
+    <total> includes both, and <decode> and <parse> are None.
+
+    BfxRestInterface counts the DNS resolution in <connect>, AsyncBfxRestInterface
+    the TLS handshake (<tls> is None).
+
+    The acknowledgements of WebSocket order inputs are reported with the method
+    "ws", the input (e.g. "on") as endpoint and their round trip as <total>.
+    """
+
+    method: str
+    endpoint: str
+    name: Optional[str] = None
+    status: Optional[int] = None
+    error: Optional[str] = None
+    attempts: int = 0
+    request_bytes: int = 0
+    response_bytes: int = 0
+    wait: float = 0.0
+    dns: Optional[float] = None
+    connect: Optional[float] = None
+    tls: Optional[float] = None
+    first_byte: Optional[float] = None
+    decode: Optional[float] = None
+    parse: Optional[float] = None
+    total: float = 0.0
+    started: float = field(default_factory=time.perf_counter, repr=False)
+
+
+@dataclass
+class EndpointStats:
+    """
+    Aggregates of the requests of an endpoint method: histogram[i] counts the
+    requests whose total took up to BUCKETS[i] seconds (the last one, longer).
+    """
+
+    BUCKETS: ClassVar = _BUCKETS
+
+    count: int = 0
+    errors: int = 0
+    total: float = 0.0
+    decode: float = 0.0
+    parse: float = 0.0
+    response_bytes: int = 0
+    histogram: List[int] = field(default_factory=lambda: [0] * (len(_BUCKETS) + 1))
+
+    @property
+    def error_rate(self) -> float:
+        return self.errors / self.count if self.count else 0.0
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def get_percentile(self, percentile: float) -> float:
+        """
+        Upper bound of the bucket holding the given percentile (e.g. 99) of the
+        latencies, or inf if it's beyond the last one.
+        """
+
+        rank, count = percentile / 100 * self.count, 0
+
+        for bound, bucket in zip(self.BUCKETS, self.histogram):
+            if (count := count + bucket) >= rank:
+                return bound
+
+        return float("inf")
+
+    def add(self, metrics: RequestMetrics) -> None:
+        self.count += 1
+
+        self.errors += metrics.error is not None
+
+        self.total += metrics.total
+
+        self.decode += metrics.decode or 0.0
+
+        self.parse += metrics.parse or 0.0
+
+        self.response_bytes += metrics.response_bytes
+
+        index = next(
+            (i for i, bound in enumerate(self.BUCKETS) if metrics.total <= bound),
+            len(self.BUCKETS),
+        )
+
+        self.histogram[index] += 1
+
+
+def get_family(endpoint: str) -> str:
+    # e.g. candles or auth/r/orders, as rate limited by Bitfinex
+    segments = endpoint.split("/")
+
+    if segments[0] == "auth":
+        return "/".join(segments[:3])
+
+    return segments[0]
+
+
+# Requests sent by the endpoint method being called, reported once it returns
+_CALL: ContextVar[Optional[List[RequestMetrics]]] = ContextVar("_CALL", default=None)
+
+
+class Instrumentation:
+    """
+    Hooks called with the RequestMetrics of each REST request, once its
+    endpoint method returned (from the thread, or task, which called it),
+    and aggregates per endpoint method (or per family of endpoints, for the
+    requests sent on their own).
+
+    BfxWebSocketClient reports the acknowledgements of its order inputs, per
+    method of its inputs, when they arrive.
+    """
+
+    def __init__(self, *hooks: Callable[[RequestMetrics], None]) -> None:
+        self.__hooks = list(hooks)
+
+        self.__stats: Dict[str, EndpointStats] = {}
+
+        self.__lock = threading.Lock()
+
+    def add_hook(self, hook: Callable[[RequestMetrics], None]) -> None:
+        self.__hooks.append(hook)
+
+    def remove_hook(self, hook: Callable[[RequestMetrics], None]) -> None:
+        self.__hooks.remove(hook)
+
+    def get_stats(self) -> Dict[str, EndpointStats]:
+        with self.__lock:
+            return {key: replace(stats) for key, stats in self.__stats.items()}
+
+    def reset(self) -> None:
+        with self.__lock:
+            self.__stats.clear()
+
+    @contextmanager
+    def call(self, name: str) -> Iterator[None]:
+        """
+        Report the requests sent within (by the endpoint method <name>) once
+        it's over, with the time spent outside of them as that of parsing.
+        """
+
+        requests: List[RequestMetrics] = []
+
+        token, started = _CALL.set(requests), time.perf_counter()
+
+        try:
+            yield
+        finally:
+            _CALL.reset(token)
+
+            elapsed = time.perf_counter() - started
+
+            if requests and requests[-1].decode is not None:
+                requests[-1].parse = max(
+                    0.0, elapsed - sum(metrics.total for metrics in requests)
+                )
+
+            for metrics in requests:
+                metrics.name = name
+
+                self.__report(metrics)
+
+    def finish(
+        self, metrics: RequestMetrics, error: Optional[BaseException] = None
+    ) -> None:
+        metrics.total = time.perf_counter() - metrics.started
+
+        if error is not None:
+            metrics.error = type(error).__name__
+
+        if (requests := _CALL.get()) is not None:
+            requests.append(metrics)
+        else:
+            self.__report(metrics)
+
+    def __report(self, metrics: RequestMetrics) -> None:
+        key = metrics.name or get_family(metrics.endpoint)
+
+        with self.__lock:
+            self.__stats.setdefault(key, EndpointStats()).add(metrics)
+
+        for hook in self.__hooks:
+            hook(metrics)
+
+
+def get_instrumentation(
+    instrumentation: Union[Instrumentation, bool],
+) -> Optional[Instrumentation]:
+    if isinstance(instrumentation, Instrumentation):
+        return instrumentation
+
+    return Instrumentation() if instrumentation else None
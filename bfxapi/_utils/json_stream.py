@@ -0,0 +1,79 @@
+import codecs
+import json
+import re
+from typing import Iterable, Iterator, Optional
+
+# Whitespace, then the comma between two elements (if any)
+_SEPARATOR = re.compile(r"[ \t\n\r]*(?:,[ \t\n\r]*)?")
+
+_START = re.compile(r"[ \t\n\r]*\[")
+
+# Characters which can follow an element: anything else may be part of it
+_DELIMITERS = ",] \t\n\r"
+
+
+def iter_array(chunks: Iterable[bytes], decoder: json.JSONDecoder) -> Iterator[object]:
+    """
+    Decode the elements of the top-level JSON array made of <chunks> (UTF-8
+    bytes, as they arrive), yielding each one as soon as it's complete.
+    """
+
+    utf8 = codecs.getincrementaldecoder("utf-8")()
+
+    # scan_once is the (C) scanner behind raw_decode, without its overhead
+    scan_once, separator = decoder.scan_once, _SEPARATOR.match  # type: ignore[attr-defined]
+
+    buffer, index, started = "", 0, False
+
+    for chunk in _end(chunks):
+        final = chunk is None
+
+        # Only the (incomplete) last element is kept from the previous chunks
+        buffer, index = buffer[index:] + utf8.decode(chunk or b"", final), 0
+
+        if not started:
+            if (match := _START.match(buffer)) is None:
+                if final or buffer.strip():
+                    raise ValueError("The response isn't a JSON array.")
+
+                continue
+
+            index, started = match.end(), True
+
+        while True:
+            index = separator(buffer, index).end()  # type: ignore[union-attr]
+
+            if index == len(buffer):
+                break
+
+            if buffer[index] == "]":
+                return
+
+            try:
+                element, end = scan_once(buffer, index)
+            except (json.JSONDecodeError, StopIteration):
+                if final:
+                    raise json.JSONDecodeError(
+                        "Invalid element", buffer, index
+                    ) from None
+
+                break
+
+            # A number (e.g. "1." or "1e") may go on in the next chunk
+            if end == len(buffer) or buffer[end] not in _DELIMITERS:
+                if final and end < len(buffer):
+                    raise json.JSONDecodeError("Invalid element", buffer, end)
+
+                break
+
+            yield element
+
+            index = end
+
+    raise ValueError("The JSON array of the response is incomplete.")
+
+
+def _end(chunks: Iterable[bytes]) -> Iterator[Optional[bytes]]:
+    yield from chunks
+
+    yield None
@@ -0,0 +1,105 @@
+import mmap
+import os
+import struct
+import sys
+import threading
+import time
+from typing import Optional
+
+_COUNTER = struct.Struct("<Q")
+
+
+class NonceAllocator:
+    """
+    Strictly increasing nonces: microseconds since the epoch, or the previous
+    nonce plus one when the clock didn't move forward (or went backwards).
+
+    Nonces are unique across threads and, with <path>, across the processes
+    using the same file (a memory-mapped counter, locked while it's updated).
+    """
+
+    def __init__(self, path: Optional[str] = None) -> None:
+        self.__last = 0
+
+        self.__lock = threading.Lock()
+
+        self.__map: Optional[mmap.mmap] = None
+
+        if path is not None:
+            self.__fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+
+            if os.fstat(self.__fd).st_size < _COUNTER.size:
+                os.ftruncate(self.__fd, _COUNTER.size)
+
+            self.__map = mmap.mmap(self.__fd, _COUNTER.size)
+
+    def next(self) -> int:
+        with self.__lock:
+            now = time.time_ns() // 1_000
+
+            if self.__map is None:
+                self.__last = max(now, self.__last + 1)
+
+                return self.__last
+
+            _lock_file(self.__fd)
+
+            try:
+                (last,) = _COUNTER.unpack_from(self.__map)
+
+                self.__last = max(now, last + 1)
+
+                _COUNTER.pack_into(self.__map, 0, self.__last)
+            finally:
+                _unlock_file(self.__fd)
+
+            return self.__last
+
+    def close(self) -> None:
+        if self.__map is not None:
+            self.__map.close()
+
+            os.close(self.__fd)
+
+            self.__map = None
+
+
+if sys.platform == "win32":
+    import msvcrt
+
+    def _lock_file(fd: int) -> None:
+        os.lseek(fd, 0, os.SEEK_SET)
+
+        msvcrt.locking(fd, msvcrt.LK_LOCK, _COUNTER.size)
+
+    def _unlock_file(fd: int) -> None:
+        os.lseek(fd, 0, os.SEEK_SET)
+
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, _COUNTER.size)
+
+else:
+    import fcntl
+
+    def _lock_file(fd: int) -> None:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+
+    def _unlock_file(fd: int) -> None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+
+
+_ALLOCATOR = NonceAllocator()
+
+
+def set_nonce_allocator(allocator: NonceAllocator) -> None:
+    """
+    Use <allocator> for the nonces of every authenticated request (REST and
+    WebSocket), e.g. one with a file shared by the processes using an API key.
+    """
+
+    global _ALLOCATOR
+
+    _ALLOCATOR = allocator
+
+
+def get_nonce() -> int:
+    return _ALLOCATOR.next()
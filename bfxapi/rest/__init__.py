@@ -1 +1,8 @@
+from bfxapi._utils.instrumentation import EndpointStats, Instrumentation, RequestMetrics
+
+from ._async_bfx_rest_interface import AsyncBfxRestInterface
 from ._bfx_rest_interface import BfxRestInterface
+from ._interface.rate_limiter import RateLimiter
+from ._interface.request_coalescer import RequestCoalescer
+from ._interface.response_cache import ResponseCache
+from ._interface.retry_policy import CircuitBreaker, RetryPolicy
@@ -0,0 +1,174 @@
+from types import TracebackType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
+
+from bfxapi._utils.instrumentation import Instrumentation, get_instrumentation
+from bfxapi.rest._bfx_rest_interface import (
+    _get_cache,
+    _get_circuit_breaker,
+    _get_coalescer,
+    _get_rate_limiter,
+    _get_retry_policy,
+)
+from bfxapi.rest._interface.async_interface import AsyncInterface
+from bfxapi.rest._interface.async_middleware import AsyncMiddleware, AsyncSession
+from bfxapi.rest._interface.fan_out import (
+    Call,
+    fan_out_async,
+    fan_out_async_as_completed,
+)
+from bfxapi.rest._interface.rate_limiter import RateLimiter
+from bfxapi.rest._interface.request_coalescer import RequestCoalescer
+from bfxapi.rest._interface.response_cache import ResponseCache
+from bfxapi.rest._interface.retry_policy import CircuitBreaker, RetryPolicy
+from bfxapi.rest._interfaces import (
+    RestAuthEndpoints,
+    RestMerchantEndpoints,
+    RestPublicEndpoints,
+)
+
+if TYPE_CHECKING:
+    from aiohttp import ClientSession
+
+    from bfxapi.types.labeler import _Output
+
+
+class AsyncBfxRestInterface:
+    """
+    Asynchronous counterpart of BfxRestInterface, built on aiohttp: it has the
+    same endpoint methods (as coroutine functions) and results.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        api_key: Optional[str] = None,
+        api_secret: Optional[str] = None,
+        *,
+        output: Optional["_Output"] = None,
+        session: Optional["ClientSession"] = None,
+        pool_size: int = 10,
+        keep_alive: bool = True,
+        rate_limiter: Union[RateLimiter, bool] = False,
+        cache: Union[ResponseCache, bool] = False,
+        coalescer: Union[RequestCoalescer, bool] = False,
+        retry_policy: Union[RetryPolicy, bool] = False,
+        circuit_breaker: Union[CircuitBreaker, bool] = False,
+        instrumentation: Union[Instrumentation, bool] = False,
+    ):
+        self.session = AsyncSession(
+            pool_size=pool_size, keep_alive=keep_alive, session=session
+        )
+
+        self.__pool_size = pool_size
+
+        self.rate_limiter = _get_rate_limiter(rate_limiter)
+
+        self.cache = _get_cache(cache)
+
+        self.coalescer = _get_coalescer(coalescer)
+
+        self.retry_policy = _get_retry_policy(retry_policy)
+
+        self.circuit_breaker = _get_circuit_breaker(circuit_breaker)
+
+        self.instrumentation = get_instrumentation(instrumentation)
+
+        middleware = AsyncMiddleware(
+            host,
+            api_key,
+            api_secret,
+            session=self.session,
+            rate_limiter=self.rate_limiter,
+            retry_policy=self.retry_policy,
+            circuit_breaker=self.circuit_breaker,
+            instrumentation=self.instrumentation,
+        )
+
+        self.auth = AsyncInterface(RestAuthEndpoints, middleware, output=output)
+
+        self.merchant = AsyncInterface(RestMerchantEndpoints, middleware, output=output)
+
+        self.public = AsyncInterface(
+            RestPublicEndpoints,
+            AsyncMiddleware(
+                host,
+                session=self.session,
+                rate_limiter=self.rate_limiter,
+                cache=self.cache,
+                coalescer=self.coalescer,
+                retry_policy=self.retry_policy,
+                circuit_breaker=self.circuit_breaker,
+                instrumentation=self.instrumentation,
+            ),
+            output=output,
+        )
+
+    async def fan_out(
+        self,
+        calls: Iterable[Call],
+        *,
+        concurrency: Optional[int] = None,
+        return_exceptions: bool = False,
+    ) -> List[Any]:
+        """
+        Await <calls>, e.g. (rest.public.get_candles_hist, ("tBTCUSD", "1h")), at
+        most <concurrency> (by default, one per pooled connection) at a time,
+        and return their results in order. Their requests go through the rate
+        limiter as usual.
+        """
+
+        return await fan_out_async(
+            calls,
+            concurrency=concurrency or self.__pool_size,
+            return_exceptions=return_exceptions,
+        )
+
+    def fan_out_as_completed(
+        self,
+        calls: Iterable[Call],
+        *,
+        concurrency: Optional[int] = None,
+        return_exceptions: bool = False,
+    ) -> AsyncIterator[Tuple[int, Any]]:
+        """
+        Same as fan_out, but yield (index, result) as the calls complete, to be
+        iterated with async for.
+        """
+
+        return fan_out_async_as_completed(
+            calls,
+            concurrency=concurrency or self.__pool_size,
+            return_exceptions=return_exceptions,
+        )
+
+    async def close(self) -> None:
+        """
+        Close the pooled connections shared by every interface, unless the
+        session was given by the caller, and save the cache to its file.
+        """
+
+        if self.cache is not None:
+            self.cache.save()
+
+        await self.session.close()
+
+    async def __aenter__(self) -> "AsyncBfxRestInterface":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        await self.close()
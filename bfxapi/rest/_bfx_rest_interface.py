@@ -1,20 +1,213 @@
-from typing import Optional
+from types import TracebackType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
+
+from requests import Session
 
+from bfxapi._utils.instrumentation import Instrumentation, get_instrumentation
+from bfxapi.rest._interface.fan_out import Call, fan_out, fan_out_as_completed
+from bfxapi.rest._interface.middleware import create_session
+from bfxapi.rest._interface.rate_limiter import RateLimiter
+from bfxapi.rest._interface.request_coalescer import RequestCoalescer
+from bfxapi.rest._interface.response_cache import ResponseCache
+from bfxapi.rest._interface.retry_policy import CircuitBreaker, RetryPolicy
 from bfxapi.rest._interfaces import (
     RestAuthEndpoints,
     RestMerchantEndpoints,
     RestPublicEndpoints,
 )
 
+if TYPE_CHECKING:
+    from urllib3.util.retry import Retry
+
+    from bfxapi.types.labeler import _Output
+
+
+def _get_rate_limiter(rate_limiter: Union[RateLimiter, bool]) -> Optional[RateLimiter]:
+    if isinstance(rate_limiter, RateLimiter):
+        return rate_limiter
+
+    return RateLimiter() if rate_limiter else None
+
+
+def _get_cache(cache: Union[ResponseCache, bool]) -> Optional[ResponseCache]:
+    if isinstance(cache, ResponseCache):
+        return cache
+
+    return ResponseCache() if cache else None
+
+
+def _get_coalescer(
+    coalescer: Union[RequestCoalescer, bool],
+) -> Optional[RequestCoalescer]:
+    if isinstance(coalescer, RequestCoalescer):
+        return coalescer
+
+    return RequestCoalescer() if coalescer else None
+
+
+def _get_retry_policy(
+    retry_policy: Union[RetryPolicy, bool],
+) -> Optional[RetryPolicy]:
+    if isinstance(retry_policy, RetryPolicy):
+        return retry_policy
+
+    return RetryPolicy() if retry_policy else None
+
+
+def _get_circuit_breaker(
+    circuit_breaker: Union[CircuitBreaker, bool],
+) -> Optional[CircuitBreaker]:
+    if isinstance(circuit_breaker, CircuitBreaker):
+        return circuit_breaker
+
+    return CircuitBreaker() if circuit_breaker else None
+
 
 class BfxRestInterface:
     def __init__(
-        self, host: str, api_key: Optional[str] = None, api_secret: Optional[str] = None
+        self,
+        host: str,
+        api_key: Optional[str] = None,
+        api_secret: Optional[str] = None,
+        *,
+        output: Optional["_Output"] = None,
+        session: Optional[Session] = None,
+        pool_size: int = 10,
+        max_retries: Union[int, "Retry"] = 0,
+        keep_alive: bool = True,
+        rate_limiter: Union[RateLimiter, bool] = False,
+        cache: Union[ResponseCache, bool] = False,
+        coalescer: Union[RequestCoalescer, bool] = False,
+        retry_policy: Union[RetryPolicy, bool] = False,
+        circuit_breaker: Union[CircuitBreaker, bool] = False,
+        instrumentation: Union[Instrumentation, bool] = False,
+        streaming: bool = False,
     ):
-        self.auth = RestAuthEndpoints(host=host, api_key=api_key, api_secret=api_secret)
+        self.__owns_session = session is None
+
+        self.__pool_size = pool_size
+
+        self.rate_limiter = _get_rate_limiter(rate_limiter)
+
+        self.cache = _get_cache(cache)
+
+        self.coalescer = _get_coalescer(coalescer)
+
+        self.retry_policy = _get_retry_policy(retry_policy)
+
+        self.circuit_breaker = _get_circuit_breaker(circuit_breaker)
+
+        self.instrumentation = get_instrumentation(instrumentation)
+
+        self.session = session or create_session(
+            pool_size=pool_size, max_retries=max_retries, keep_alive=keep_alive
+        )
+
+        self.auth = RestAuthEndpoints(
+            host=host,
+            api_key=api_key,
+            api_secret=api_secret,
+            output=output,
+            session=self.session,
+            rate_limiter=self.rate_limiter,
+            retry_policy=self.retry_policy,
+            circuit_breaker=self.circuit_breaker,
+            instrumentation=self.instrumentation,
+            streaming=streaming,
+        )
 
         self.merchant = RestMerchantEndpoints(
-            host=host, api_key=api_key, api_secret=api_secret
+            host=host,
+            api_key=api_key,
+            api_secret=api_secret,
+            output=output,
+            session=self.session,
+            rate_limiter=self.rate_limiter,
+            retry_policy=self.retry_policy,
+            circuit_breaker=self.circuit_breaker,
+            instrumentation=self.instrumentation,
+            streaming=streaming,
+        )
+
+        self.public = RestPublicEndpoints(
+            host=host,
+            output=output,
+            session=self.session,
+            rate_limiter=self.rate_limiter,
+            cache=self.cache,
+            coalescer=self.coalescer,
+            retry_policy=self.retry_policy,
+            circuit_breaker=self.circuit_breaker,
+            instrumentation=self.instrumentation,
+            streaming=streaming,
         )
 
-        self.public = RestPublicEndpoints(host=host)
+    def fan_out(
+        self,
+        calls: Iterable[Call],
+        *,
+        max_workers: Optional[int] = None,
+        return_exceptions: bool = False,
+    ) -> List[Any]:
+        """
+        Run <calls>, e.g. (rest.public.get_candles_hist, ("tBTCUSD", "1h")), on
+        up to <max_workers> threads (by default, one per pooled connection) and
+        return their results in order. Their requests go through the rate
+        limiter as usual.
+        """
+
+        return fan_out(
+            calls,
+            max_workers=max_workers or self.__pool_size,
+            return_exceptions=return_exceptions,
+        )
+
+    def fan_out_as_completed(
+        self,
+        calls: Iterable[Call],
+        *,
+        max_workers: Optional[int] = None,
+        return_exceptions: bool = False,
+    ) -> Iterator[Tuple[int, Any]]:
+        """
+        Same as fan_out, but yield (index, result) as the calls complete.
+        """
+
+        return fan_out_as_completed(
+            calls,
+            max_workers=max_workers or self.__pool_size,
+            return_exceptions=return_exceptions,
+        )
+
+    def close(self) -> None:
+        """
+        Close the pooled connections shared by every interface, unless the
+        session was given by the caller, and save the cache to its file.
+        """
+
+        if self.cache is not None:
+            self.cache.save()
+
+        if self.__owns_session:
+            self.session.close()
+
+    def __enter__(self) -> "BfxRestInterface":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
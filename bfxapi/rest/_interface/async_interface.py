@@ -0,0 +1,168 @@
+from functools import partial, wraps
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Type, cast
+
+from .async_middleware import AsyncMiddleware
+from .interface import Interface
+from .middleware import Middleware
+
+if TYPE_CHECKING:
+    from bfxapi.types.labeler import _Output
+
+
+class _Request(Exception):
+    def __init__(self, method: str, endpoint: str, kwargs: Dict[str, Any]) -> None:
+        super().__init__(method, endpoint)
+
+        self.method, self.endpoint, self.kwargs = method, endpoint, kwargs
+
+
+class _Replay:
+    """
+    Stand-in for the middleware of an endpoint method: it returns the responses
+    already received, in order, and raises _Request for the next request.
+    """
+
+    def __init__(self, responses: List[Any]) -> None:
+        self.__responses = iter(responses)
+
+        # The request raised, if any: it must reach AsyncInterface
+        self.request: Optional[_Request] = None
+
+    def get(
+        self, endpoint: str, params: Optional[Any] = None, *, stream: bool = False
+    ) -> Any:
+        return self.__next("get", endpoint, params=params)
+
+    def post(
+        self,
+        endpoint: str,
+        body: Optional[Any] = None,
+        params: Optional[Any] = None,
+        *,
+        stream: bool = False,
+    ) -> Any:
+        return self.__next("post", endpoint, body=body, params=params)
+
+    def __next(self, method: str, endpoint: str, **kwargs: Any) -> Any:
+        try:
+            return next(self.__responses)
+        except StopIteration:
+            self.request = _Request(method, endpoint, kwargs)
+
+            raise self.request from None
+
+
+class AsyncInterface:
+    """
+    Asynchronous counterpart of an Interface: each endpoint method of <interface>
+    is available as a coroutine function with the same signature and result.
+
+    The (synchronous) endpoint method runs until it sends a request, which is
+    then sent without blocking the event loop; once the response arrives, the
+    method is run again, from the start, with the responses received so far.
+
+    Paginated methods (e.g. iter_candles_hist) return the same Paginator, to be
+    iterated with async for.
+    """
+
+    def __init__(
+        self,
+        interface: Type[Interface],
+        middleware: AsyncMiddleware,
+        *,
+        output: Optional["_Output"] = None,
+    ) -> None:
+        self.__interface, self.__middleware = interface, middleware
+
+        self.__output = output
+
+    def __getattr__(self, name: str) -> Callable[..., Any]:
+        function = getattr(self.__interface, name)
+
+        if name.startswith("_") or not callable(function):
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'"
+            )
+
+        if getattr(function, "__paginated__", False):
+            # Its requests go through the coroutine functions of this object
+            paginator = partial(function, self)
+
+            setattr(self, name, paginator)
+
+            return paginator
+
+        @wraps(function)
+        async def method(*args: Any, **kwargs: Any) -> Any:
+            return await self.__call(function, *args, **kwargs)
+
+        setattr(self, name, method)
+
+        return method
+
+    def __dir__(self) -> List[str]:
+        return [
+            *super().__dir__(),
+            *(name for name in dir(self.__interface) if not name.startswith("_")),
+        ]
+
+    async def __call(
+        self, function: Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> Any:
+        if (instrumentation := self.__middleware._instrumentation) is not None:
+            with instrumentation.call(function.__name__):
+                return await self.__replay(function, *args, **kwargs)
+
+        return await self.__replay(function, *args, **kwargs)
+
+    async def __replay(
+        self, function: Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> Any:
+        responses: List[Any] = []
+
+        while True:
+            replay = _Replay(responses)
+
+            # The host is that of the middleware; the requests are reported by
+            # this call, not by each replay (no instrumentation)
+            interface = self.__interface(
+                "", middleware=cast(Middleware, replay), output=self.__output
+            )
+
+            try:
+                result = function(interface, *args, **kwargs)
+            except _Request as request:
+                if request is not replay.request:
+                    raise
+
+                if request.method == "get":
+                    response = self.__middleware.get(request.endpoint, **request.kwargs)
+                else:
+                    response = self.__middleware.post(
+                        request.endpoint, **request.kwargs
+                    )
+
+                responses.append(await response)
+
+                continue
+            except Exception as error:
+                AsyncInterface.__check(function, replay, error)
+
+                raise
+
+            AsyncInterface.__check(function, replay)
+
+            return result
+
+    @staticmethod
+    def __check(
+        function: Callable[..., Any],
+        replay: _Replay,
+        error: Optional[Exception] = None,
+    ) -> None:
+        # An endpoint method which catches its requests can't be replayed
+        if (request := replay.request) is not None:
+            raise RuntimeError(
+                f"<{function.__name__}> caught its request to <{request.endpoint}>: "
+                "endpoint methods must let _Request through."
+            ) from error
@@ -0,0 +1,253 @@
+import asyncio
+import json
+import time
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Optional
+
+from bfxapi._utils.instrumentation import Instrumentation, RequestMetrics
+from bfxapi._utils.json_decoder import JSONDecoder
+
+from .instrumentation import bind, create_trace_config
+from .middleware import _Middleware
+from .rate_limiter import RateLimiter
+from .request_coalescer import RequestCoalescer
+from .response_cache import ResponseCache
+from .retry_policy import CircuitBreaker, RetryPolicy
+
+if TYPE_CHECKING:
+    from aiohttp import ClientResponse, ClientSession, ClientTimeout
+
+
+class AsyncSession:
+    """
+    Lazily created aiohttp.ClientSession (it must be created within a running
+    event loop) whose connections are kept alive and reused, up to <pool_size>.
+    """
+
+    def __init__(
+        self,
+        *,
+        pool_size: int = 10,
+        keep_alive: bool = True,
+        session: Optional["ClientSession"] = None,
+    ) -> None:
+        self.__pool_size, self.__keep_alive = pool_size, keep_alive
+
+        self.__session, self.__owns_session = session, session is None
+
+    def get(self) -> "ClientSession":
+        if self.__session is None:
+            try:
+                import aiohttp
+            except ImportError as error:
+                raise ImportError(
+                    "AsyncBfxRestInterface requires aiohttp, which can be installed "
+                    "with: pip install bitfinex-api-py-postonly[async]."
+                ) from error
+
+            connector = aiohttp.TCPConnector(
+                limit=self.__pool_size,
+                limit_per_host=self.__pool_size,
+                force_close=not self.__keep_alive,
+            )
+
+            self.__session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=_Middleware._TIMEOUT),
+                trace_configs=[create_trace_config()],
+            )
+
+        return self.__session
+
+    async def close(self) -> None:
+        """
+        Close the pooled connections, unless the session was given by the caller.
+        """
+
+        if self.__owns_session and self.__session is not None:
+            await self.__session.close()
+
+            self.__session = None
+
+
+class AsyncMiddleware(_Middleware):
+    def __init__(
+        self,
+        host: str,
+        api_key: Optional[str] = None,
+        api_secret: Optional[str] = None,
+        *,
+        session: AsyncSession,
+        rate_limiter: Optional[RateLimiter] = None,
+        cache: Optional[ResponseCache] = None,
+        coalescer: Optional[RequestCoalescer] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        instrumentation: Optional[Instrumentation] = None,
+    ):
+        super().__init__(
+            host,
+            api_key,
+            api_secret,
+            rate_limiter=rate_limiter,
+            cache=cache,
+            coalescer=coalescer,
+            retry_policy=retry_policy,
+            circuit_breaker=circuit_breaker,
+            instrumentation=instrumentation,
+        )
+
+        self.__session = session
+
+    async def get(
+        self, endpoint: str, params: Optional[Any] = None, *, stream: bool = False
+    ) -> Any:
+        # Responses are always decoded at once (<stream> is ignored): the
+        # endpoint method can only run once the whole response is available
+        if self._coalescer is not None and self._coalescer.batches(endpoint, params):
+            return await self._coalescer.get_async(endpoint, self.__get)
+
+        if self._cache is not None:
+            return await self._cache.get_async(
+                endpoint, lambda: self.__get(endpoint, params), params=params
+            )
+
+        return await self.__get(endpoint, params)
+
+    async def post(
+        self,
+        endpoint: str,
+        body: Optional[Any] = None,
+        params: Optional[Any] = None,
+        *,
+        stream: bool = False,
+    ) -> Any:
+        if self._cache is not None:
+            return await self._cache.get_async(
+                endpoint,
+                lambda: self.__post(endpoint, body, params),
+                params=params,
+                body=body,
+            )
+
+        return await self.__post(endpoint, body, params)
+
+    async def __get(self, endpoint: str, params: Optional[Any] = None) -> Any:
+        def send() -> Awaitable["ClientResponse"]:
+            url, headers = self._prepare_get(endpoint)
+
+            return self.__session.get().get(
+                url,
+                params=AsyncMiddleware.__params(params),
+                headers=headers,
+                timeout=self.__get_timeout(),
+            )
+
+        return await self.__request("get", endpoint, send)
+
+    async def __post(
+        self,
+        endpoint: str,
+        body: Optional[Any] = None,
+        params: Optional[Any] = None,
+    ) -> Any:
+        def send() -> Awaitable["ClientResponse"]:
+            # Signed on each attempt, so that retries get a fresh nonce
+            url, headers, data = self._prepare_post(endpoint, body)
+
+            return self.__session.get().post(
+                url,
+                data=data,
+                params=AsyncMiddleware.__params(params),
+                headers=headers,
+                timeout=self.__get_timeout(),
+            )
+
+        return await self.__request("post", endpoint, send)
+
+    async def __request(
+        self,
+        method: str,
+        endpoint: str,
+        send: Callable[[], Awaitable["ClientResponse"]],
+    ) -> Any:
+        metrics = RequestMetrics(method, endpoint)
+
+        try:
+            text = await self.__send(method, endpoint, send, metrics)
+
+            started = time.perf_counter()
+
+            data = json.loads(text, cls=JSONDecoder)
+
+            metrics.decode = time.perf_counter() - started
+
+            data = self._check(endpoint, data)
+        except Exception as error:
+            self._finish(metrics, error)
+
+            raise
+
+        self._finish(metrics)
+
+        return data
+
+    async def __send(
+        self,
+        method: str,
+        endpoint: str,
+        send: Callable[[], Awaitable["ClientResponse"]],
+        metrics: RequestMetrics,
+    ) -> str:
+        import aiohttp
+
+        attempt = 0
+
+        while True:
+            self._attempt()
+
+            if self._rate_limiter is not None:
+                started = time.perf_counter()
+
+                await self._rate_limiter.wait_async(endpoint)
+
+                metrics.wait += time.perf_counter() - started
+
+            started = time.perf_counter()
+
+            try:
+                with bind(metrics):
+                    async with await send() as response:
+                        metrics.first_byte = time.perf_counter() - started
+
+                        # The body is read once: text() decodes the same bytes
+                        size, text = len(await response.read()), await response.text()
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                if (delay := self._complete(method, attempt, None)) is None:
+                    raise
+            else:
+                metrics.status, metrics.response_bytes = response.status, size
+
+                if (delay := self._complete(method, attempt, response.status)) is None:
+                    return text
+
+            await asyncio.sleep(delay)
+
+            attempt += 1
+
+    def __get_timeout(self) -> "ClientTimeout":
+        import aiohttp
+
+        if isinstance(self._timeout, tuple):
+            connect, read = self._timeout
+
+            return aiohttp.ClientTimeout(sock_connect=connect, sock_read=read)
+
+        return aiohttp.ClientTimeout(total=self._timeout)
+
+    @staticmethod
+    def __params(params: Optional[Any]) -> Optional[Any]:
+        # Unlike requests, aiohttp doesn't skip parameters whose value is None
+        if isinstance(params, dict):
+            return {key: value for key, value in params.items() if value is not None}
+
+        return params
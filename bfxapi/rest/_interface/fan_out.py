@@ -0,0 +1,135 @@
+import asyncio
+import contextvars
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from functools import partial
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+# (method, args) or (method, args, kwargs)
+Call = Union[
+    Tuple[Callable[..., Any], Sequence[Any]],
+    Tuple[Callable[..., Any], Sequence[Any], Mapping[str, Any]],
+]
+
+
+def _bind(call: Call) -> Callable[[], Any]:
+    function, args, kwargs = call[0], call[1], call[2] if len(call) > 2 else {}
+
+    return partial(function, *args, **kwargs)
+
+
+def fan_out(
+    calls: Iterable[Call], *, max_workers: int = 10, return_exceptions: bool = False
+) -> List[Any]:
+    """
+    Run <calls> on up to <max_workers> threads and return their results, in
+    the order of <calls> (see fan_out_as_completed).
+    """
+
+    calls = list(calls)
+
+    results: List[Any] = [None] * len(calls)
+
+    for index, result in fan_out_as_completed(
+        calls, max_workers=max_workers, return_exceptions=return_exceptions
+    ):
+        results[index] = result
+
+    return results
+
+
+def fan_out_as_completed(
+    calls: Iterable[Call], *, max_workers: int = 10, return_exceptions: bool = False
+) -> Iterator[Tuple[int, Any]]:
+    """
+    Run <calls>, e.g. (rest.public.get_candles_hist, ("tBTCUSD", "1h")), on up
+    to <max_workers> threads and yield (index, result) as they complete.
+
+    The first exception raised by a call is raised, and the calls which didn't
+    start yet are cancelled; with <return_exceptions>, it's yielded instead.
+    """
+
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+
+    futures: Dict["Future[Any]", int] = {}
+
+    try:
+        for index, call in enumerate(calls):
+            # Each call runs with the context (e.g. the output) of the caller
+            context = contextvars.copy_context()
+
+            futures[executor.submit(context.run, _bind(call))] = index
+
+        for future in as_completed(futures):
+            if (error := future.exception()) is None:
+                yield futures[future], future.result()
+            elif return_exceptions:
+                yield futures[future], error
+            else:
+                raise error
+    finally:
+        for future in futures:
+            future.cancel()
+
+        executor.shutdown()
+
+
+async def fan_out_async(
+    calls: Iterable[Call], *, concurrency: int = 10, return_exceptions: bool = False
+) -> List[Any]:
+    """
+    Await <calls> (of coroutine functions), at most <concurrency> at a time, and
+    return their results in the order of <calls>.
+    """
+
+    calls = list(calls)
+
+    results: List[Any] = [None] * len(calls)
+
+    async for index, result in fan_out_async_as_completed(
+        calls, concurrency=concurrency, return_exceptions=return_exceptions
+    ):
+        results[index] = result
+
+    return results
+
+
+async def fan_out_async_as_completed(
+    calls: Iterable[Call], *, concurrency: int = 10, return_exceptions: bool = False
+) -> AsyncIterator[Tuple[int, Any]]:
+    """
+    Asynchronous counterpart of fan_out_as_completed: the calls still pending
+    are cancelled once the iteration is over.
+    """
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(index: int, call: Call) -> Tuple[int, Any]:
+        async with semaphore:
+            try:
+                return index, await _bind(call)()
+            except Exception as error:
+                if not return_exceptions:
+                    raise
+
+                return index, error
+
+    tasks = [asyncio.ensure_future(run(*item)) for item in enumerate(calls)]
+
+    try:
+        for task in asyncio.as_completed(tasks):
+            yield await task
+    finally:
+        for task in tasks:
+            task.cancel()
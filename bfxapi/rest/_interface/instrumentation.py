@@ -0,0 +1,117 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, Iterator, Optional
+
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from bfxapi._utils.instrumentation import RequestMetrics
+
+if TYPE_CHECKING:
+    from aiohttp import TraceConfig
+
+# Metrics of the request being sent, filled in by the connections
+_CURRENT: ContextVar[Optional[RequestMetrics]] = ContextVar("_CURRENT", default=None)
+
+
+@contextmanager
+def bind(metrics: RequestMetrics) -> Iterator[None]:
+    """
+    Make <metrics> those of the attempt sent within, for its connection.
+    """
+
+    metrics.attempts += 1
+
+    metrics.dns = metrics.connect = metrics.tls = None
+
+    token = _CURRENT.set(metrics)
+
+    try:
+        yield
+    finally:
+        _CURRENT.reset(token)
+
+
+def get_current() -> Optional[RequestMetrics]:
+    return _CURRENT.get()
+
+
+class _HTTPConnection(HTTPConnection):
+    def _new_conn(self) -> Any:
+        # The address is resolved here too: it counts in connect
+        started = time.perf_counter()
+
+        sock = super()._new_conn()
+
+        if (metrics := _CURRENT.get()) is not None:
+            metrics.connect = time.perf_counter() - started
+
+        return sock
+
+
+class _HTTPSConnection(HTTPSConnection):
+    def _new_conn(self) -> Any:
+        started = time.perf_counter()
+
+        sock = super()._new_conn()
+
+        if (metrics := _CURRENT.get()) is not None:
+            metrics.connect = time.perf_counter() - started
+
+        return sock
+
+    def connect(self) -> None:
+        started = time.perf_counter()
+
+        super().connect()
+
+        if (metrics := _CURRENT.get()) is not None:
+            metrics.tls = time.perf_counter() - started - (metrics.connect or 0.0)
+
+
+class _HTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _HTTPConnection
+
+
+class _HTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _HTTPSConnection
+
+
+# Pools whose connections time how long they took to open
+POOL_CLASSES = {"http": _HTTPConnectionPool, "https": _HTTPSConnectionPool}
+
+
+def create_trace_config() -> "TraceConfig":
+    """
+    aiohttp tracing which times the DNS resolutions and the connections opened
+    (including the TLS handshake, which aiohttp doesn't trace on its own).
+    """
+
+    import aiohttp
+
+    async def on_dns_start(_: Any, context: SimpleNamespace, __: Any) -> None:
+        context.dns = time.perf_counter()
+
+    async def on_dns_end(_: Any, context: SimpleNamespace, __: Any) -> None:
+        if (metrics := _CURRENT.get()) is not None:
+            metrics.dns = time.perf_counter() - context.dns
+
+    async def on_connect_start(_: Any, context: SimpleNamespace, __: Any) -> None:
+        context.connect = time.perf_counter()
+
+    async def on_connect_end(_: Any, context: SimpleNamespace, __: Any) -> None:
+        if (metrics := _CURRENT.get()) is not None:
+            elapsed = time.perf_counter() - context.connect
+
+            metrics.connect = elapsed - (metrics.dns or 0.0)
+
+    trace_config = aiohttp.TraceConfig()
+
+    trace_config.on_dns_resolvehost_start.append(on_dns_start)
+    trace_config.on_dns_resolvehost_end.append(on_dns_end)
+    trace_config.on_connection_create_start.append(on_connect_start)
+    trace_config.on_connection_create_end.append(on_connect_end)
+
+    return trace_config
@@ -1,10 +1,90 @@
-from typing import Optional
+from functools import wraps
+from typing import TYPE_CHECKING, Any, Callable, Optional, TypeVar, cast
+
+from bfxapi._utils.instrumentation import Instrumentation
+from bfxapi.types import use_output
 
 from .middleware import Middleware
+from .rate_limiter import RateLimiter
+from .request_coalescer import RequestCoalescer
+from .response_cache import ResponseCache
+from .retry_policy import CircuitBreaker, RetryPolicy
+
+if TYPE_CHECKING:
+    from requests import Session
+
+    from bfxapi.types.labeler import _Output
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+
+def _use_output(function: _F) -> _F:
+    @wraps(function)
+    def wrapper(self: "Interface", *args: Any, **kwargs: Any) -> Any:
+        if self._output:
+            with use_output(self._output):
+                return function(self, *args, **kwargs)
+
+        return function(self, *args, **kwargs)
+
+    return cast(_F, wrapper)
+
+
+def _instrument(function: _F) -> _F:
+    @wraps(function)
+    def wrapper(self: "Interface", *args: Any, **kwargs: Any) -> Any:
+        if self._instrumentation is not None:
+            with self._instrumentation.call(function.__name__):
+                return function(self, *args, **kwargs)
+
+        return function(self, *args, **kwargs)
+
+    return cast(_F, wrapper)
 
 
 class Interface:
     def __init__(
-        self, host: str, api_key: Optional[str] = None, api_secret: Optional[str] = None
+        self,
+        host: str,
+        api_key: Optional[str] = None,
+        api_secret: Optional[str] = None,
+        *,
+        output: Optional["_Output"] = None,
+        session: Optional["Session"] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        cache: Optional[ResponseCache] = None,
+        coalescer: Optional[RequestCoalescer] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        instrumentation: Optional[Instrumentation] = None,
+        streaming: bool = False,
+        middleware: Optional[Middleware] = None,
     ):
-        self._m = Middleware(host, api_key, api_secret)
+        # Requests go through <middleware>, if any, instead of a new one
+        self._m = middleware or Middleware(
+            host,
+            api_key,
+            api_secret,
+            session=session,
+            rate_limiter=rate_limiter,
+            cache=cache,
+            coalescer=coalescer,
+            retry_policy=retry_policy,
+            circuit_breaker=circuit_breaker,
+            instrumentation=instrumentation,
+            streaming=streaming,
+        )
+
+        self._output = output
+
+        self._instrumentation = instrumentation
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+
+        for name, function in list(vars(cls).items()):
+            if getattr(function, "__paginated__", False):
+                continue
+
+            if callable(function) and not name.startswith("_"):
+                setattr(cls, name, _use_output(_instrument(function)))
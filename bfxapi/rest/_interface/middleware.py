@@ -1,20 +1,42 @@
 import hashlib
 import hmac
 import json
-from datetime import datetime
+import time
 from enum import IntEnum
-from typing import TYPE_CHECKING, Any, List, NoReturn, Optional
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    NoReturn,
+    Optional,
+    Tuple,
+    Union,
+)
 
 import requests
+from requests.adapters import HTTPAdapter
 
+from bfxapi._utils.instrumentation import Instrumentation, RequestMetrics
 from bfxapi._utils.json_decoder import JSONDecoder
 from bfxapi._utils.json_encoder import JSONEncoder
+from bfxapi._utils.json_stream import iter_array
+from bfxapi._utils.nonce import get_nonce
 from bfxapi._utils.post_only_enforcement import enforce_post_only
 from bfxapi.exceptions import InvalidCredentialError
-from bfxapi.rest.exceptions import GenericError, RequestParameterError
+from bfxapi.rest.exceptions import GenericError, RateLimitError, RequestParameterError
+
+from .instrumentation import POOL_CLASSES, bind, get_current
+from .rate_limiter import RateLimiter
+from .request_coalescer import RequestCoalescer
+from .response_cache import ResponseCache
+from .retry_policy import _STATUSES, CircuitBreaker, RetryPolicy, _Timeout
 
 if TYPE_CHECKING:
     from requests.sessions import _Params
+    from urllib3.util.retry import Retry
 
 
 class _Error(IntEnum):
@@ -22,13 +44,71 @@ class _Error(IntEnum):
     ERR_GENERIC = 10001
     ERR_PARAMS = 10020
     ERR_AUTH_FAIL = 10100
+    ERR_RATE_LIMIT = 11010
+
+
+def create_session(
+    *,
+    pool_size: int = 10,
+    max_retries: Union[int, "Retry"] = 0,
+    keep_alive: bool = True,
+) -> requests.Session:
+    """
+    Create a session whose connections are kept alive and reused, up to
+    <pool_size> per host, instead of paying for a TCP and TLS handshake on
+    every request.
+
+    <max_retries> is handed to the HTTP adapter: an integer only retries
+    failed connections, a urllib3 Retry gives full control (note that POST
+    requests are not retried by default, as they are not idempotent).
+    """
+
+    session = requests.Session()
+
+    adapter = HTTPAdapter(
+        pool_connections=pool_size, pool_maxsize=pool_size, max_retries=max_retries
+    )
+
+    # Its connections time how long they take to open, for the instrumentation
+    adapter.poolmanager.pool_classes_by_scheme = POOL_CLASSES
+
+    session.mount("https://", adapter)
 
+    session.mount("http://", adapter)
 
-class Middleware:
-    __TIMEOUT = 30
+    if not keep_alive:
+        session.headers["Connection"] = "close"
+
+    return session
+
+
+# Bytes read at once from the responses which are streamed
+_CHUNK_SIZE = 1 << 16
+
+_END = object()
+
+
+class _Middleware:
+    """
+    Transport-independent part of the middlewares: URLs, headers (with the
+    authentication signature), POST_ONLY enforcement, rate limits, caching,
+    coalescing, retries, instrumentation and error handling.
+    """
+
+    _TIMEOUT = 30
 
     def __init__(
-        self, host: str, api_key: Optional[str] = None, api_secret: Optional[str] = None
+        self,
+        host: str,
+        api_key: Optional[str] = None,
+        api_secret: Optional[str] = None,
+        *,
+        rate_limiter: Optional[RateLimiter] = None,
+        cache: Optional[ResponseCache] = None,
+        coalescer: Optional[RequestCoalescer] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        instrumentation: Optional[Instrumentation] = None,
     ):
         self.__host = host
 
@@ -36,32 +116,34 @@ class Middleware:
 
         self.__api_secret = api_secret
 
-    def get(self, endpoint: str, params: Optional["_Params"] = None) -> Any:
-        headers = {"Accept": "application/json"}
+        self._rate_limiter = rate_limiter
 
-        if self.__api_key and self.__api_secret:
-            headers = {**headers, **self.__get_authentication_headers(endpoint)}
+        self._cache = cache
 
-        request = requests.get(
-            url=f"{self.__host}/{endpoint}",
-            params=params,
-            headers=headers,
-            timeout=Middleware.__TIMEOUT,
-        )
+        self._coalescer = coalescer
 
-        data = request.json(cls=JSONDecoder)
+        self._retry_policy = retry_policy
 
-        if isinstance(data, list) and len(data) > 0 and data[0] == "error":
-            self.__handle_error(data)
+        self._circuit_breaker = circuit_breaker
 
-        return data
+        self._instrumentation = instrumentation
 
-    def post(
-        self,
-        endpoint: str,
-        body: Optional[Any] = None,
-        params: Optional["_Params"] = None,
-    ) -> Any:
+        self._timeout: _Timeout = _Middleware._TIMEOUT
+
+        if retry_policy is not None:
+            self._timeout = retry_policy.timeout
+
+    def _prepare_get(self, endpoint: str) -> Tuple[str, Dict[str, str]]:
+        headers = {"Accept": "application/json"}
+
+        if self.__api_key and self.__api_secret:
+            headers = {**headers, **self.__get_authentication_headers(endpoint)}
+
+        return f"{self.__host}/{endpoint}", headers
+
+    def _prepare_post(
+        self, endpoint: str, body: Optional[Any] = None
+    ) -> Tuple[str, Dict[str, str], Optional[str]]:
         # FORCE POST_ONLY for order endpoints (catch-all protection)
         # MAINTENANCE NOTE: If Bitfinex adds new order endpoints with different
         # naming patterns (not containing "order/submit" or "order/update"),
@@ -78,6 +160,9 @@ class Middleware:
 
         _body = body and json.dumps(body, cls=JSONEncoder) or None
 
+        if (metrics := get_current()) is not None:
+            metrics.request_bytes = len(_body or "")
+
         headers = {"Accept": "application/json", "Content-Type": "application/json"}
 
         if self.__api_key and self.__api_secret:
@@ -86,22 +171,54 @@ class Middleware:
                 **self.__get_authentication_headers(endpoint, _body),
             }
 
-        request = requests.post(
-            url=f"{self.__host}/{endpoint}",
-            data=_body,
-            params=params,
-            headers=headers,
-            timeout=Middleware.__TIMEOUT,
-        )
+        return f"{self.__host}/{endpoint}", headers, _body
+
+    def _finish(
+        self, metrics: RequestMetrics, error: Optional[BaseException] = None
+    ) -> None:
+        if self._instrumentation is not None:
+            self._instrumentation.finish(metrics, error)
+
+    def _attempt(self) -> None:
+        if self._circuit_breaker is not None:
+            self._circuit_breaker.check(self.__host)
 
-        data = request.json(cls=JSONDecoder)
+    def _complete(
+        self, method: str, attempt: int, status: Optional[int]
+    ) -> Optional[float]:
+        """
+        Record the outcome of an attempt (<status> is None if no response came)
+        and return the delay before retrying it, or None if it's not retried.
+        """
 
+        policy = self._retry_policy
+
+        failed = status is None or status in (policy.statuses if policy else _STATUSES)
+
+        if self._circuit_breaker is not None:
+            self._circuit_breaker.record(self.__host, not failed)
+
+        if not failed or policy is None or attempt >= policy.get_retries(method):
+            return None
+
+        return policy.get_delay(attempt)
+
+    def _check(self, endpoint: str, data: Any) -> Any:
         if isinstance(data, list) and len(data) > 0 and data[0] == "error":
-            self.__handle_error(data)
+            self.__handle_error(endpoint, data)
 
         return data
 
-    def __handle_error(self, error: List[Any]) -> NoReturn:
+    def __handle_error(self, endpoint: str, error: List[Any]) -> NoReturn:
+        if error[1] == _Error.ERR_RATE_LIMIT:
+            if self._rate_limiter is not None:
+                self._rate_limiter.penalize(endpoint)
+
+            raise RateLimitError(
+                f"The request to <{endpoint}> was rejected for exceeding the "
+                "rate limit of its endpoint family."
+            )
+
         if error[1] == _Error.ERR_PARAMS:
             raise RequestParameterError(
                 "The request was rejected with the following parameter "
@@ -126,7 +243,7 @@ class Middleware:
     def __get_authentication_headers(self, endpoint: str, data: Optional[str] = None):
         assert self.__api_key and self.__api_secret
 
-        nonce = str(round(datetime.now().timestamp() * 1_000_000))
+        nonce = str(get_nonce())
 
         if not data:
             message = f"/api/v2/{endpoint}{nonce}"
@@ -144,3 +261,238 @@ class Middleware:
             "bfx-signature": signature.hexdigest(),
             "bfx-apikey": self.__api_key,
         }
+
+
+class Middleware(_Middleware):
+    def __init__(
+        self,
+        host: str,
+        api_key: Optional[str] = None,
+        api_secret: Optional[str] = None,
+        *,
+        session: Optional[requests.Session] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        cache: Optional[ResponseCache] = None,
+        coalescer: Optional[RequestCoalescer] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        instrumentation: Optional[Instrumentation] = None,
+        streaming: bool = False,
+    ):
+        super().__init__(
+            host,
+            api_key,
+            api_secret,
+            rate_limiter=rate_limiter,
+            cache=cache,
+            coalescer=coalescer,
+            retry_policy=retry_policy,
+            circuit_breaker=circuit_breaker,
+            instrumentation=instrumentation,
+        )
+
+        self.__session = session or create_session()
+
+        self.__streaming = streaming
+
+        self.__owns_session = session is None
+
+    @property
+    def session(self) -> requests.Session:
+        return self.__session
+
+    def close(self) -> None:
+        """
+        Close the pooled connections, unless the session was given by the caller.
+        """
+
+        if self.__owns_session:
+            self.__session.close()
+
+    def get(
+        self, endpoint: str, params: Optional["_Params"] = None, *, stream: bool = False
+    ) -> Any:
+        """
+        With <stream> (and streaming enabled), return an iterator over the rows of
+        the response, decoded as they are downloaded, instead of a list.
+        """
+
+        if stream and self.__streaming:
+            return self.__get(endpoint, params, stream=True)
+
+        if self._coalescer is not None and self._coalescer.batches(endpoint, params):
+            return self._coalescer.get(endpoint, self.__get)
+
+        if self._cache is not None:
+            return self._cache.get(
+                endpoint, lambda: self.__get(endpoint, params), params=params
+            )
+
+        return self.__get(endpoint, params)
+
+    def post(
+        self,
+        endpoint: str,
+        body: Optional[Any] = None,
+        params: Optional["_Params"] = None,
+        *,
+        stream: bool = False,
+    ) -> Any:
+        if stream and self.__streaming:
+            return self.__post(endpoint, body, params, stream=True)
+
+        if self._cache is not None:
+            return self._cache.get(
+                endpoint,
+                lambda: self.__post(endpoint, body, params),
+                params=params,
+                body=body,
+            )
+
+        return self.__post(endpoint, body, params)
+
+    def __get(
+        self, endpoint: str, params: Optional["_Params"] = None, stream: bool = False
+    ) -> Any:
+        def send() -> requests.Response:
+            url, headers = self._prepare_get(endpoint)
+
+            return self.__session.get(
+                url=url,
+                params=params,
+                headers=headers,
+                timeout=self._timeout,
+                stream=stream,
+            )
+
+        return self.__request("get", endpoint, send, stream)
+
+    def __post(
+        self,
+        endpoint: str,
+        body: Optional[Any] = None,
+        params: Optional["_Params"] = None,
+        stream: bool = False,
+    ) -> Any:
+        def send() -> requests.Response:
+            # Signed on each attempt, so that retries get a fresh nonce
+            url, headers, data = self._prepare_post(endpoint, body)
+
+            return self.__session.post(
+                url=url,
+                data=data,
+                params=params,
+                headers=headers,
+                timeout=self._timeout,
+                stream=stream,
+            )
+
+        return self.__request("post", endpoint, send, stream)
+
+    def __request(
+        self,
+        method: str,
+        endpoint: str,
+        send: Callable[[], requests.Response],
+        stream: bool,
+    ) -> Any:
+        metrics = RequestMetrics(method, endpoint)
+
+        try:
+            response = self.__send(method, endpoint, send, metrics)
+
+            if stream:
+                # Its metrics are complete once the stream has been consumed
+                return self.__stream(endpoint, response, metrics)
+
+            started = time.perf_counter()
+
+            data = response.json(cls=JSONDecoder)
+
+            metrics.decode = time.perf_counter() - started
+
+            metrics.response_bytes = len(response.content)
+
+            data = self._check(endpoint, data)
+        except Exception as error:
+            self._finish(metrics, error)
+
+            raise
+
+        self._finish(metrics)
+
+        return data
+
+    def __send(
+        self,
+        method: str,
+        endpoint: str,
+        send: Callable[[], requests.Response],
+        metrics: RequestMetrics,
+    ) -> requests.Response:
+        attempt = 0
+
+        while True:
+            self._attempt()
+
+            if self._rate_limiter is not None:
+                started = time.perf_counter()
+
+                self._rate_limiter.wait(endpoint)
+
+                metrics.wait += time.perf_counter() - started
+
+            try:
+                with bind(metrics):
+                    response = send()
+            except (requests.ConnectionError, requests.Timeout):
+                if (delay := self._complete(method, attempt, None)) is None:
+                    raise
+            else:
+                metrics.status = response.status_code
+
+                metrics.first_byte = response.elapsed.total_seconds()
+
+                delay = self._complete(method, attempt, response.status_code)
+
+                if delay is None:
+                    return response
+
+                response.close()
+
+            time.sleep(delay)
+
+            attempt += 1
+
+    def __stream(
+        self, endpoint: str, response: requests.Response, metrics: RequestMetrics
+    ) -> Iterator[Any]:
+        error: Optional[Exception] = None
+
+        try:
+            with response:
+                chunks = _count(response.iter_content(_CHUNK_SIZE), metrics)
+
+                rows = iter_array(chunks, JSONDecoder())
+
+                if (first := next(rows, _END)) == "error":
+                    self._check(endpoint, [first, *rows])
+
+                if first is not _END:
+                    yield first
+
+                    yield from rows
+        except Exception as exception:
+            error = exception
+
+            raise
+        finally:
+            # Also once the stream is closed before the end of the response
+            self._finish(metrics, error)
+
+
+def _count(chunks: Iterator[bytes], metrics: RequestMetrics) -> Iterator[bytes]:
+    for chunk in chunks:
+        metrics.response_bytes += len(chunk)
+
+        yield chunk
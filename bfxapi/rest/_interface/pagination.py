@@ -0,0 +1,244 @@
+import asyncio
+import contextvars
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Generic,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    TypeVar,
+)
+
+from bfxapi.rest.exceptions import PaginationError
+from bfxapi.types.labeler import _Serializer
+
+T = TypeVar("T")
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+
+def paginated(function: _F) -> _F:
+    """
+    Mark an endpoint method which returns a Paginator: it is left out of the
+    output wrapper of Interface and AsyncInterface exposes it as is.
+    """
+
+    function.__paginated__ = True  # type: ignore[attr-defined]
+
+    return function
+
+
+class _Cursor:
+    """
+    Window of the next page: pages are requested newest first, each one ending
+    (inclusively) at the oldest timestamp of the previous page, and the records
+    already seen at that timestamp are dropped.
+
+    A full page of records already seen (at least <limit> records share its
+    timestamp) is requested again with twice the limit, once. Without a limit,
+    every page is full and the probe asks for twice the largest page received
+    (the default limit of the endpoint, as far as the cursor can tell).
+    """
+
+    def __init__(
+        self,
+        labels: List[str],
+        mts: str,
+        id: Optional[str],
+        start: Optional[str],
+        end: Optional[str],
+        limit: Optional[int],
+    ) -> None:
+        self.__labels, self.__mts, self.__key = labels, mts, id or mts
+
+        self.__start, self.__end, self.__limit = start, end, limit
+
+        self.__boundary: Optional[int] = None
+
+        # Size of the largest page received, for probes without a limit
+        self.__size = 0
+
+        self.__seen: Set[Any] = set()
+
+        self.__probe = False
+
+        self.done = False
+
+    def window(self) -> Dict[str, Any]:
+        return {"start": self.__start, "end": self.__end, "limit": self.__get_limit()}
+
+    def advance(self, page: Any) -> List[Any]:
+        if not isinstance(page, list):
+            raise ValueError(
+                "Paginators don't support the numpy and columns outputs: "
+                "use parse_many on the pages of the raw output instead."
+            )
+
+        if len(page) == 0:
+            self.done = True
+
+            return []
+
+        records = [
+            record
+            for record in page
+            if self.__get(record, self.__key) not in self.__seen
+        ]
+
+        boundary = min(self.__get(record, self.__mts) for record in page)
+
+        if (limit := self.__get_limit()) is None:
+            self.__size = max(self.__size, len(page))
+
+        full = limit is None or len(page) >= limit
+
+        if not full:
+            self.done = True
+        elif not records and not self.__probe:
+            self.__probe = True
+        elif not records:
+            # The records left at this timestamp can't be reached by any window
+            raise PaginationError(
+                f"At least {limit} records share the timestamp {boundary}: "
+                "paginate again with a greater limit to get all of them."
+            )
+        else:
+            self.__probe = False
+
+            if boundary != self.__boundary:
+                self.__seen = set()
+
+            self.__seen.update(
+                self.__get(record, self.__key)
+                for record in page
+                if self.__get(record, self.__mts) == boundary
+            )
+
+        self.__boundary, self.__end = boundary, str(boundary)
+
+        return records
+
+    def __get_limit(self) -> Optional[int]:
+        if self.__probe:
+            return (self.__size if self.__limit is None else self.__limit) * 2
+
+        return self.__limit
+
+    def __get(self, record: Any, label: str) -> Any:
+        if isinstance(record, list):
+            return record[self.__labels.index(label)]
+
+        return getattr(record, label)
+
+
+class Paginator(Generic[T]):
+    """
+    Records of a history endpoint, newest first, fetched page by page (of at
+    most <limit> records) until the beginning of the window (or of history).
+
+    Iterate over it (with for or async for) to get the records, or over
+    pages() / apages() to get the pages. With <prefetch>, the next page is
+    requested while the current one is being consumed.
+
+    PaginationError is raised when more than twice <limit> (by default, the
+    page size of the endpoint) records share a timestamp, as no window can
+    start in between.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[..., Any],
+        serializer: _Serializer,
+        *,
+        mts: str,
+        id: Optional[str] = None,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        limit: Optional[int] = None,
+        prefetch: bool = False,
+    ) -> None:
+        self.__fetch, self.__labels = fetch, serializer.get_labels()
+
+        self.__mts, self.__id = mts, id
+
+        self.__start, self.__end, self.__limit = start, end, limit
+
+        self.__prefetch = prefetch
+
+    def __iter__(self) -> Iterator[T]:
+        for page in self.pages():
+            yield from page
+
+    async def __aiter__(self) -> AsyncIterator[T]:
+        async for page in self.apages():
+            for record in page:
+                yield record
+
+    def pages(self) -> Iterator[List[T]]:
+        cursor = self.__cursor()
+
+        if not self.__prefetch:
+            while not cursor.done:
+                if records := cursor.advance(self.__fetch(**cursor.window())):
+                    yield records
+
+            return
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = self.__submit(executor, cursor.window())
+
+            while not cursor.done:
+                records = cursor.advance(future.result())
+
+                if not cursor.done:
+                    future = self.__submit(executor, cursor.window())
+
+                if records:
+                    yield records
+
+    async def apages(self) -> AsyncIterator[List[T]]:
+        cursor = self.__cursor()
+
+        future = asyncio.ensure_future(self.__fetch(**cursor.window()))
+
+        try:
+            while not cursor.done:
+                records = cursor.advance(await future)
+
+                if not cursor.done:
+                    future = self.__fetch(**cursor.window())
+
+                    if self.__prefetch:
+                        future = asyncio.ensure_future(future)
+
+                if records:
+                    yield records
+        finally:
+            if asyncio.isfuture(future):
+                future.cancel()
+            else:
+                future.close()
+
+    def __cursor(self) -> _Cursor:
+        return _Cursor(
+            self.__labels,
+            self.__mts,
+            self.__id,
+            self.__start,
+            self.__end,
+            self.__limit,
+        )
+
+    def __submit(
+        self, executor: ThreadPoolExecutor, window: Dict[str, Any]
+    ) -> "Future[Any]":
+        # Runs in the executor, with the context (e.g. the output) of the caller
+        context = contextvars.copy_context()
+
+        return executor.submit(context.run, partial(self.__fetch, **window))
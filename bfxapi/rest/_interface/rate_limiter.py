@@ -0,0 +1,179 @@
+import asyncio
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+from bfxapi._utils.instrumentation import get_family
+from bfxapi.rest.exceptions import RateLimitError
+
+# Requests per minute allowed by Bitfinex for each family of endpoints (the
+# first segment of public endpoints, the first three of authenticated ones)
+_LIMITS = {
+    "platform": 30,
+    "tickers": 30,
+    "ticker": 90,
+    "trades": 15,
+    "book": 90,
+    "stats1": 90,
+    "candles": 30,
+    "status": 90,
+    "liquidations": 3,
+    "rankings": 90,
+    "pulse": 30,
+    "calc": 90,
+    "conf": 90,
+}
+
+_PUBLIC_LIMIT, _AUTH_LIMIT = 30, 90
+
+# Bitfinex locks clients which exceed a rate limit out for a minute
+_LOCKOUT = 60.0
+
+
+class _Bucket:
+    __slots__ = ("capacity", "rate", "tokens", "updated", "waiting")
+
+    def __init__(self, limit: int) -> None:
+        # A quarter of the limit can be spent at once, the rest is spread over
+        # the minute: no window of 60 seconds can exceed <limit> requests.
+        self.capacity = max(1, limit // 4)
+
+        self.rate = (limit - self.capacity) / 60 or limit / 60
+
+        self.tokens, self.updated = float(self.capacity), time.monotonic()
+
+        self.waiting = 0
+
+    def refill(self) -> None:
+        now = time.monotonic()
+
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+
+        self.updated = now
+
+
+class RateLimiter:
+    """
+    Token buckets, one per family of endpoints (e.g. "candles" or
+    "auth/r/orders"), which keep requests within the rate limits of Bitfinex:
+    a request which would exceed its budget waits (behind the ones already
+    waiting) until a token is available, instead of being rejected and getting
+    the client locked out for a minute.
+
+    <limits> overrides the requests per minute of some families. With
+    <max_delay>, requests which would wait longer raise RateLimitError.
+    """
+
+    def __init__(
+        self,
+        limits: Optional[Dict[str, int]] = None,
+        *,
+        max_delay: Optional[float] = None,
+    ) -> None:
+        self.__limits = {**_LIMITS, **(limits or {})}
+
+        self.__max_delay = max_delay
+
+        self.__buckets: Dict[str, _Bucket] = {}
+
+        self.__lock = threading.Lock()
+
+    def get_budget(self, family: str) -> float:
+        """
+        Return the requests <family> can send right now without waiting (it is
+        negative while requests are waiting).
+        """
+
+        with self.__lock:
+            bucket = self.__get_bucket(family)
+
+            bucket.refill()
+
+            return bucket.tokens
+
+    def get_queue_depth(self, family: str) -> int:
+        """
+        Return the number of requests of <family> waiting for a token.
+        """
+
+        with self.__lock:
+            return self.__get_bucket(family).waiting
+
+    def wait(self, endpoint: str) -> None:
+        bucket, delay = self.__reserve(endpoint)
+
+        if delay > 0:
+            try:
+                time.sleep(delay)
+            except BaseException:
+                self.__release(bucket, refund=True)
+
+                raise
+
+            self.__release(bucket)
+
+    async def wait_async(self, endpoint: str) -> None:
+        bucket, delay = self.__reserve(endpoint)
+
+        if delay > 0:
+            try:
+                await asyncio.sleep(delay)
+            except BaseException:
+                self.__release(bucket, refund=True)
+
+                raise
+
+            self.__release(bucket)
+
+    def penalize(self, endpoint: str) -> None:
+        """
+        Hold back the requests of the family of <endpoint> for as long as the
+        lockout which follows a rate limit error.
+        """
+
+        with self.__lock:
+            bucket = self.__get_bucket(get_family(endpoint))
+
+            bucket.refill()
+
+            bucket.tokens = min(bucket.tokens, -_LOCKOUT * bucket.rate)
+
+    def __get_bucket(self, family: str) -> _Bucket:
+        if (bucket := self.__buckets.get(family)) is None:
+            if family in self.__limits:
+                limit = self.__limits[family]
+            else:
+                limit = _AUTH_LIMIT if family.startswith("auth/") else _PUBLIC_LIMIT
+
+            bucket = self.__buckets[family] = _Bucket(limit)
+
+        return bucket
+
+    def __reserve(self, endpoint: str) -> Tuple[_Bucket, float]:
+        with self.__lock:
+            bucket = self.__get_bucket(get_family(endpoint))
+
+            bucket.refill()
+
+            delay = max(0.0, (1 - bucket.tokens) / bucket.rate)
+
+            if self.__max_delay is not None and delay > self.__max_delay:
+                raise RateLimitError(
+                    f"The request to <{endpoint}> would wait {delay:.1f} seconds "
+                    "for the rate limit of its endpoint family."
+                )
+
+            bucket.tokens -= 1
+
+            if delay > 0:
+                bucket.waiting += 1
+
+            return bucket, delay
+
+    def __release(self, bucket: _Bucket, *, refund: bool = False) -> None:
+        # The token of a request cancelled while waiting is given back
+        with self.__lock:
+            bucket.waiting -= 1
+
+            if refund:
+                bucket.tokens += 1
@@ -0,0 +1,143 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+_WINDOW = 0.005
+
+_Batch = Dict[str, "Future[Any]"]
+
+_AsyncBatch = Dict[str, "asyncio.Future[Any]"]
+
+
+def _get_symbol(endpoint: str) -> Optional[str]:
+    if endpoint.startswith("ticker/") and endpoint.count("/") == 1:
+        return endpoint[7:]
+
+    return None
+
+
+def _split(data: List[Any]) -> Dict[str, Any]:
+    # The rows of tickers are those of ticker/{symbol}, preceded by the symbol
+    return {row[0]: row[1:] for row in data}
+
+
+class RequestCoalescer:
+    """
+    Batch the single-ticker requests (e.g. of get_t_ticker and get_f_ticker)
+    sent within <window> seconds of each other into one request to tickers,
+    whose rows are then handed back to each caller.
+
+    Requests are sent on their own when they are alone in their window, or
+    when their symbol is missing from the response of tickers.
+    """
+
+    def __init__(self, window: float = _WINDOW) -> None:
+        self.__window = window
+
+        self.__batch: Optional[_Batch] = None
+
+        self.__async_batch: Optional[_AsyncBatch] = None
+
+        self.__task: Optional["asyncio.Task[None]"] = None
+
+        self.__lock = threading.Lock()
+
+    def batches(self, endpoint: str, params: Optional[Any] = None) -> bool:
+        return not params and _get_symbol(endpoint) is not None
+
+    def get(self, endpoint: str, request: Callable[..., Any]) -> Any:
+        symbol = _get_symbol(endpoint)
+
+        assert symbol is not None
+
+        with self.__lock:
+            if (batch := self.__batch) is None:
+                batch = self.__batch = {}
+
+                leader = True
+            else:
+                leader = False
+
+            future = batch.setdefault(symbol, Future())
+
+        if leader:
+            time.sleep(self.__window)
+
+            with self.__lock:
+                self.__batch = None
+
+            self.__send(batch, request)
+
+        return future.result()
+
+    async def get_async(
+        self, endpoint: str, request: Callable[..., Awaitable[Any]]
+    ) -> Any:
+        symbol = _get_symbol(endpoint)
+
+        assert symbol is not None
+
+        if (batch := self.__async_batch) is None:
+            batch = self.__async_batch = {}
+
+            self.__task = asyncio.ensure_future(self.__send_async(batch, request))
+
+        if symbol not in batch:
+            batch[symbol] = asyncio.get_running_loop().create_future()
+
+        # A caller being cancelled doesn't cancel the batch of the others
+        return await asyncio.shield(batch[symbol])
+
+    def __send(self, batch: _Batch, request: Callable[..., Any]) -> None:
+        try:
+            if len(batch) > 1:
+                rows = _split(request("tickers", {"symbols": ",".join(batch)}))
+            else:
+                rows = {}
+        except Exception as error:
+            for future in batch.values():
+                future.set_exception(error)
+
+            return
+
+        for symbol, future in batch.items():
+            if symbol in rows:
+                future.set_result(rows[symbol])
+
+                continue
+
+            try:
+                future.set_result(request(f"ticker/{symbol}"))
+            except Exception as error:
+                future.set_exception(error)
+
+    async def __send_async(
+        self, batch: _AsyncBatch, request: Callable[..., Awaitable[Any]]
+    ) -> None:
+        await asyncio.sleep(self.__window)
+
+        self.__async_batch = None
+
+        try:
+            if len(batch) > 1:
+                rows = _split(await request("tickers", {"symbols": ",".join(batch)}))
+            else:
+                rows = {}
+        except Exception as error:
+            for future in batch.values():
+                future.set_exception(error)
+
+            return
+
+        for symbol, future in batch.items():
+            if symbol in rows:
+                future.set_result(rows[symbol])
+
+                continue
+
+            try:
+                future.set_result(await request(f"ticker/{symbol}"))
+            except Exception as error:
+                future.set_exception(error)
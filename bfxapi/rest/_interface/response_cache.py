@@ -0,0 +1,223 @@
+import asyncio
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from bfxapi._utils.json_encoder import JSONEncoder
+
+# Seconds for which the responses of each (prefix of) endpoint are reused
+_TTLS = {
+    "conf/": 3600.0,
+    "platform/status": 30.0,
+    "pulse/profile/": 300.0,
+    "calc/fx": 60.0,
+    "calc/trade/avg": 5.0,
+}
+
+_MAX_SIZE = 16 * 1024 * 1024
+
+
+class ResponseCache:
+    """
+    Cache of the responses of reference endpoints (configurations, platform
+    status, FX rates, pulse profiles and calculations), kept for the TTL of
+    their endpoint and evicted, least recently used first, once the responses
+    take up more than <max_size> bytes (of JSON).
+
+    Identical requests sent at the same time are sent once. With <path>, the
+    cache is loaded from (and saved to, with save()) a file, so that a new
+    process can start warm.
+    """
+
+    def __init__(
+        self,
+        ttls: Optional[Dict[str, float]] = None,
+        *,
+        max_size: int = _MAX_SIZE,
+        path: Optional[str] = None,
+    ) -> None:
+        self.__ttls = sorted(
+            {**_TTLS, **(ttls or {})}.items(), key=lambda ttl: -len(ttl[0])
+        )
+
+        self.__max_size, self.__path = max_size, path
+
+        # Key of a request -> (expiration time, JSON of its response)
+        self.__entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+
+        self.__size = 0
+
+        self.__pending: Dict[str, "Future[Any]"] = {}
+
+        self.__tasks: Dict[str, "asyncio.Future[Any]"] = {}
+
+        self.__lock = threading.Lock()
+
+        if path is not None and os.path.exists(path):
+            self.__load(path)
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def get(
+        self,
+        endpoint: str,
+        request: Callable[[], Any],
+        *,
+        params: Optional[Any] = None,
+        body: Optional[Any] = None,
+    ) -> Any:
+        if (ttl := self.__get_ttl(endpoint)) is None:
+            return request()
+
+        key = ResponseCache.__get_key(endpoint, params, body)
+
+        with self.__lock:
+            if (data := self.__lookup(key)) is not None:
+                return data
+
+            if (future := self.__pending.get(key)) is not None:
+                owner = False
+            else:
+                future = self.__pending[key] = Future()
+
+                owner = True
+
+        if not owner:
+            return json.loads(json.dumps(future.result()))
+
+        try:
+            data = request()
+        except BaseException as error:
+            future.set_exception(error)
+
+            raise
+        else:
+            future.set_result(data)
+
+            self.__store(key, ttl, data)
+
+            return data
+        finally:
+            with self.__lock:
+                del self.__pending[key]
+
+    async def get_async(
+        self,
+        endpoint: str,
+        request: Callable[[], Awaitable[Any]],
+        *,
+        params: Optional[Any] = None,
+        body: Optional[Any] = None,
+    ) -> Any:
+        if (ttl := self.__get_ttl(endpoint)) is None:
+            return await request()
+
+        key = ResponseCache.__get_key(endpoint, params, body)
+
+        with self.__lock:
+            if (data := self.__lookup(key)) is not None:
+                return data
+
+        if (task := self.__tasks.get(key)) is None:
+            task = self.__tasks[key] = asyncio.ensure_future(request())
+
+            task.add_done_callback(lambda task: self.__complete(key, ttl, task))
+
+        # A caller being cancelled doesn't cancel the request of the others
+        return json.loads(json.dumps(await asyncio.shield(task)))
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__entries.clear()
+
+            self.__size = 0
+
+    def save(self) -> None:
+        """
+        Write the responses which haven't expired yet to the file of the cache,
+        if it has one.
+        """
+
+        if self.__path is None:
+            return
+
+        with self.__lock:
+            now = time.time()
+
+            entries = {
+                key: entry for key, entry in self.__entries.items() if entry[0] > now
+            }
+
+        with open(f"{self.__path}.tmp", "w", encoding="utf-8") as file:
+            json.dump(entries, file)
+
+        os.replace(f"{self.__path}.tmp", self.__path)
+
+    def __get_ttl(self, endpoint: str) -> Optional[float]:
+        for prefix, ttl in self.__ttls:
+            if endpoint.startswith(prefix):
+                return ttl
+
+        return None
+
+    @staticmethod
+    def __get_key(endpoint: str, params: Optional[Any], body: Optional[Any]) -> str:
+        return json.dumps([endpoint, params, body], cls=JSONEncoder, sort_keys=True)
+
+    def __lookup(self, key: str) -> Optional[Any]:
+        if (entry := self.__entries.get(key)) is None:
+            return None
+
+        if entry[0] <= time.time():
+            self.__remove(key)
+
+            return None
+
+        self.__entries.move_to_end(key)
+
+        # Decoded on each hit, so that callers can't alter the cached response
+        return json.loads(entry[1])
+
+    def __store(self, key: str, ttl: float, data: Any) -> None:
+        text = json.dumps(data)
+
+        with self.__lock:
+            if key in self.__entries:
+                self.__remove(key)
+
+            self.__entries[key] = (time.time() + ttl, text)
+
+            self.__size += len(text)
+
+            while self.__size > self.__max_size and self.__entries:
+                self.__remove(next(iter(self.__entries)))
+
+    def __remove(self, key: str) -> None:
+        self.__size -= len(self.__entries.pop(key)[1])
+
+    def __complete(self, key: str, ttl: float, task: "asyncio.Future[Any]") -> None:
+        del self.__tasks[key]
+
+        if not task.cancelled() and task.exception() is None:
+            self.__store(key, ttl, task.result())
+
+    def __load(self, path: str) -> None:
+        # A missing or unreadable file only means that the cache starts cold
+        try:
+            with open(path, encoding="utf-8") as file:
+                entries = json.load(file)
+        except (OSError, ValueError):
+            return
+
+        now = time.time()
+
+        for key, (expiration, text) in entries.items():
+            if expiration > now:
+                self.__entries[key] = (expiration, text)
+
+                self.__size += len(text)
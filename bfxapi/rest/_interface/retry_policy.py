@@ -0,0 +1,106 @@
+import random
+import threading
+import time
+from typing import Dict, Tuple, Union
+
+from bfxapi.rest.exceptions import CircuitOpenError
+
+# Statuses of the responses which didn't come from Bitfinex itself (its load
+# balancers and Cloudflare): rejected requests get 500 and an error message
+_STATUSES = (502, 503, 504, 520, 521, 522, 523, 524)
+
+_Timeout = Union[float, Tuple[float, float]]
+
+
+class RetryPolicy:
+    """
+    Retries of the requests which failed for a transient reason: a timeout, a
+    reset connection or a response with one of <statuses>.
+
+    GET requests are retried up to <retries> times, each after a random delay
+    between 0 and <backoff> * 2 ** attempt seconds (at most <max_backoff>).
+    POST requests are only retried with <retry_posts>, as one which timed out
+    may still have been executed; each retry is signed with a fresh nonce.
+
+    <timeout> is that of each attempt, in seconds, or (connect, read).
+    """
+
+    def __init__(
+        self,
+        retries: int = 2,
+        *,
+        backoff: float = 0.25,
+        max_backoff: float = 5.0,
+        retry_posts: bool = False,
+        statuses: Tuple[int, ...] = _STATUSES,
+        timeout: _Timeout = (5.0, 30.0),
+    ) -> None:
+        self.retries, self.backoff, self.max_backoff = retries, backoff, max_backoff
+
+        self.retry_posts, self.statuses, self.timeout = retry_posts, statuses, timeout
+
+    def get_retries(self, method: str) -> int:
+        if method == "post" and not self.retry_posts:
+            return 0
+
+        return self.retries
+
+    def get_delay(self, attempt: int) -> float:
+        # "Full jitter": clients which failed together don't retry together
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2**attempt))
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker per host: once <threshold> attempts in a row failed for a
+    transient reason, requests to the host raise CircuitOpenError right away
+    for <cooldown> seconds.
+
+    Then, one request is let through (every <cooldown> seconds): the circuit
+    is closed as soon as a request succeeds.
+    """
+
+    def __init__(self, threshold: int = 5, cooldown: float = 30.0) -> None:
+        self.__threshold, self.__cooldown = threshold, cooldown
+
+        self.__failures: Dict[str, int] = {}
+
+        # Host -> time at which its circuit was opened (or last probed)
+        self.__opened: Dict[str, float] = {}
+
+        self.__lock = threading.Lock()
+
+    def is_open(self, host: str) -> bool:
+        with self.__lock:
+            return host in self.__opened
+
+    def check(self, host: str) -> None:
+        with self.__lock:
+            if (opened := self.__opened.get(host)) is None:
+                return
+
+            now = time.monotonic()
+
+            if now - opened < self.__cooldown:
+                raise CircuitOpenError(
+                    f"The circuit to <{host}> is open after {self.__threshold} "
+                    "failed requests in a row: retry in "
+                    f"{self.__cooldown - (now - opened):.1f} seconds."
+                )
+
+            # This request probes the host, the others keep failing fast
+            self.__opened[host] = now
+
+    def record(self, host: str, success: bool) -> None:
+        with self.__lock:
+            if success:
+                self.__failures.pop(host, None)
+
+                self.__opened.pop(host, None)
+
+                return
+
+            self.__failures[host] = self.__failures.get(host, 0) + 1
+
+            if self.__failures[host] >= self.__threshold:
+                self.__opened[host] = time.monotonic()
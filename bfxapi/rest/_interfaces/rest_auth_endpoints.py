@@ -3,6 +3,7 @@ from typing import Any, Dict, List, Literal, Optional, Tuple, Union
 
 from bfxapi._utils.post_only_enforcement import enforce_post_only
 from bfxapi.rest._interface import Interface
+from bfxapi.rest._interface.pagination import Paginator, paginated
 from bfxapi.types import (
     BalanceAvailable,
     BaseMarginInfo,
@@ -209,9 +210,31 @@ class RestAuthEndpoints(Interface):
 
         return [
             serializers.Order.parse(*sub_data)
-            for sub_data in self._m.post(endpoint, body=body)
+            for sub_data in self._m.post(endpoint, body=body, stream=True)
         ]
 
+    @paginated
+    def iter_orders_history(
+        self,
+        *,
+        symbol: Optional[str] = None,
+        ids: Optional[List[int]] = None,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        limit: Optional[int] = None,
+        prefetch: bool = False,
+    ) -> Paginator[Order]:
+        return Paginator(
+            lambda **window: self.get_orders_history(symbol=symbol, ids=ids, **window),
+            serializers.Order,
+            mts="mts_update",
+            id="id",
+            start=start,
+            end=end,
+            limit=limit,
+            prefetch=prefetch,
+        )
+
     def get_order_trades(self, symbol: str, id: int) -> List[OrderTrade]:
         return [
             serializers.OrderTrade.parse(*sub_data)
@@ -234,10 +257,30 @@ class RestAuthEndpoints(Interface):
 
         body = {"sort": sort, "start": start, "end": end, "limit": limit}
 
-        return [
-            serializers.Trade.parse(*sub_data)
-            for sub_data in self._m.post(endpoint, body=body)
-        ]
+        return serializers.Trade.parse_many(
+            self._m.post(endpoint, body=body, stream=True)
+        )
+
+    @paginated
+    def iter_trades_history(
+        self,
+        *,
+        symbol: Optional[str] = None,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        limit: Optional[int] = None,
+        prefetch: bool = False,
+    ) -> Paginator[Trade]:
+        return Paginator(
+            lambda **window: self.get_trades_history(symbol=symbol, **window),
+            serializers.Trade,
+            mts="mts_create",
+            id="id",
+            start=start,
+            end=end,
+            limit=limit,
+            prefetch=prefetch,
+        )
 
     def get_ledgers(
         self,
@@ -255,10 +298,31 @@ class RestAuthEndpoints(Interface):
 
         body = {"category": category, "start": start, "end": end, "limit": limit}
 
-        return [
-            serializers.Ledger.parse(*sub_data)
-            for sub_data in self._m.post(endpoint, body=body)
-        ]
+        return serializers.Ledger.parse_many(
+            self._m.post(endpoint, body=body, stream=True)
+        )
+
+    @paginated
+    def iter_ledgers(
+        self,
+        currency: Optional[str] = None,
+        *,
+        category: Optional[int] = None,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        limit: Optional[int] = None,
+        prefetch: bool = False,
+    ) -> Paginator[Ledger]:
+        return Paginator(
+            lambda **window: self.get_ledgers(currency, category=category, **window),
+            serializers.Ledger,
+            mts="mts",
+            id="id",
+            start=start,
+            end=end,
+            limit=limit,
+            prefetch=prefetch,
+        )
 
     def get_base_margin_info(self) -> BaseMarginInfo:
         return serializers.BaseMarginInfo.parse(
@@ -320,9 +384,30 @@ class RestAuthEndpoints(Interface):
             for sub_data in self._m.post(
                 "auth/r/positions/hist",
                 body={"start": start, "end": end, "limit": limit},
+                stream=True,
             )
         ]
 
+    @paginated
+    def iter_positions_history(
+        self,
+        *,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        limit: Optional[int] = None,
+        prefetch: bool = False,
+    ) -> Paginator[PositionHistory]:
+        return Paginator(
+            self.get_positions_history,
+            serializers.PositionHistory,
+            mts="mts_update",
+            id="position_id",
+            start=start,
+            end=end,
+            limit=limit,
+            prefetch=prefetch,
+        )
+
     def get_positions_snapshot(
         self,
         *,
@@ -475,10 +560,33 @@ class RestAuthEndpoints(Interface):
         return [
             serializers.FundingOffer.parse(*sub_data)
             for sub_data in self._m.post(
-                endpoint, body={"start": start, "end": end, "limit": limit}
+                endpoint,
+                body={"start": start, "end": end, "limit": limit},
+                stream=True,
             )
         ]
 
+    @paginated
+    def iter_funding_offers_history(
+        self,
+        *,
+        symbol: Optional[str] = None,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        limit: Optional[int] = None,
+        prefetch: bool = False,
+    ) -> Paginator[FundingOffer]:
+        return Paginator(
+            lambda **window: self.get_funding_offers_history(symbol=symbol, **window),
+            serializers.FundingOffer,
+            mts="mts_update",
+            id="id",
+            start=start,
+            end=end,
+            limit=limit,
+            prefetch=prefetch,
+        )
+
     def get_funding_loans(self, *, symbol: Optional[str] = None) -> List[FundingLoan]:
         if symbol is None:
             endpoint = "auth/r/funding/loans"
@@ -506,10 +614,33 @@ class RestAuthEndpoints(Interface):
         return [
             serializers.FundingLoan.parse(*sub_data)
             for sub_data in self._m.post(
-                endpoint, body={"start": start, "end": end, "limit": limit}
+                endpoint,
+                body={"start": start, "end": end, "limit": limit},
+                stream=True,
             )
         ]
 
+    @paginated
+    def iter_funding_loans_history(
+        self,
+        *,
+        symbol: Optional[str] = None,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        limit: Optional[int] = None,
+        prefetch: bool = False,
+    ) -> Paginator[FundingLoan]:
+        return Paginator(
+            lambda **window: self.get_funding_loans_history(symbol=symbol, **window),
+            serializers.FundingLoan,
+            mts="mts_update",
+            id="id",
+            start=start,
+            end=end,
+            limit=limit,
+            prefetch=prefetch,
+        )
+
     def get_funding_credits(
         self, *, symbol: Optional[str] = None
     ) -> List[FundingCredit]:
@@ -539,10 +670,33 @@ class RestAuthEndpoints(Interface):
         return [
             serializers.FundingCredit.parse(*sub_data)
             for sub_data in self._m.post(
-                endpoint, body={"start": start, "end": end, "limit": limit}
+                endpoint,
+                body={"start": start, "end": end, "limit": limit},
+                stream=True,
             )
         ]
 
+    @paginated
+    def iter_funding_credits_history(
+        self,
+        *,
+        symbol: Optional[str] = None,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        limit: Optional[int] = None,
+        prefetch: bool = False,
+    ) -> Paginator[FundingCredit]:
+        return Paginator(
+            lambda **window: self.get_funding_credits_history(symbol=symbol, **window),
+            serializers.FundingCredit,
+            mts="mts_update",
+            id="id",
+            start=start,
+            end=end,
+            limit=limit,
+            prefetch=prefetch,
+        )
+
     def get_funding_trades_history(
         self,
         *,
@@ -561,9 +715,30 @@ class RestAuthEndpoints(Interface):
 
         return [
             serializers.FundingTrade.parse(*sub_data)
-            for sub_data in self._m.post(endpoint, body=body)
+            for sub_data in self._m.post(endpoint, body=body, stream=True)
         ]
 
+    @paginated
+    def iter_funding_trades_history(
+        self,
+        *,
+        symbol: Optional[str] = None,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        limit: Optional[int] = None,
+        prefetch: bool = False,
+    ) -> Paginator[FundingTrade]:
+        return Paginator(
+            lambda **window: self.get_funding_trades_history(symbol=symbol, **window),
+            serializers.FundingTrade,
+            mts="mts_create",
+            id="id",
+            start=start,
+            end=end,
+            limit=limit,
+            prefetch=prefetch,
+        )
+
     def get_funding_info(self, key: str) -> FundingInfo:
         return serializers.FundingInfo.parse(
             *self._m.post(f"auth/r/info/funding/{key}")
@@ -639,6 +814,29 @@ class RestAuthEndpoints(Interface):
         return [
             serializers.Movement.parse(*sub_data)
             for sub_data in self._m.post(
-                endpoint, body={"start": start, "end": end, "limit": limit}
+                endpoint,
+                body={"start": start, "end": end, "limit": limit},
+                stream=True,
             )
         ]
+
+    @paginated
+    def iter_movements(
+        self,
+        *,
+        currency: Optional[str] = None,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        limit: Optional[int] = None,
+        prefetch: bool = False,
+    ) -> Paginator[Movement]:
+        return Paginator(
+            lambda **window: self.get_movements(currency=currency, **window),
+            serializers.Movement,
+            mts="mts_update",
+            id="id",
+            start=start,
+            end=end,
+            limit=limit,
+            prefetch=prefetch,
+        )
@@ -10,6 +10,7 @@ from bfxapi.types import (
     MerchantDeposit,
     MerchantUnlinkedDeposit,
 )
+from bfxapi.types.labeler import _get_type
 
 
 class RestMerchantEndpoints(Interface):
@@ -89,7 +90,7 @@ class RestMerchantEndpoints(Interface):
         self, status: Literal["CREATED", "PENDING", "COMPLETED", "EXPIRED"], format: str
     ) -> List[InvoiceStats]:
         return [
-            InvoiceStats(**sub_data)
+            _get_type(InvoiceStats)(**sub_data)
             for sub_data in self._m.post(
                 "auth/r/ext/pay/invoice/stats/count",
                 body={"status": status, "format": format},
@@ -100,7 +101,7 @@ class RestMerchantEndpoints(Interface):
         self, currency: str, format: str
     ) -> List[InvoiceStats]:
         return [
-            InvoiceStats(**sub_data)
+            _get_type(InvoiceStats)(**sub_data)
             for sub_data in self._m.post(
                 "auth/r/ext/pay/invoice/stats/earning",
                 body={"currency": currency, "format": format},
@@ -135,7 +136,7 @@ class RestMerchantEndpoints(Interface):
 
     def get_currency_conversion_list(self) -> List[CurrencyConversion]:
         return [
-            CurrencyConversion(**sub_data)
+            _get_type(CurrencyConversion)(**sub_data)
             for sub_data in self._m.post("auth/r/ext/pay/settings/convert/list")
         ]
 
@@ -180,7 +181,7 @@ class RestMerchantEndpoints(Interface):
 
         data = self._m.post("auth/r/ext/pay/deposits", body=body)
 
-        return [MerchantDeposit(**sub_data) for sub_data in data]
+        return [_get_type(MerchantDeposit)(**sub_data) for sub_data in data]
 
     def get_unlinked_deposits(
         self, ccy: str, *, start: Optional[int] = None, end: Optional[int] = None
@@ -189,4 +190,4 @@ class RestMerchantEndpoints(Interface):
 
         data = self._m.post("/auth/r/ext/pay/deposits/unlinked", body=body)
 
-        return [MerchantUnlinkedDeposit(**sub_data) for sub_data in data]
+        return [_get_type(MerchantUnlinkedDeposit)(**sub_data) for sub_data in data]
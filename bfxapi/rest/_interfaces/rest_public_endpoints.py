@@ -2,6 +2,7 @@ from decimal import Decimal
 from typing import Any, Dict, List, Literal, Optional, Union, cast
 
 from bfxapi.rest._interface import Interface
+from bfxapi.rest._interface.pagination import Paginator, paginated
 from bfxapi.types import (
     Candle,
     DerivativesStatus,
@@ -26,6 +27,7 @@ from bfxapi.types import (
     TradingPairTrade,
     serializers,
 )
+from bfxapi.types.fixed_point import _scaled
 
 
 class RestPublicEndpoints(Interface):
@@ -38,7 +40,9 @@ class RestPublicEndpoints(Interface):
     def get_tickers(
         self, symbols: List[str]
     ) -> Dict[str, Union[TradingPairTicker, FundingCurrencyTicker]]:
-        data = self._m.get("tickers", params={"symbols": ",".join(symbols)})
+        data = self._m.get(
+            "tickers", params={"symbols": ",".join(symbols)}, stream=True
+        )
 
         parsers = {
             "t": serializers.TradingPairTicker.parse,
@@ -106,6 +110,7 @@ class RestPublicEndpoints(Interface):
                     "end": end,
                     "limit": limit,
                 },
+                stream=True,
             )
         ]
 
@@ -119,8 +124,29 @@ class RestPublicEndpoints(Interface):
         sort: Optional[int] = None,
     ) -> List[TradingPairTrade]:
         params = {"limit": limit, "start": start, "end": end, "sort": sort}
-        data = self._m.get(f"trades/{pair}/hist", params=params)
-        return [serializers.TradingPairTrade.parse(*sub_data) for sub_data in data]
+        data = self._m.get(f"trades/{pair}/hist", params=params, stream=True)
+        return _scaled(serializers.TradingPairTrade, pair).parse_many(data)
+
+    @paginated
+    def iter_t_trades(
+        self,
+        pair: str,
+        *,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        limit: Optional[int] = None,
+        prefetch: bool = False,
+    ) -> Paginator[TradingPairTrade]:
+        return Paginator(
+            lambda **window: self.get_t_trades(pair, **window),
+            serializers.TradingPairTrade,
+            mts="mts",
+            id="id",
+            start=start,
+            end=end,
+            limit=limit,
+            prefetch=prefetch,
+        )
 
     def get_f_trades(
         self,
@@ -132,8 +158,8 @@ class RestPublicEndpoints(Interface):
         sort: Optional[int] = None,
     ) -> List[FundingCurrencyTrade]:
         params = {"limit": limit, "start": start, "end": end, "sort": sort}
-        data = self._m.get(f"trades/{currency}/hist", params=params)
-        return [serializers.FundingCurrencyTrade.parse(*sub_data) for sub_data in data]
+        data = self._m.get(f"trades/{currency}/hist", params=params, stream=True)
+        return serializers.FundingCurrencyTrade.parse_many(data)
 
     def get_t_book(
         self,
@@ -142,8 +168,10 @@ class RestPublicEndpoints(Interface):
         *,
         len: Optional[Literal[1, 25, 100]] = None,
     ) -> List[TradingPairBook]:
+        serializer = _scaled(serializers.TradingPairBook, pair)
+
         return [
-            serializers.TradingPairBook.parse(*sub_data)
+            serializer.parse(*sub_data)
             for sub_data in self._m.get(f"book/{pair}/{precision}", params={"len": len})
         ]
 
@@ -164,8 +192,10 @@ class RestPublicEndpoints(Interface):
     def get_t_raw_book(
         self, pair: str, *, len: Optional[Literal[1, 25, 100]] = None
     ) -> List[TradingPairRawBook]:
+        serializer = _scaled(serializers.TradingPairRawBook, pair)
+
         return [
-            serializers.TradingPairRawBook.parse(*sub_data)
+            serializer.parse(*sub_data)
             for sub_data in self._m.get(f"book/{pair}/R0", params={"len": len})
         ]
 
@@ -187,8 +217,8 @@ class RestPublicEndpoints(Interface):
         limit: Optional[int] = None,
     ) -> List[Statistic]:
         params = {"sort": sort, "start": start, "end": end, "limit": limit}
-        data = self._m.get(f"stats1/{resource}/hist", params=params)
-        return [serializers.Statistic.parse(*sub_data) for sub_data in data]
+        data = self._m.get(f"stats1/{resource}/hist", params=params, stream=True)
+        return serializers.Statistic.parse_many(data)
 
     def get_stats_last(
         self,
@@ -214,8 +244,30 @@ class RestPublicEndpoints(Interface):
         limit: Optional[int] = None,
     ) -> List[Candle]:
         params = {"sort": sort, "start": start, "end": end, "limit": limit}
-        data = self._m.get(f"candles/trade:{tf}:{symbol}/hist", params=params)
-        return [serializers.Candle.parse(*sub_data) for sub_data in data]
+        endpoint = f"candles/trade:{tf}:{symbol}/hist"
+        data = self._m.get(endpoint, params=params, stream=True)
+        return serializers.Candle.parse_many(data)
+
+    @paginated
+    def iter_candles_hist(
+        self,
+        symbol: str,
+        tf: str = "1m",
+        *,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        limit: Optional[int] = None,
+        prefetch: bool = False,
+    ) -> Paginator[Candle]:
+        return Paginator(
+            lambda **window: self.get_candles_hist(symbol, tf, **window),
+            serializers.Candle,
+            mts="mts",
+            start=start,
+            end=end,
+            limit=limit,
+            prefetch=prefetch,
+        )
 
     def get_candles_last(
         self,
@@ -257,8 +309,8 @@ class RestPublicEndpoints(Interface):
         limit: Optional[int] = None,
     ) -> List[DerivativesStatus]:
         params = {"sort": sort, "start": start, "end": end, "limit": limit}
-        data = self._m.get(f"status/deriv/{key}/hist", params=params)
-        return [serializers.DerivativesStatus.parse(*sub_data) for sub_data in data]
+        data = self._m.get(f"status/deriv/{key}/hist", params=params, stream=True)
+        return serializers.DerivativesStatus.parse_many(data)
 
     def get_liquidations(
         self,
@@ -269,7 +321,7 @@ class RestPublicEndpoints(Interface):
         limit: Optional[int] = None,
     ) -> List[Liquidation]:
         params = {"sort": sort, "start": start, "end": end, "limit": limit}
-        data = self._m.get("liquidations/hist", params=params)
+        data = self._m.get("liquidations/hist", params=params, stream=True)
         return [serializers.Liquidation.parse(*sub_data[0]) for sub_data in data]
 
     def get_seed_candles(
@@ -283,8 +335,9 @@ class RestPublicEndpoints(Interface):
         limit: Optional[int] = None,
     ) -> List[Candle]:
         params = {"sort": sort, "start": start, "end": end, "limit": limit}
-        data = self._m.get(f"candles/trade:{tf}:{symbol}/hist", params=params)
-        return [serializers.Candle.parse(*sub_data) for sub_data in data]
+        endpoint = f"candles/trade:{tf}:{symbol}/hist"
+        data = self._m.get(endpoint, params=params, stream=True)
+        return serializers.Candle.parse_many(data)
 
     def get_leaderboards_hist(
         self,
@@ -7,3 +7,15 @@ class RequestParameterError(BfxBaseException):
 
 class GenericError(BfxBaseException):
     pass
+
+
+class RateLimitError(BfxBaseException):
+    pass
+
+
+class CircuitOpenError(BfxBaseException):
+    pass
+
+
+class PaginationError(BfxBaseException):
+    pass
@@ -58,4 +58,6 @@ from .dataclasses import (
     Wallet,
     Withdrawal,
 )
+from .fixed_point import get_precision, set_precision, unset_precision
+from .labeler import compact, set_default_output, use_output
 from .notification import Notification
@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from typing import Any, Dict, List, Literal, Optional
 
-from .labeler import _Type, compose, partial
+from .labeler import _get_type, _Type, compose, partial
 
 # region Dataclass definitions for types of public use
 
@@ -641,23 +641,23 @@ class InvoiceSubmission(_Type):
     @classmethod
     def parse(cls, data: Dict[str, Any]) -> "InvoiceSubmission":
         if "customer_info" in data and data["customer_info"] is not None:
-            data["customer_info"] = InvoiceSubmission.CustomerInfo(
+            data["customer_info"] = _get_type(InvoiceSubmission.CustomerInfo)(
                 **data["customer_info"]
             )
 
         for index, invoice in enumerate(data["invoices"]):
-            data["invoices"][index] = InvoiceSubmission.Invoice(**invoice)
+            data["invoices"][index] = _get_type(InvoiceSubmission.Invoice)(**invoice)
 
         if "payment" in data and data["payment"] is not None:
-            data["payment"] = InvoiceSubmission.Payment(**data["payment"])
+            data["payment"] = _get_type(InvoiceSubmission.Payment)(**data["payment"])
 
         if "additional_payments" in data and data["additional_payments"] is not None:
             for index, additional_payment in enumerate(data["additional_payments"]):
-                data["additional_payments"][index] = InvoiceSubmission.Payment(
-                    **additional_payment
-                )
+                data["additional_payments"][index] = _get_type(
+                    InvoiceSubmission.Payment
+                )(**additional_payment)
 
-        return InvoiceSubmission(**data)
+        return _get_type(cls)(**data)
 
     @compose(dataclass, partial)
     class CustomerInfo:
@@ -712,7 +712,7 @@ class InvoicePage(_Type):
         for index, item in enumerate(data["items"]):
             data["items"][index] = InvoiceSubmission.parse(item)
 
-        return InvoicePage(**data)
+        return _get_type(cls)(**data)
 
 
 @dataclass
@@ -0,0 +1,52 @@
+from typing import Dict, Optional, Tuple, TypeVar
+
+from .labeler import _Serializer, _Type
+
+T = TypeVar("T", bound=_Type)
+
+# Bitfinex never sends more than 8 decimals, for both prices and amounts: with
+# these defaults, every value is represented exactly.
+_DECIMALS = 8
+
+_PRECISIONS: Dict[str, Tuple[int, int]] = {}
+
+
+def _get_pair(symbol: str) -> str:
+    return symbol[1:] if symbol.startswith("t") else symbol
+
+
+def set_precision(
+    pair: str, *, price: int = _DECIMALS, amount: int = _DECIMALS
+) -> None:
+    """
+    Parse the prices and amounts of <pair> (books, raw books and trades) into
+    integers scaled by 10 ** <price> and 10 ** <amount>.
+    """
+
+    if price < 0 or amount < 0:
+        raise ValueError("Decimals of prices and amounts can't be negative.")
+
+    _PRECISIONS[_get_pair(pair)] = (price, amount)
+
+
+def unset_precision(pair: str) -> None:
+    """
+    Parse the prices and amounts of <pair> into floats again.
+    """
+
+    _PRECISIONS.pop(_get_pair(pair), None)
+
+
+def get_precision(pair: str) -> Optional[Tuple[int, int]]:
+    """
+    Return the decimals (of prices, of amounts) used for <pair>, if any.
+    """
+
+    return _PRECISIONS.get(_get_pair(pair))
+
+
+def _scaled(serializer: _Serializer[T], symbol: str) -> _Serializer[T]:
+    if not _PRECISIONS or (precision := get_precision(symbol)) is None:
+        return serializer
+
+    return serializer.scale(price=precision[0], amount=precision[1])
@@ -1,7 +1,48 @@
-from typing import Any, Dict, Generic, Iterable, List, Tuple, Type, TypeVar, cast
+import copy
+from abc import ABCMeta
+from collections import namedtuple
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, fields
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    cast,
+    get_args,
+)
 
 T = TypeVar("T", bound="_Type")
 
+_C = TypeVar("_C")
+
+_Output = Literal[
+    "dataclass", "slots", "frozen", "namedtuple", "raw", "lazy", "numpy", "columns"
+]
+
+_Construct = Literal["keywords", "tuple", "list"]
+
+_OUTPUT: ContextVar[_Output] = ContextVar("_OUTPUT")
+
+_default_output: _Output = "dataclass"
+
+_PARTIALS: Set[type] = set()
+
+_ORIGINS: Dict[type, type] = {}
+
+_Scales = Tuple[Tuple[str, int], ...]
+
 
 def compose(*decorators):
     def wrapper(function):
@@ -16,9 +57,9 @@ def partial(cls):
     def __init__(self, **kwargs):
         for annotation in self.__annotations__.keys():
             if annotation not in kwargs:
-                self.__setattr__(annotation, None)
+                object.__setattr__(self, annotation, None)
             else:
-                self.__setattr__(annotation, kwargs[annotation])
+                object.__setattr__(self, annotation, kwargs[annotation])
 
             kwargs.pop(annotation, None)
 
@@ -30,14 +71,445 @@ def partial(cls):
 
     cls.__init__ = __init__
 
+    _PARTIALS.add(cls)
+
     return cls
 
 
-class _Type:
+class _Type(metaclass=ABCMeta):
     """
     Base class for any dataclass serializable by the _Serializer generic class.
+
+    Its compact variants and lazy records are registered as virtual subclasses:
+    isinstance holds for every output which builds objects.
+    """
+
+    __slots__ = ()
+
+
+def _check_output(output: _Output) -> None:
+    if output not in get_args(_Output):
+        raise ValueError(
+            f"Unknown output <{output}> (available outputs are: "
+            f"{', '.join(get_args(_Output))})."
+        )
+
+
+def set_default_output(output: _Output) -> None:
+    """
+    Set the output used by every serializer when no other output is in use.
+    """
+
+    global _default_output
+
+    _check_output(output)
+
+    _default_output = output
+
+
+@contextmanager
+def use_output(output: _Output) -> Iterator[None]:
+    """
+    Use another output for the serializers called within the block.
+    """
+
+    _check_output(output)
+
+    token = _OUTPUT.set(output)
+
+    try:
+        yield
+    finally:
+        _OUTPUT.reset(token)
+
+
+_DATACLASS_ATTRIBUTES = [
+    "__dict__",
+    "__weakref__",
+    "__init__",
+    "__repr__",
+    "__eq__",
+    "__hash__",
+    "__setattr__",
+    "__delattr__",
+    "__dataclass_fields__",
+    "__dataclass_params__",
+    "__match_args__",
+]
+
+
+def _restore(klass: Type[_C], frozen: bool, kwargs: Dict[str, Any]) -> _C:
+    return compact(klass, frozen=frozen)(**kwargs)
+
+
+@lru_cache(maxsize=None)
+def _compact(klass: type, frozen: bool) -> type:
+    namespace = {
+        key: value
+        for key, value in vars(klass).items()
+        if key not in _DATACLASS_ATTRIBUTES
+    }
+
+    variant = type(klass)(klass.__name__, klass.__bases__, namespace)
+
+    if klass in _PARTIALS:
+        variant = partial(variant)
+
+    variant = dataclass(frozen=frozen)(variant)
+
+    names = tuple(field.name for field in fields(variant))
+
+    namespace = {key: value for key, value in vars(variant).items()}
+
+    for key in (*names, "__dict__", "__weakref__"):
+        namespace.pop(key, None)
+
+    def __reduce__(self):
+        return _restore, (klass, frozen, {name: getattr(self, name) for name in names})
+
+    namespace.update(__slots__=names, __reduce__=__reduce__)
+
+    variant = type(klass)(klass.__name__, klass.__bases__, namespace)
+
+    variant.__qualname__ = klass.__qualname__
+
+    _ORIGINS[variant] = klass
+
+    if isinstance(klass, ABCMeta):
+        klass.register(variant)
+
+    return variant
+
+
+def compact(klass: Type[_C], *, frozen: bool = False) -> Type[_C]:
+    """
+    Return the slotted (and optionally frozen) variant of a dataclass.
+
+    Variants are created once and have the same fields and methods as <klass>,
+    but no per-instance __dict__.
+    """
+
+    origin = _ORIGINS.get(cast(type, klass), cast(type, klass))
+
+    return cast(Type[_C], _compact(origin, frozen))
+
+
+def _get_type(klass: Type[_C]) -> Type[_C]:
+    output = _OUTPUT.get(_default_output)
+
+    if output in ("slots", "frozen"):
+        return compact(klass, frozen=output == "frozen")
+
+    return cast(Type[_C], _ORIGINS.get(cast(type, klass), klass))
+
+
+def _import_numpy() -> Any:
+    try:
+        import numpy
+    except ImportError as error:
+        raise ImportError(
+            "The numpy and columns outputs require NumPy, which can be installed "
+            "with: pip install bitfinex-api-py-postonly[numpy]."
+        ) from error
+
+    return numpy
+
+
+def _to_array(numpy: Any, values: Sequence[Any]) -> Any:
+    """
+    Convert a column to the narrowest typed array that holds its values: numbers
+    and strings keep the dtype inferred by NumPy, numbers with nulls become
+    float64 (with NaN) and anything else is kept in an object array.
+    """
+
+    try:
+        array = numpy.array(values)
+    except (TypeError, ValueError):
+        array = None
+
+    if array is not None and array.ndim == 1 and array.dtype.kind in "biufU":
+        return array
+
+    try:
+        return numpy.array(values, dtype=numpy.float64)
+    except (TypeError, ValueError):
+        pass
+
+    array = numpy.empty(len(values), dtype=object)
+
+    for index, value in enumerate(values):
+        array[index] = value
+
+    return array
+
+
+def _flatten(array: Sequence[Any], length: int) -> List[Any]:
+    """
+    Flatten nested lists iteratively, stopping after the first <length> values.
+    """
+
+    values: List[Any] = []
+
+    stack = [iter(array)]
+
+    while stack and len(values) < length:
+        for value in stack[-1]:
+            if isinstance(value, list):
+                stack.append(iter(value))
+
+                break
+
+            values.append(value)
+
+            if len(values) == length:
+                break
+        else:
+            stack.pop()
+
+    return values
+
+
+def _restore_namedtuple(name: str, labels: Tuple[str, ...], values: Any) -> Any:
+    return _namedtuple(name, labels)(*values)
+
+
+@lru_cache(maxsize=None)
+def _namedtuple(name: str, labels: Tuple[str, ...]) -> type:
+    klass = namedtuple(name, labels)  # type: ignore[misc]
+
+    # The class can't be imported by name: instances are rebuilt from its layout
+    def __reduce__(self):
+        return _restore_namedtuple, (name, labels, tuple(self))
+
+    klass.__reduce__ = __reduce__  # type: ignore[method-assign]
+
+    return klass
+
+
+class _LazyRecord:
+    """
+    Read-only view of a decoded record: it keeps the values sent by Bitfinex and
+    converts a field (through its sub-serializer, if any) only when it is read.
+
+    Sub-serialized fields are parsed once: the result is kept in a slot of the
+    record, _parsed_<label>. Records are pickled with these fields parsed.
+    """
+
+    __slots__ = ("_values", "_parsers")
+
+    _indices: Dict[str, int] = {}
+
+    # Arguments of _lazy_record which created the class
+    _layout: Tuple[Any, ...] = ()
+
+    def __init__(
+        self, values: Sequence[Any], parsers: Dict[str, Callable[..., Any]]
+    ) -> None:
+        self._values, self._parsers = values, parsers
+
+    def __repr__(self) -> str:
+        fields = (f"{label}={getattr(self, label)!r}" for label in self._indices)
+
+        return f"{type(self).__qualname__}({', '.join(fields)})"
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+
+        return all(
+            getattr(self, label) == getattr(other, label) for label in self._indices
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # Parsers can't be pickled: sub-serialized fields (<parsers> of the
+        # layout) are pickled parsed instead
+        parsed = {label: getattr(self, label) for label in self._layout[3]}
+
+        return _restore_lazy_record, (self._layout, self._values, parsed)
+
+
+def _restore_lazy_record(
+    layout: Tuple[Any, ...], values: Sequence[Any], parsed: Dict[str, Any]
+) -> _LazyRecord:
+    record = _lazy_record(*layout)(values, {})
+
+    for label, value in parsed.items():
+        setattr(record, f"_parsed_{label}", value)
+
+    return record
+
+
+def _lazy_field(label: str, index: int, parsed: bool, scale: int) -> property:
+    if parsed:
+        slot = f"_parsed_{label}"
+
+        def get(self: Any) -> Any:
+            try:
+                return getattr(self, slot)
+            except AttributeError:
+                value = self._parsers[label](*self._values[index])
+
+                setattr(self, slot, value)
+
+                return value
+
+        return property(get)
+
+    if scale:
+        return property(lambda self: round(self._values[index] * scale))
+
+    return property(lambda self: self._values[index])
+
+
+@lru_cache(maxsize=None)
+def _lazy_record(
+    name: str,
+    klass: type,
+    labels: Tuple[str, ...],
+    parsers: Tuple[str, ...],
+    scales: _Scales = (),
+) -> type:
+    indices = {
+        label: index for index, label in enumerate(labels) if label != "_PLACEHOLDER"
+    }
+
+    slots = tuple(f"_parsed_{label}" for label in indices if label in parsers)
+
+    namespace: Dict[str, Any] = {
+        "__slots__": slots,
+        "_indices": indices,
+        "_layout": (name, klass, labels, parsers, scales),
+    }
+
+    for label, index in indices.items():
+        namespace[label] = _lazy_field(
+            label, index, label in parsers, dict(scales).get(label, 0)
+        )
+
+    record = type(name, (_LazyRecord,), namespace)
+
+    if isinstance(klass, ABCMeta):
+        klass.register(record)
+
+    return record
+
+
+def _generate_lazy_parser(
+    name: str,
+    klass: type,
+    labels: List[str],
+    *,
+    parsers: Dict[str, Callable[..., Any]],
+    flat: bool = False,
+    scales: _Scales = (),
+) -> Callable[..., Any]:
+    record = _lazy_record(name, klass, tuple(labels), tuple(sorted(parsers)), scales)
+
+    length = len(labels)
+
+    def parse(*values: Any) -> Any:
+        if flat:
+            values = tuple(_flatten(values, length))
+
+        if len(values) < length:
+            raise AssertionError(
+                f"{name} -> <labels> and <*args> "
+                "arguments should contain the same amount of elements."
+            )
+
+        return record(values, parsers)
+
+    return parse
+
+
+@lru_cache(maxsize=None)
+def _compile_parser_factory(
+    name: str,
+    labels: Tuple[str, ...],
+    parsers: Tuple[str, ...],
+    flat: bool,
+    construct: _Construct,
+    scales: _Scales = (),
+) -> Callable[..., Callable[..., Any]]:
+    """
+    Compile, once per layout, a factory of functions which pick each label by
+    position and build the output directly: klass(**fields) for "keywords",
+    tuple.__new__(klass, fields) for "tuple" and a plain list for "list".
+
+    Labels in <scales> are parsed into integers: round(value * scale).
     """
 
+    arguments: List[str] = []
+
+    factors = dict(scales)
+
+    for index, label in enumerate(labels):
+        if label == "_PLACEHOLDER":
+            continue
+
+        if label in parsers:
+            argument = f"parse_{label}(*values[{index}])"
+        elif label in factors:
+            argument = f"round(values[{index}] * {factors[label]})"
+        else:
+            argument = f"values[{index}]"
+
+        if construct == "keywords":
+            argument = f"{label}={argument}"
+
+        arguments.append(argument)
+
+    if construct == "keywords":
+        output = f"klass({', '.join(arguments)})"
+    elif construct == "tuple":
+        output = f"new(klass, ({', '.join(arguments)},))"
+    else:
+        output = f"[{', '.join(arguments)}]"
+
+    source = ["def factory(klass, flatten, parsers):", "    new = tuple.__new__"]
+
+    source += [f"    parse_{label} = parsers['{label}']" for label in parsers]
+
+    source += ["    def parse(*values):"]
+
+    if flat:
+        source += [f"        values = flatten(values, {len(labels)})"]
+
+    source += [
+        f"        if len(values) < {len(labels)}:",
+        "            raise AssertionError(",
+        f'                "{name} -> <labels> and <*args> "',
+        '                "arguments should contain the same amount of elements."',
+        "            )",
+        f"        return {output}",
+        "    return parse",
+    ]
+
+    namespace: Dict[str, Any] = {}
+
+    exec(compile("\n".join(source), f"<{name}.parse>", "exec"), namespace)
+
+    return cast(Callable[..., Callable[..., Any]], namespace["factory"])
+
+
+def _generate_parser(
+    name: str,
+    klass: type,
+    labels: List[str],
+    *,
+    parsers: Dict[str, Callable[..., Any]],
+    flat: bool = False,
+    construct: _Construct = "keywords",
+    scales: _Scales = (),
+) -> Callable[..., Any]:
+    factory = _compile_parser_factory(
+        name, tuple(labels), tuple(sorted(parsers)), flat, construct, scales
+    )
+
+    return factory(klass, _flatten, parsers)
+
 
 class _Serializer(Generic[T]):
     def __init__(
@@ -45,9 +517,36 @@ class _Serializer(Generic[T]):
     ):
         self.name, self.klass, self.__labels, self.__flat = name, klass, labels, flat
 
+        self.__fields = [
+            (index, label)
+            for index, label in enumerate(labels)
+            if label != "_PLACEHOLDER"
+        ]
+
+        self.__setup(())
+
+    def __setup(self, scales: _Scales) -> None:
+        self.__scales = scales
+
+        self.__variants: Dict[_Scales, _Serializer[T]] = {}
+
+        self.__parse = _generate_parser(
+            self.name,
+            self.klass,
+            self.__labels,
+            parsers=self._get_parsers(),
+            flat=self.__flat,
+            scales=scales,
+        )
+
+        self.__parsers: Dict[_Output, Callable[..., Any]] = {"dataclass": self.__parse}
+
+    def _get_parsers(self) -> Dict[str, Callable[..., Any]]:
+        return {}
+
     def _serialize(self, *args: Any) -> Iterable[Tuple[str, Any]]:
         if self.__flat:
-            args = tuple(_Serializer.__flatten(list(args)))
+            args = tuple(_flatten(args, len(self.__labels)))
 
         if len(self.__labels) > len(args):
             raise AssertionError(
@@ -55,25 +554,163 @@ class _Serializer(Generic[T]):
                 "arguments should contain the same amount of elements."
             )
 
-        for index, label in enumerate(self.__labels):
-            if label != "_PLACEHOLDER":
-                yield label, args[index]
+        for index, label in self.__fields:
+            yield label, args[index]
 
     def parse(self, *values: Any) -> T:
-        return cast(T, self.klass(**dict(self._serialize(*values))))
+        output = _OUTPUT.get(_default_output)
 
-    def get_labels(self) -> List[str]:
-        return [label for label in self.__labels if label != "_PLACEHOLDER"]
+        if output == "dataclass":
+            return cast(T, self.__parse(*values))
+
+        return cast(T, self.__get_parser(output)(*values))
+
+    def parse_many(self, rows: Iterable[Sequence[Any]]) -> List[T]:
+        """
+        Parse a list (or any iterable, e.g. a streamed response) of records.
+
+        With the "numpy" and "columns" outputs, the records are decoded column
+        by column (named after the labels) into a NumPy structured array or a
+        dict of typed arrays, without building any intermediate object.
+        """
+
+        output = _OUTPUT.get(_default_output)
+
+        if output in ("numpy", "columns"):
+            return cast(List[T], self.__parse_columns(rows, output == "numpy"))
+
+        parse = self.__get_parser(output)
+
+        return [cast(T, parse(*row)) for row in rows]
+
+    def __get_parser(self, output: _Output) -> Callable[..., Any]:
+        if output not in self.__parsers:
+            self.__parsers[output] = self.__generate_parser(output)
+
+        return self.__parsers[output]
+
+    def __parse_columns(self, rows: Iterable[Sequence[Any]], structured: bool) -> Any:
+        numpy = _import_numpy()
+
+        if self.__flat:
+            rows = (_flatten(row, len(self.__labels)) for row in rows)
+
+        columns = list(zip(*rows))
+
+        if columns and len(self.__labels) > len(columns):
+            raise AssertionError(
+                f"{self.name} -> <labels> and <*args> "
+                "arguments should contain the same amount of elements."
+            )
+
+        parsers, factors = self._get_parsers(), dict(self.__scales)
+
+        arrays: Dict[str, Any] = {}
+
+        for index, label in self.__fields:
+            values = columns[index] if columns else ()
+
+            if label in parsers:
+                values = tuple(parsers[label](*value) for value in values)
+            elif label in factors:
+                values = tuple(round(value * factors[label]) for value in values)
+
+            arrays[label] = _to_array(numpy, values)
 
-    @classmethod
-    def __flatten(cls, array: List[Any]) -> List[Any]:
-        if len(array) == 0:
-            return array
+        if not structured:
+            return arrays
 
-        if isinstance(array[0], list):
-            return cls.__flatten(array[0]) + cls.__flatten(array[1:])
+        array = numpy.empty(
+            len(columns[0]) if columns else 0,
+            dtype=[(label, column.dtype) for label, column in arrays.items()],
+        )
 
-        return array[:1] + cls.__flatten(array[1:])
+        for label, column in arrays.items():
+            array[label] = column
+
+        return array
+
+    def __generate_parser(self, output: _Output) -> Callable[..., Any]:
+        if output == "lazy":
+            return _generate_lazy_parser(
+                self.name,
+                self.klass,
+                self.__labels,
+                parsers=self._get_parsers(),
+                flat=self.__flat,
+                scales=self.__scales,
+            )
+
+        klass: type = self.klass
+
+        construct: _Construct = "keywords"
+
+        if output in ("slots", "frozen"):
+            klass = compact(self.klass, frozen=output == "frozen")
+        elif output == "namedtuple":
+            klass, construct = self.get_namedtuple(), "tuple"
+        elif output == "raw":
+            construct = "list"
+
+        return _generate_parser(
+            self.name,
+            klass,
+            self.__labels,
+            parsers=self._get_parsers(),
+            flat=self.__flat,
+            construct=construct,
+            scales=self.__scales,
+        )
+
+    def scale(self, **decimals: int) -> "_Serializer[T]":
+        """
+        Return a variant of this serializer which parses the given labels into
+        integers scaled by 10 ** decimals (e.g. 27000.15 -> 2700015 for 2).
+
+        Variants are created once and support every output.
+        """
+
+        for label in decimals:
+            if label not in self.get_labels():
+                raise ValueError(f"{self.name} has no label <{label}>.")
+
+        scales = tuple((label, 10 ** decimals[label]) for label in sorted(decimals))
+
+        if scales not in self.__variants:
+            variant = copy.copy(self)
+
+            variant.__setup(scales)
+
+            self.__variants[scales] = variant
+
+        return self.__variants[scales]
+
+    def get_namedtuple(self) -> type:
+        """
+        Return the named tuple built by the "namedtuple" output of this serializer.
+
+        Its instances can be pickled, but not the class, which can't be imported.
+        """
+
+        return _namedtuple(self.name, tuple(self.get_labels()))
+
+    def get_lazy_record(self) -> type:
+        """
+        Return the class of the read-only views built by the "lazy" output.
+
+        Its instances can be pickled (sub-serialized fields parsed), not the class.
+        """
+
+        return _lazy_record(
+            self.name,
+            self.klass,
+            tuple(self.__labels),
+            tuple(sorted(self._get_parsers())),
+            self.__scales,
+        )
+
+    def get_labels(self) -> List[str]:
+        return [label for _, label in self.__fields]
 
 
 class _RecursiveSerializer(_Serializer, Generic[T]):
@@ -86,18 +723,12 @@ class _RecursiveSerializer(_Serializer, Generic[T]):
         serializers: Dict[str, _Serializer[Any]],
         flat: bool = False,
     ):
-        super().__init__(name, klass, labels, flat=flat)
-
         self.serializers = serializers
 
-    def parse(self, *values: Any) -> T:
-        serialization = dict(self._serialize(*values))
-
-        for key in serialization:
-            if key in self.serializers.keys():
-                serialization[key] = self.serializers[key].parse(*serialization[key])
+        super().__init__(name, klass, labels, flat=flat)
 
-        return cast(T, self.klass(**serialization))
+    def _get_parsers(self) -> Dict[str, Callable[..., Any]]:
+        return {key: serializer.parse for key, serializer in self.serializers.items()}
 
 
 def generate_labeler_serializer(
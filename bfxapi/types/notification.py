@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Any, Generic, List, Optional, TypeVar, cast
+from typing import Any, Callable, Dict, Generic, Optional, TypeVar, cast
 
 from .labeler import _Serializer, _Type
 
@@ -32,26 +32,26 @@ class _Notification(_Serializer, Generic[T]):
     def __init__(
         self, serializer: Optional[_Serializer] = None, is_iterable: bool = False
     ):
-        super().__init__("Notification", Notification, _Notification.__LABELS)
-
         self.serializer, self.is_iterable = serializer, is_iterable
 
-    def parse(self, *values: Any) -> Notification[T]:
-        notification = cast(
-            Notification[T], Notification(**dict(self._serialize(*values)))
-        )
+        super().__init__("Notification", Notification, _Notification.__LABELS)
 
+    def _get_parsers(self) -> Dict[str, Callable[..., Any]]:
         if isinstance(self.serializer, _Serializer):
-            data = cast(List[Any], notification.data)
+            return {"data": self.__parse_data}
 
-            if not self.is_iterable:
-                if len(data) == 1 and isinstance(data[0], list):
-                    data = data[0]
+        return {}
 
-                notification.data = self.serializer.parse(*data)
-            else:
-                notification.data = cast(
-                    T, [self.serializer.parse(*sub_data) for sub_data in data]
-                )
+    def __parse_data(self, *data: Any) -> Any:
+        serializer = cast(_Serializer, self.serializer)
 
-        return notification
+        if not self.is_iterable:
+            if len(data) == 1 and isinstance(data[0], list):
+                data = tuple(data[0])
+
+            return serializer.parse(*data)
+
+        return [serializer.parse(*sub_data) for sub_data in data]
+
+    def parse(self, *values: Any) -> Notification[T]:
+        return cast(Notification[T], super().parse(*values))
@@ -1 +1,2 @@
 from ._client import BfxWebSocketClient
+from ._state import AccountSnapshot, AccountState, OrderStore
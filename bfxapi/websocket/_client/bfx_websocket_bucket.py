@@ -1,7 +1,7 @@
 import asyncio
 import json
 import uuid
-from typing import Any, Dict, List, Optional, cast
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, cast
 
 import websockets.client
 from pyee import EventEmitter
@@ -11,6 +11,9 @@ from bfxapi.websocket._connection import Connection
 from bfxapi.websocket._handlers import PublicChannelsHandler
 from bfxapi.websocket.subscriptions import Subscription
 
+if TYPE_CHECKING:
+    from bfxapi.types.labeler import _Output
+
 _CHECKSUM_FLAG_VALUE = 131_072
 
 
@@ -21,7 +24,12 @@ def _strip(message: Dict[str, Any], keys: List[str]) -> Dict[str, Any]:
 class BfxWebSocketBucket(Connection):
     __MAXIMUM_SUBSCRIPTIONS_AMOUNT = 25
 
-    def __init__(self, host: str, event_emitter: EventEmitter) -> None:
+    def __init__(
+        self,
+        host: str,
+        event_emitter: EventEmitter,
+        output: Optional["_Output"] = None,
+    ) -> None:
         super().__init__(host)
 
         self.__event_emitter = event_emitter
@@ -30,7 +38,9 @@ class BfxWebSocketBucket(Connection):
 
         self.__condition = asyncio.locks.Condition()
 
-        self.__handler = PublicChannelsHandler(event_emitter=self.__event_emitter)
+        self.__handler = PublicChannelsHandler(
+            event_emitter=self.__event_emitter, output=output
+        )
 
     @property
     def count(self) -> int:
@@ -6,18 +6,20 @@ from asyncio import Task
 from datetime import datetime
 from logging import Logger
 from socket import gaierror
-from typing import Any, Dict, List, Optional, TypedDict
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, TypedDict, Union
 
 import websockets
 import websockets.client
 from websockets.exceptions import ConnectionClosedError, InvalidStatusCode
 
+from bfxapi._utils.instrumentation import Instrumentation, get_instrumentation
 from bfxapi._utils.json_encoder import JSONEncoder
 from bfxapi._utils.post_only_enforcement import enforce_post_only
 from bfxapi.exceptions import InvalidCredentialError
 from bfxapi.websocket._connection import Connection
 from bfxapi.websocket._event_emitter import BfxEventEmitter
 from bfxapi.websocket._handlers import AuthEventsHandler
+from bfxapi.websocket._state import AccountState, OrderStore
 from bfxapi.websocket.exceptions import (
     ReconnectionTimeoutError,
     SubIdError,
@@ -28,6 +30,10 @@ from bfxapi.websocket.exceptions import (
 
 from .bfx_websocket_bucket import BfxWebSocketBucket
 from .bfx_websocket_inputs import BfxWebSocketInputs
+from .order_acknowledgements import OrderAcknowledgements
+
+if TYPE_CHECKING:
+    from bfxapi.types.labeler import _Output
 
 _Credentials = TypedDict(
     "_Credentials", {"api_key": str, "api_secret": str, "filters": Optional[List[str]]}
@@ -76,21 +82,41 @@ class BfxWebSocketClient(Connection):
         credentials: Optional[_Credentials] = None,
         timeout: Optional[int] = 60 * 15,
         logger: Logger = _DEFAULT_LOGGER,
+        output: Optional["_Output"] = None,
+        ack_timeout: float = 10.0,
+        instrumentation: Union[Instrumentation, bool] = False,
     ) -> None:
         super().__init__(host)
 
+        self.instrumentation = get_instrumentation(instrumentation)
+
         self.__credentials, self.__timeout, self.__logger = credentials, timeout, logger
 
+        self.__output = output
+
         self.__buckets: Dict[BfxWebSocketBucket, Optional[Task]] = {}
 
         self.__reconnection: Optional[_Reconnection] = None
 
         self.__event_emitter = BfxEventEmitter(loop=None)
 
-        self.__handler = AuthEventsHandler(event_emitter=self.__event_emitter)
+        self.__orders = OrderStore()
+
+        self.__account = AccountState(
+            on_error=lambda error: self.__event_emitter.emit("error", error)
+        )
+
+        acknowledgements = OrderAcknowledgements(ack_timeout, self.instrumentation)
+
+        self.__handler = AuthEventsHandler(
+            event_emitter=self.__event_emitter,
+            output=output,
+            states=[self.__orders, self.__account, acknowledgements],
+        )
 
         self.__inputs = BfxWebSocketInputs(
-            handle_websocket_input=self.__handle_websocket_input
+            handle_websocket_input=self.__handle_websocket_input,
+            acknowledgements=acknowledgements,
         )
 
         @self.__event_emitter.listens_to("error")
@@ -107,6 +133,14 @@ class BfxWebSocketClient(Connection):
     def inputs(self) -> BfxWebSocketInputs:
         return self.__inputs
 
+    @property
+    def orders(self) -> OrderStore:
+        return self.__orders
+
+    @property
+    def account(self) -> AccountState:
+        return self.__account
+
     def run(self) -> None:
         return asyncio.get_event_loop().run_until_complete(self.start())
 
@@ -179,6 +213,10 @@ class BfxWebSocketClient(Connection):
 
                     self._authentication = False
 
+                    self.__orders.invalidate()
+
+                    self.__account.invalidate()
+
                     _delay.reset()
                 elif (
                     (isinstance(error, InvalidStatusCode) and error.status_code == 408)
@@ -271,7 +309,7 @@ class BfxWebSocketClient(Connection):
                         self.__handler.handle(message[1], message[2])
 
     async def __new_bucket(self) -> BfxWebSocketBucket:
-        bucket = BfxWebSocketBucket(self._host, self.__event_emitter)
+        bucket = BfxWebSocketBucket(self._host, self.__event_emitter, self.__output)
 
         self.__buckets[bucket] = asyncio.create_task(bucket.start())
 
@@ -351,6 +389,10 @@ class BfxWebSocketClient(Connection):
         elif event == "ou" and isinstance(data, dict):  # Update order
             # FORCE POST_ONLY flag on ALL order updates - no exceptions
             data["flags"] = enforce_post_only(data.get("flags"))
+        elif event == "ox_multi" and isinstance(data, list):  # Order operations
+            for op, payload in data:
+                if op in ("on", "ou") and isinstance(payload, dict):
+                    payload["flags"] = enforce_post_only(payload.get("flags"))
 
         await self._websocket.send(json.dumps([0, event, None, data], cls=JSONEncoder))
 
@@ -1,15 +1,45 @@
 from decimal import Decimal
-from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 from bfxapi._utils.post_only_enforcement import enforce_post_only
 
+from .order_acknowledgements import OrderAcknowledgements
+
+if TYPE_CHECKING:
+    from asyncio import Future
+
 _Handler = Callable[[str, Any], Awaitable[None]]
 
+# (event, payload): new (on), update (ou), cancel (oc) or multi cancel (oc_multi)
+_Op = Tuple[str, Dict[str, Any]]
+
+_OPS = ("on", "ou", "oc", "oc_multi")
+
+# Operations accepted by Bitfinex in a single ox_multi input
+_MAX_OPS = 75
+
 
 class BfxWebSocketInputs:
-    def __init__(self, handle_websocket_input: _Handler) -> None:
+    def __init__(
+        self,
+        handle_websocket_input: _Handler,
+        acknowledgements: Optional[OrderAcknowledgements] = None,
+    ) -> None:
         self.__handle_websocket_input = handle_websocket_input
 
+        self.__acknowledgements = acknowledgements or OrderAcknowledgements()
+
     async def submit_order(
         self,
         type: str,
@@ -26,12 +56,22 @@ class BfxWebSocketInputs:
         flags: Optional[int] = None,
         tif: Optional[str] = None,
         meta: Optional[Dict[str, Any]] = None,
-    ) -> None:
-        """Submit a new order (ALWAYS post-only)."""
+        ack: bool = False,
+    ) -> Optional["Future[Any]"]:
+        """
+        Submit a new order (ALWAYS post-only).
+
+        With <ack>, return a future of the order emitted by order_new (or by
+        order_cancel, if the order was canceled right away), correlated by
+        <cid> (one is generated if needed).
+        """
         # FORCE POST_ONLY flag - no exceptions (validates order type compatibility)
         flags = enforce_post_only(flags, order_type=type)
 
-        await self.__handle_websocket_input(
+        if ack and cid is None:
+            cid = self.__acknowledgements.get_cid()
+
+        return await self.__send(
             "on",
             {
                 "type": type,
@@ -48,6 +88,9 @@ class BfxWebSocketInputs:
                 "tif": tif,
                 "meta": meta,
             },
+            ack=ack,
+            name="submit_order",
+            cid=cid,
         )
 
     async def update_order(
@@ -65,8 +108,13 @@ class BfxWebSocketInputs:
         price_aux_limit: Optional[Union[str, float, Decimal]] = None,
         price_trailing: Optional[Union[str, float, Decimal]] = None,
         tif: Optional[str] = None,
-    ) -> None:
-        """Update an existing order (ALWAYS post-only)."""
+        ack: bool = False,
+    ) -> Optional["Future[Any]"]:
+        """
+        Update an existing order (ALWAYS post-only).
+
+        With <ack>, return a future of the order emitted by order_update.
+        """
         # FORCE POST_ONLY flag on ALL order updates - no exceptions
         flags = enforce_post_only(flags)
 
@@ -85,7 +133,7 @@ class BfxWebSocketInputs:
             "flags": flags,
         }
 
-        await self.__handle_websocket_input("ou", payload)
+        return await self.__send("ou", payload, ack=ack, name="update_order", id=id)
 
     async def cancel_order(
         self,
@@ -93,9 +141,20 @@ class BfxWebSocketInputs:
         id: Optional[int] = None,
         cid: Optional[int] = None,
         cid_date: Optional[str] = None,
-    ) -> None:
-        await self.__handle_websocket_input(
-            "oc", {"id": id, "cid": cid, "cid_date": cid_date}
+        ack: bool = False,
+    ) -> Optional["Future[Any]"]:
+        """
+        Cancel an order: with <ack>, return a future of the order emitted by
+        order_cancel.
+        """
+
+        return await self.__send(
+            "oc",
+            {"id": id, "cid": cid, "cid_date": cid_date},
+            ack=ack,
+            name="cancel_order",
+            id=id,
+            cid=cid,
         )
 
     async def cancel_order_multi(
@@ -110,6 +169,69 @@ class BfxWebSocketInputs:
             "oc_multi", {"id": id, "cid": cid, "gid": gid, "all": all}
         )
 
+    async def order_multi_op(self, ops: Sequence[_Op]) -> None:
+        """
+        Send order operations, e.g. ("on", {"type": ..., "symbol": ...}), with
+        the payloads of submit_order, update_order, cancel_order and
+        cancel_order_multi, in ox_multi inputs of up to 75 operations each.
+
+        New and updated orders are ALWAYS post-only: every operation is checked
+        before the first input is sent.
+        """
+
+        batch: List[List[Any]] = []
+
+        for event, payload in ops:
+            if event not in _OPS:
+                raise ValueError(
+                    f"Unknown order operation <{event}> (available operations "
+                    f"are: {', '.join(_OPS)})."
+                )
+
+            # FORCE POST_ONLY flag on every new and updated order
+            if event == "on":
+                flags = enforce_post_only(
+                    payload.get("flags"), order_type=payload.get("type")
+                )
+
+                payload = {**payload, "flags": flags}
+            elif event == "ou":
+                payload = {**payload, "flags": enforce_post_only(payload.get("flags"))}
+
+            batch.append([event, payload])
+
+        for index in range(0, len(batch), _MAX_OPS):
+            await self.__handle_websocket_input(
+                "ox_multi", batch[index : index + _MAX_OPS]
+            )
+
+    async def __send(
+        self,
+        event: str,
+        payload: Dict[str, Any],
+        *,
+        ack: bool,
+        name: str,
+        id: Optional[int] = None,
+        cid: Optional[int] = None,
+    ) -> Optional["Future[Any]"]:
+        if not ack:
+            await self.__handle_websocket_input(event, payload)
+
+            return None
+
+        # Expected first: the acknowledgement may come before the send returns
+        future = self.__acknowledgements.expect(event, name, id=id, cid=cid)
+
+        try:
+            await self.__handle_websocket_input(event, payload)
+        except BaseException:
+            future.cancel()
+
+            raise
+
+        return future
+
     async def submit_funding_offer(
         self,
         type: str,
@@ -0,0 +1,197 @@
+import asyncio
+import time
+from functools import partial
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from bfxapi._utils.instrumentation import Instrumentation, RequestMetrics
+from bfxapi.websocket.exceptions import AcknowledgementTimeoutError, OrderRejectedError
+
+if TYPE_CHECKING:
+    from asyncio import Future, TimerHandle
+
+# ("id", id) or ("cid", cid) of an order
+_Key = Tuple[str, int]
+
+# Positions of the fields of an order, and of a notification, in their streams
+_ID, _CID = 0, 2
+
+_TYPE, _DATA, _STATUS, _TEXT = 1, 4, 6, 7
+
+# Request type of a notification -> input it rejects
+_REQUESTS = {"on-req": "on", "ou-req": "ou", "oc-req": "oc"}
+
+
+class _Pending:
+    __slots__ = ("event", "future", "metrics", "timer")
+
+    def __init__(
+        self, event: str, future: "Future[Any]", metrics: Optional[RequestMetrics]
+    ) -> None:
+        self.event, self.future, self.metrics = event, future, metrics
+
+        self.timer: Optional["TimerHandle"] = None
+
+
+class OrderAcknowledgements:
+    """
+    Futures of the order inputs (on, ou and oc) waiting for their
+    acknowledgement, correlated by cid (new orders) or id.
+
+    A new order is acknowledged by order_new, or by order_cancel when it's
+    canceled right away (e.g. a post-only order which would have matched), an
+    update by order_update and a cancellation by order_cancel; an error
+    notification of the request rejects it.
+    """
+
+    EVENTS = ("n", "on", "ou", "oc")
+
+    def __init__(
+        self, timeout: float = 10.0, instrumentation: Optional[Instrumentation] = None
+    ) -> None:
+        self.__timeout, self.__instrumentation = timeout, instrumentation
+
+        self.__pending: Dict[_Key, List[_Pending]] = {}
+
+        self.__cid = 0
+
+    def get_cid(self) -> int:
+        # Milliseconds, strictly increasing: unique within the day
+        self.__cid = max(int(time.time() * 1000), self.__cid + 1)
+
+        return self.__cid
+
+    def expect(
+        self,
+        event: str,
+        name: str,
+        *,
+        id: Optional[int] = None,
+        cid: Optional[int] = None,
+    ) -> "Future[Any]":
+        """
+        Future of the acknowledgement of the input <event> (sent by the method
+        <name>), to create before the input is sent.
+        """
+
+        key: _Key
+
+        if id is not None:
+            key = ("id", id)
+        elif cid is not None:
+            key = ("cid", cid)
+        else:
+            raise ValueError("An order needs an id or a cid to be acknowledged.")
+
+        loop = asyncio.get_running_loop()
+
+        metrics: Optional[RequestMetrics] = None
+
+        if self.__instrumentation is not None:
+            metrics = RequestMetrics("ws", event, name=name)
+
+        pending = _Pending(event, loop.create_future(), metrics)
+
+        pending.timer = loop.call_later(self.__timeout, self.__expire, key, pending)
+
+        pending.future.add_done_callback(partial(self.__discard, key, pending))
+
+        self.__pending.setdefault(key, []).append(pending)
+
+        return pending.future
+
+    def update(self, event: str, stream: Any, data: Any) -> None:
+        if event == "on":
+            self.__settle(("cid", stream[_CID]), ("on",), data)
+        elif event == "ou":
+            self.__settle(("id", stream[_ID]), ("ou",), data)
+        elif event == "oc":
+            # Once an order is closed, every input waiting for it is over
+            self.__settle(("id", stream[_ID]), ("ou", "oc"), data, every=True)
+
+            self.__settle(("cid", stream[_CID]), ("on", "oc"), data, every=True)
+        elif event == "n":
+            self.__reject(stream)
+
+    def __reject(self, stream: Any) -> None:
+        if len(stream) <= _TEXT or stream[_STATUS] not in ("ERROR", "FAILURE"):
+            return
+
+        if stream[_TYPE] not in _REQUESTS or not isinstance(stream[_DATA], list):
+            return
+
+        order = stream[_DATA]
+
+        # The order may be wrapped in a list, which _Notification unwraps too
+        if len(order) == 1 and isinstance(order[0], list):
+            order = order[0]
+
+        if len(order) <= _CID:
+            return
+
+        inputs, text = (_REQUESTS[stream[_TYPE]],), stream[_TEXT]
+
+        error = OrderRejectedError(
+            f"Bitfinex rejected the <{inputs[0]}> input of the order "
+            f"(id: {order[_ID]}, cid: {order[_CID]}): {text}"
+        )
+
+        if not self.__settle(("id", order[_ID]), inputs, error=error):
+            self.__settle(("cid", order[_CID]), inputs, error=error)
+
+    def __settle(
+        self,
+        key: _Key,
+        inputs: Tuple[str, ...],
+        data: Any = None,
+        *,
+        error: Optional[Exception] = None,
+        every: bool = False,
+    ) -> bool:
+        settled = False
+
+        for pending in list(self.__pending.get(key, ())):
+            if pending.event in inputs:
+                self.__finish(key, pending, data, error)
+
+                settled = True
+
+                if not every:
+                    break
+
+        return settled
+
+    def __expire(self, key: _Key, pending: _Pending) -> None:
+        id = f"id: {key[1]}" if key[0] == "id" else f"cid: {key[1]}"
+
+        error = AcknowledgementTimeoutError(
+            f"The <{pending.event}> input of the order ({id}) wasn't acknowledged "
+            f"within {self.__timeout} seconds: it may or may not have been executed."
+        )
+
+        self.__finish(key, pending, None, error)
+
+    def __finish(
+        self, key: _Key, pending: _Pending, data: Any, error: Optional[Exception]
+    ) -> None:
+        self.__discard(key, pending)
+
+        if pending.future.done():
+            return
+
+        if error is not None:
+            pending.future.set_exception(error)
+        else:
+            pending.future.set_result(data)
+
+        if pending.metrics is not None and self.__instrumentation is not None:
+            self.__instrumentation.finish(pending.metrics, error)
+
+    def __discard(self, key: _Key, pending: _Pending, *_: Any) -> None:
+        if pending.timer is not None:
+            pending.timer.cancel()
+
+        if (pendings := self.__pending.get(key)) and pending in pendings:
+            pendings.remove(pending)
+
+            if not pendings:
+                del self.__pending[key]
@@ -2,13 +2,13 @@ import hashlib
 import hmac
 import json
 from abc import ABC, abstractmethod
-from datetime import datetime
 from functools import wraps
 from typing import Any, Awaitable, Callable, Dict, List, Optional, TypeVar, cast
 
 from typing_extensions import Concatenate, ParamSpec
 from websockets.client import WebSocketClientProtocol
 
+from bfxapi._utils.nonce import get_nonce
 from bfxapi.websocket.exceptions import ActionRequiresAuthentication, ConnectionNotOpen
 
 _S = TypeVar("_S", bound="Connection")
@@ -88,7 +88,7 @@ class Connection(ABC):
             "apiKey": api_key,
         }
 
-        message["authNonce"] = round(datetime.now().timestamp() * 1_000_000)
+        message["authNonce"] = get_nonce()
 
         message["authPayload"] = f"AUTH{message['authNonce']}"
 
@@ -1,94 +1,156 @@
-from typing import Any, Dict, Tuple
+from contextvars import Context, copy_context
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 from pyee.base import EventEmitter
 
-from bfxapi.types import serializers
+from bfxapi.types import serializers, use_output
 from bfxapi.types.dataclasses import FundingOffer, Order
 from bfxapi.types.serializers import _Notification
 
+if TYPE_CHECKING:
+    from bfxapi.types.labeler import _Output
+    from bfxapi.websocket._client.order_acknowledgements import OrderAcknowledgements
+    from bfxapi.websocket._state import AccountState, OrderStore
+
+_State = Union["OrderStore", "AccountState", "OrderAcknowledgements"]
+
+_Update = Callable[[str, Any, Any], None]
+
 
 class AuthEventsHandler:
-    __ABBREVIATIONS = {
-        "os": "order_snapshot",
-        "on": "order_new",
-        "ou": "order_update",
-        "oc": "order_cancel",
-        "ps": "position_snapshot",
-        "pn": "position_new",
-        "pu": "position_update",
-        "pc": "position_close",
-        "te": "trade_execution",
-        "tu": "trade_execution_update",
-        "fos": "funding_offer_snapshot",
-        "fon": "funding_offer_new",
-        "fou": "funding_offer_update",
-        "foc": "funding_offer_cancel",
-        "fcs": "funding_credit_snapshot",
-        "fcn": "funding_credit_new",
-        "fcu": "funding_credit_update",
-        "fcc": "funding_credit_close",
-        "fls": "funding_loan_snapshot",
-        "fln": "funding_loan_new",
-        "flu": "funding_loan_update",
-        "flc": "funding_loan_close",
-        "ws": "wallet_snapshot",
-        "wu": "wallet_update",
-        "fiu": "funding_info_update",
-        "bu": "balance_update",
+    # Abbreviation -> (event, serializer, is snapshot)
+    __EVENTS: Dict[str, Tuple[str, serializers._Serializer, bool]] = {
+        "os": ("order_snapshot", serializers.Order, True),
+        "on": ("order_new", serializers.Order, False),
+        "ou": ("order_update", serializers.Order, False),
+        "oc": ("order_cancel", serializers.Order, False),
+        "ps": ("position_snapshot", serializers.Position, True),
+        "pn": ("position_new", serializers.Position, False),
+        "pu": ("position_update", serializers.Position, False),
+        "pc": ("position_close", serializers.Position, False),
+        "te": ("trade_execution", serializers.Trade, False),
+        "tu": ("trade_execution_update", serializers.Trade, False),
+        "fos": ("funding_offer_snapshot", serializers.FundingOffer, True),
+        "fon": ("funding_offer_new", serializers.FundingOffer, False),
+        "fou": ("funding_offer_update", serializers.FundingOffer, False),
+        "foc": ("funding_offer_cancel", serializers.FundingOffer, False),
+        "fcs": ("funding_credit_snapshot", serializers.FundingCredit, True),
+        "fcn": ("funding_credit_new", serializers.FundingCredit, False),
+        "fcu": ("funding_credit_update", serializers.FundingCredit, False),
+        "fcc": ("funding_credit_close", serializers.FundingCredit, False),
+        "fls": ("funding_loan_snapshot", serializers.FundingLoan, True),
+        "fln": ("funding_loan_new", serializers.FundingLoan, False),
+        "flu": ("funding_loan_update", serializers.FundingLoan, False),
+        "flc": ("funding_loan_close", serializers.FundingLoan, False),
+        "ws": ("wallet_snapshot", serializers.Wallet, True),
+        "wu": ("wallet_update", serializers.Wallet, False),
+        "fiu": ("funding_info_update", serializers.FundingInfo, False),
+        "bu": ("balance_update", serializers.BalanceInfo, False),
+    }
+
+    # Margin info type -> (event, serializer)
+    __MARGINS: Dict[str, Tuple[str, serializers._Serializer]] = {
+        "base": ("base_margin_info", serializers.BaseMarginInfo),
+        "sym": ("symbol_margin_info", serializers.SymbolMarginInfo),
     }
 
-    __SERIALIZERS: Dict[Tuple[str, ...], serializers._Serializer] = {
-        ("os", "on", "ou", "oc"): serializers.Order,
-        ("ps", "pn", "pu", "pc"): serializers.Position,
-        ("te", "tu"): serializers.Trade,
-        ("fos", "fon", "fou", "foc"): serializers.FundingOffer,
-        ("fcs", "fcn", "fcu", "fcc"): serializers.FundingCredit,
-        ("fls", "fln", "flu", "flc"): serializers.FundingLoan,
-        ("ws", "wu"): serializers.Wallet,
-        ("fiu",): serializers.FundingInfo,
-        ("bu",): serializers.BalanceInfo,
+    __NOTIFICATION: _Notification[None] = _Notification[None](serializer=None)
+
+    # Request type -> (event, notification serializer)
+    __NOTIFICATIONS: Dict[str, Tuple[str, _Notification]] = {
+        "on-req": ("on-req-notification", _Notification[Order](serializers.Order)),
+        "ou-req": ("ou-req-notification", _Notification[Order](serializers.Order)),
+        "oc-req": ("oc-req-notification", _Notification[Order](serializers.Order)),
+        "fon-req": (
+            "fon-req-notification",
+            _Notification[FundingOffer](serializers.FundingOffer),
+        ),
+        "foc-req": (
+            "foc-req-notification",
+            _Notification[FundingOffer](serializers.FundingOffer),
+        ),
     }
 
-    def __init__(self, event_emitter: EventEmitter) -> None:
-        self.__event_emitter = event_emitter
+    def __init__(
+        self,
+        event_emitter: EventEmitter,
+        output: Optional["_Output"] = None,
+        states: Sequence[_State] = (),
+    ) -> None:
+        self.__event_emitter, self.__output = event_emitter, output
+
+        # Abbreviation -> updates of the states kept from its events
+        self.__updates: Dict[str, List[_Update]] = {}
+
+        for state in states:
+            for abbrevation in state.EVENTS:
+                self.__updates.setdefault(abbrevation, []).append(state.update)
+
+        # Context of the caller, in which listeners are called
+        self.__context: Optional[Context] = None
 
     def handle(self, abbrevation: str, stream: Any) -> None:
-        if abbrevation == "n":
-            self.__notification(stream)
-        elif abbrevation == "miu":
-            if stream[0] == "base":
-                self.__event_emitter.emit(
-                    "base_margin_info", serializers.BaseMarginInfo.parse(*stream)
-                )
-            elif stream[0] == "sym":
-                self.__event_emitter.emit(
-                    "symbol_margin_info", serializers.SymbolMarginInfo.parse(*stream)
-                )
-        else:
-            for abbrevations, serializer in AuthEventsHandler.__SERIALIZERS.items():
-                if abbrevation in abbrevations:
-                    event = AuthEventsHandler.__ABBREVIATIONS[abbrevation]
+        if self.__output:
+            context, self.__context = self.__context, copy_context()
 
-                    if all(isinstance(sub_stream, list) for sub_stream in stream):
-                        data = [serializer.parse(*sub_stream) for sub_stream in stream]
-                    else:
-                        data = serializer.parse(*stream)
+            try:
+                with use_output(self.__output):
+                    return self.__handle(abbrevation, stream)
+            finally:
+                self.__context = context
 
-                    self.__event_emitter.emit(event, data)
+        self.__handle(abbrevation, stream)
 
-    def __notification(self, stream: Any) -> None:
-        event: str = "notification"
+    def __handle(self, abbrevation: str, stream: Any) -> None:
+        if handler := AuthEventsHandler.__EVENTS.get(abbrevation):
+            event, serializer, is_snapshot = handler
 
-        serializer: _Notification = _Notification[None](serializer=None)
+            if is_snapshot:
+                data = [serializer.parse(*sub_stream) for sub_stream in stream]
+            else:
+                data = serializer.parse(*stream)
 
-        if stream[1] in ("on-req", "ou-req", "oc-req"):
-            event, serializer = f"{stream[1]}-notification", _Notification[Order](
-                serializer=serializers.Order
-            )
+            self.__emit(abbrevation, stream, event, data)
+        elif abbrevation == "n":
+            self.__notification(stream)
+        elif abbrevation == "miu" and (
+            margin := AuthEventsHandler.__MARGINS.get(stream[0])
+        ):
+            event, serializer = margin
 
-        if stream[1] in ("fon-req", "foc-req"):
-            event, serializer = f"{stream[1]}-notification", _Notification[
-                FundingOffer
-            ](serializer=serializers.FundingOffer)
+            self.__emit(abbrevation, stream, event, serializer.parse(*stream))
+
+    def __emit(self, abbrevation: str, stream: Any, event: str, data: Any) -> None:
+        # Listeners (and the tasks they start) don't inherit the output
+        if self.__context is not None:
+            self.__context.run(self.__dispatch, abbrevation, stream, event, data)
+        else:
+            self.__dispatch(abbrevation, stream, event, data)
+
+    def __dispatch(self, abbrevation: str, stream: Any, event: str, data: Any) -> None:
+        # States are up to date by the time listeners are called
+        for update in self.__updates.get(abbrevation, ()):
+            # A failing state (or listener of a state) doesn't stop the others
+            try:
+                update(abbrevation, stream, data)
+            except Exception as error:
+                self.__event_emitter.emit("error", error)
+
+        self.__event_emitter.emit(event, data)
+
+    def __notification(self, stream: Any) -> None:
+        event, serializer = AuthEventsHandler.__NOTIFICATIONS.get(
+            stream[1], ("notification", AuthEventsHandler.__NOTIFICATION)
+        )
 
-        self.__event_emitter.emit(event, serializer.parse(*stream))
+        self.__emit("n", stream, event, serializer.parse(*stream))
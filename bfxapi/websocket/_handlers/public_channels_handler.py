@@ -1,8 +1,10 @@
-from typing import Any, List, cast
+from contextvars import Context, copy_context
+from typing import TYPE_CHECKING, Any, List, Optional, cast
 
 from pyee.base import EventEmitter
 
-from bfxapi.types import serializers
+from bfxapi.types import serializers, use_output
+from bfxapi.types.fixed_point import _scaled
 from bfxapi.websocket.subscriptions import (
     Book,
     Candles,
@@ -12,14 +14,41 @@ from bfxapi.websocket.subscriptions import (
     Trades,
 )
 
+if TYPE_CHECKING:
+    from bfxapi.types.labeler import _Output
+
 _CHECKSUM = "cs"
 
 
 class PublicChannelsHandler:
-    def __init__(self, event_emitter: EventEmitter) -> None:
-        self.__event_emitter = event_emitter
+    def __init__(
+        self, event_emitter: EventEmitter, output: Optional["_Output"] = None
+    ) -> None:
+        self.__event_emitter, self.__output = event_emitter, output
+
+        # Context of the caller, in which listeners are called
+        self.__context: Optional[Context] = None
 
     def handle(self, subscription: Subscription, stream: List[Any]) -> None:
+        if self.__output:
+            context, self.__context = self.__context, copy_context()
+
+            try:
+                with use_output(self.__output):
+                    return self.__handle(subscription, stream)
+            finally:
+                self.__context = context
+
+        self.__handle(subscription, stream)
+
+    def __emit(self, event: str, *args: Any) -> bool:
+        # Listeners (and the tasks they start) don't inherit the output
+        if self.__context is not None:
+            return self.__context.run(self.__event_emitter.emit, event, *args)
+
+        return self.__event_emitter.emit(event, *args)
+
+    def __handle(self, subscription: Subscription, stream: List[Any]) -> None:
         if subscription["channel"] == "ticker":
             self.__ticker_channel_handler(cast(Ticker, subscription), stream)
         elif subscription["channel"] == "trades":
@@ -41,14 +70,14 @@ class PublicChannelsHandler:
 
     def __ticker_channel_handler(self, subscription: Ticker, stream: List[Any]):
         if subscription["symbol"].startswith("t"):
-            return self.__event_emitter.emit(
+            return self.__emit(
                 "t_ticker_update",
                 subscription,
                 serializers.TradingPairTicker.parse(*stream[0]),
             )
 
         if subscription["symbol"].startswith("f"):
-            return self.__event_emitter.emit(
+            return self.__emit(
                 "f_ticker_update",
                 subscription,
                 serializers.FundingCurrencyTicker.parse(*stream[0]),
@@ -64,31 +93,32 @@ class PublicChannelsHandler:
             }
 
             if subscription["symbol"].startswith("t"):
-                return self.__event_emitter.emit(
-                    events[event],
-                    subscription,
-                    serializers.TradingPairTrade.parse(*stream[1]),
+                serializer = _scaled(
+                    serializers.TradingPairTrade, subscription["symbol"]
+                )
+
+                return self.__emit(
+                    events[event], subscription, serializer.parse(*stream[1])
                 )
 
             if subscription["symbol"].startswith("f"):
-                return self.__event_emitter.emit(
+                return self.__emit(
                     events[event],
                     subscription,
                     serializers.FundingCurrencyTrade.parse(*stream[1]),
                 )
 
         if subscription["symbol"].startswith("t"):
-            return self.__event_emitter.emit(
+            serializer = _scaled(serializers.TradingPairTrade, subscription["symbol"])
+
+            return self.__emit(
                 "t_trades_snapshot",
                 subscription,
-                [
-                    serializers.TradingPairTrade.parse(*sub_stream)
-                    for sub_stream in stream[0]
-                ],
+                [serializer.parse(*sub_stream) for sub_stream in stream[0]],
             )
 
         if subscription["symbol"].startswith("f"):
-            return self.__event_emitter.emit(
+            return self.__emit(
                 "f_trades_snapshot",
                 subscription,
                 [
@@ -99,25 +129,22 @@ class PublicChannelsHandler:
 
     def __book_channel_handler(self, subscription: Book, stream: List[Any]):
         if subscription["symbol"].startswith("t"):
+            serializer = _scaled(serializers.TradingPairBook, subscription["symbol"])
+
             if all(isinstance(sub_stream, list) for sub_stream in stream[0]):
-                return self.__event_emitter.emit(
+                return self.__emit(
                     "t_book_snapshot",
                     subscription,
-                    [
-                        serializers.TradingPairBook.parse(*sub_stream)
-                        for sub_stream in stream[0]
-                    ],
+                    [serializer.parse(*sub_stream) for sub_stream in stream[0]],
                 )
 
-            return self.__event_emitter.emit(
-                "t_book_update",
-                subscription,
-                serializers.TradingPairBook.parse(*stream[0]),
+            return self.__emit(
+                "t_book_update", subscription, serializer.parse(*stream[0])
             )
 
         if subscription["symbol"].startswith("f"):
             if all(isinstance(sub_stream, list) for sub_stream in stream[0]):
-                return self.__event_emitter.emit(
+                return self.__emit(
                     "f_book_snapshot",
                     subscription,
                     [
@@ -126,7 +153,7 @@ class PublicChannelsHandler:
                     ],
                 )
 
-            return self.__event_emitter.emit(
+            return self.__emit(
                 "f_book_update",
                 subscription,
                 serializers.FundingCurrencyBook.parse(*stream[0]),
@@ -134,25 +161,22 @@ class PublicChannelsHandler:
 
     def __raw_book_channel_handler(self, subscription: Book, stream: List[Any]):
         if subscription["symbol"].startswith("t"):
+            serializer = _scaled(serializers.TradingPairRawBook, subscription["symbol"])
+
             if all(isinstance(sub_stream, list) for sub_stream in stream[0]):
-                return self.__event_emitter.emit(
+                return self.__emit(
                     "t_raw_book_snapshot",
                     subscription,
-                    [
-                        serializers.TradingPairRawBook.parse(*sub_stream)
-                        for sub_stream in stream[0]
-                    ],
+                    [serializer.parse(*sub_stream) for sub_stream in stream[0]],
                 )
 
-            return self.__event_emitter.emit(
-                "t_raw_book_update",
-                subscription,
-                serializers.TradingPairRawBook.parse(*stream[0]),
+            return self.__emit(
+                "t_raw_book_update", subscription, serializer.parse(*stream[0])
             )
 
         if subscription["symbol"].startswith("f"):
             if all(isinstance(sub_stream, list) for sub_stream in stream[0]):
-                return self.__event_emitter.emit(
+                return self.__emit(
                     "f_raw_book_snapshot",
                     subscription,
                     [
@@ -161,7 +185,7 @@ class PublicChannelsHandler:
                     ],
                 )
 
-            return self.__event_emitter.emit(
+            return self.__emit(
                 "f_raw_book_update",
                 subscription,
                 serializers.FundingCurrencyRawBook.parse(*stream[0]),
@@ -169,30 +193,30 @@ class PublicChannelsHandler:
 
     def __candles_channel_handler(self, subscription: Candles, stream: List[Any]):
         if all(isinstance(sub_stream, list) for sub_stream in stream[0]):
-            return self.__event_emitter.emit(
+            return self.__emit(
                 "candles_snapshot",
                 subscription,
                 [serializers.Candle.parse(*sub_stream) for sub_stream in stream[0]],
             )
 
-        return self.__event_emitter.emit(
+        return self.__emit(
             "candles_update", subscription, serializers.Candle.parse(*stream[0])
         )
 
     def __status_channel_handler(self, subscription: Status, stream: List[Any]):
         if subscription["key"].startswith("deriv:"):
-            return self.__event_emitter.emit(
+            return self.__emit(
                 "derivatives_status_update",
                 subscription,
                 serializers.DerivativesStatus.parse(*stream[0]),
             )
 
         if subscription["key"].startswith("liq:"):
-            return self.__event_emitter.emit(
+            return self.__emit(
                 "liquidation_feed_update",
                 subscription,
                 serializers.Liquidation.parse(*stream[0][0]),
             )
 
     def __checksum_handler(self, subscription: Book, value: int):
-        return self.__event_emitter.emit("checksum", subscription, value & 0xFFFFFFFF)
+        return self.__emit("checksum", subscription, value & 0xFFFFFFFF)
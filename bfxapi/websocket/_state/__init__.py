@@ -0,0 +1,2 @@
+from .account_state import AccountSnapshot, AccountState
+from .order_store import OrderStore
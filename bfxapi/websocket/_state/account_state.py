@@ -0,0 +1,233 @@
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# (kind, *ids), e.g. ("wallet", "exchange", "USD") or ("position", 142031)
+_Key = Tuple[Any, ...]
+
+_Listener = Callable[[_Key, Any], None]
+
+_ErrorHandler = Callable[[Exception], Any]
+
+# Position of the id in the raw stream of a position
+_POSITION_ID = 11
+
+
+@dataclass(frozen=True)
+class AccountSnapshot:
+    """
+    State of the account at a point in time: wallets by (type, currency),
+    positions by id, funding and margin info by symbol.
+    """
+
+    wallets: Dict[Tuple[str, str], Any]
+    positions: Dict[int, Any]
+    balance: Optional[Any]
+    funding_info: Dict[str, Any]
+    base_margin: Optional[Any]
+    symbol_margins: Dict[str, Any]
+
+
+class AccountState:
+    """
+    Wallets, positions, balance, funding and margin info of the authenticated
+    channel, as emitted by the client (in its output).
+
+    Listeners are called with each key that changed and its new record (None
+    once a position is closed, or a wallet missing from a new snapshot):
+
+    - ("wallet", wallet_type, currency)
+    - ("position", position_id)
+    - ("balance",)
+    - ("funding_info", symbol)
+    - ("margin",) for the base margin info, ("margin", symbol) for a symbol
+
+    A listener which raises doesn't stop the others: its exception is passed
+    to <on_error> or, by default, the first one is raised once every listener
+    was called.
+    """
+
+    EVENTS = ("ws", "wu", "ps", "pn", "pu", "pc", "bu", "fiu", "miu")
+
+    def __init__(self, on_error: Optional[_ErrorHandler] = None) -> None:
+        self.__on_error = on_error
+
+        self.__wallets: Dict[Tuple[str, str], Any] = {}
+
+        self.__positions: Dict[int, Any] = {}
+
+        self.__balance: Optional[Any] = None
+
+        self.__funding_info: Dict[str, Any] = {}
+
+        self.__base_margin: Optional[Any] = None
+
+        self.__symbol_margins: Dict[str, Any] = {}
+
+        # Key (or None, for every key) -> listeners
+        self.__listeners: Dict[Optional[_Key], List[_Listener]] = {}
+
+        # Snapshots still expected since the connection was lost
+        self.__pending = {"ws", "ps"}
+
+        self.__lock = threading.Lock()
+
+    @property
+    def synced(self) -> bool:
+        return not self.__pending
+
+    def get_wallet(self, wallet_type: str, currency: str) -> Optional[Any]:
+        return self.__wallets.get((wallet_type, currency))
+
+    def get_position(self, position_id: int) -> Optional[Any]:
+        return self.__positions.get(position_id)
+
+    def get_balance(self) -> Optional[Any]:
+        return self.__balance
+
+    def get_funding_info(self, symbol: str) -> Optional[Any]:
+        return self.__funding_info.get(symbol)
+
+    def get_margin(self, symbol: Optional[str] = None) -> Optional[Any]:
+        """
+        Margin info of <symbol> or, by default, the base margin info.
+        """
+
+        if symbol is None:
+            return self.__base_margin
+
+        return self.__symbol_margins.get(symbol)
+
+    def snapshot(self) -> AccountSnapshot:
+        with self.__lock:
+            return AccountSnapshot(
+                wallets=dict(self.__wallets),
+                positions=dict(self.__positions),
+                balance=self.__balance,
+                funding_info=dict(self.__funding_info),
+                base_margin=self.__base_margin,
+                symbol_margins=dict(self.__symbol_margins),
+            )
+
+    def add_listener(self, key: Optional[_Key], listener: _Listener) -> None:
+        """
+        Call <listener> when the record of <key> (or, for None, any record)
+        changes, from the thread of the client, before its event is emitted.
+        """
+
+        with self.__lock:
+            self.__listeners.setdefault(key, []).append(listener)
+
+    def remove_listener(self, key: Optional[_Key], listener: _Listener) -> None:
+        with self.__lock:
+            self.__listeners[key].remove(listener)
+
+            if not self.__listeners[key]:
+                del self.__listeners[key]
+
+    def invalidate(self) -> None:
+        self.__pending = {"ws", "ps"}
+
+    def update(self, event: str, stream: Any, data: Any) -> None:
+        """
+        Apply an event of the authenticated channel: <stream> is the record (or
+        records, for a snapshot) as sent by Bitfinex, and <data> as parsed.
+        """
+
+        with self.__lock:
+            changes = self.__update(event, stream, data)
+
+            listeners = [
+                (key, record, listener)
+                for key, record in changes
+                for listener in (
+                    *self.__listeners.get(key, ()),
+                    *self.__listeners.get(None, ()),
+                )
+            ]
+
+        errors: List[Exception] = []
+
+        for key, record, listener in listeners:
+            try:
+                listener(key, record)
+            except Exception as error:
+                if self.__on_error is None:
+                    errors.append(error)
+                else:
+                    self.__on_error(error)
+
+        if errors:
+            raise errors[0]
+
+    def __update(self, event: str, stream: Any, data: Any) -> List[Tuple[_Key, Any]]:
+        if event == "ws":
+            self.__pending.discard(event)
+
+            wallets = {
+                (wallet[0], wallet[1]): record for wallet, record in zip(stream, data)
+            }
+
+            return self.__replace("wallet", self.__wallets, wallets)
+
+        if event == "wu":
+            self.__wallets[(stream[0], stream[1])] = data
+
+            return [(("wallet", stream[0], stream[1]), data)]
+
+        if event == "ps":
+            self.__pending.discard(event)
+
+            positions = {
+                position[_POSITION_ID]: record for position, record in zip(stream, data)
+            }
+
+            return self.__replace("position", self.__positions, positions)
+
+        if event == "pc":
+            self.__positions.pop(stream[_POSITION_ID], None)
+
+            return [(("position", stream[_POSITION_ID]), None)]
+
+        if event in ("pn", "pu"):
+            self.__positions[stream[_POSITION_ID]] = data
+
+            return [(("position", stream[_POSITION_ID]), data)]
+
+        if event == "bu":
+            self.__balance = data
+
+            return [(("balance",), data)]
+
+        if event == "fiu":
+            self.__funding_info[stream[1]] = data
+
+            return [(("funding_info", stream[1]), data)]
+
+        if stream[0] == "base":
+            self.__base_margin = data
+
+            return [(("margin",), data)]
+
+        self.__symbol_margins[stream[1]] = data
+
+        return [(("margin", stream[1]), data)]
+
+    @staticmethod
+    def __replace(
+        kind: str, records: Dict[Any, Any], snapshot: Dict[Any, Any]
+    ) -> List[Tuple[_Key, Any]]:
+        removed = [id for id in records if id not in snapshot]
+
+        records.clear()
+
+        records.update(snapshot)
+
+        return [
+            *((AccountState.__get_key(kind, id), None) for id in removed),
+            *((AccountState.__get_key(kind, id), r) for id, r in snapshot.items()),
+        ]
+
+    @staticmethod
+    def __get_key(kind: str, id: Any) -> _Key:
+        return (kind, *id) if isinstance(id, tuple) else (kind, id)
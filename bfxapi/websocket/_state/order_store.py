@@ -0,0 +1,159 @@
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+# Positions of the fields indexed in the raw stream of an order
+_ID, _GID, _CID, _SYMBOL, _MTS_CREATE = 0, 1, 2, 3, 4
+
+
+def _get_cid_date(mts: int) -> str:
+    # Client order ids are unique per day (UTC) of creation
+    return time.strftime("%Y-%m-%d", time.gmtime(mts / 1000))
+
+
+class OrderStore:
+    """
+    Open orders of the authenticated channel, as emitted by the client (in its
+    output), indexed by id, cid (and cid_date), gid and symbol.
+
+    The store is replaced by each order snapshot (sent after authenticating,
+    on every connection): <synced> is False from the time the connection is
+    lost until then, while the orders kept may be outdated.
+    """
+
+    EVENTS = ("os", "on", "ou", "oc")
+
+    def __init__(self) -> None:
+        self.__orders: Dict[int, Any] = {}
+
+        # Id -> (gid, cid, cid_date, symbol) of each order, to unindex it
+        self.__keys: Dict[int, Tuple[Optional[int], int, str, str]] = {}
+
+        # Cid -> cid_date -> id
+        self.__cids: Dict[int, Dict[str, int]] = {}
+
+        # Dicts used as ordered sets of ids
+        self.__gids: Dict[int, Dict[int, None]] = {}
+
+        self.__symbols: Dict[str, Dict[int, None]] = {}
+
+        self.__synced = False
+
+        self.__lock = threading.Lock()
+
+    @property
+    def synced(self) -> bool:
+        return self.__synced
+
+    def __len__(self) -> int:
+        return len(self.__orders)
+
+    def __contains__(self, id: int) -> bool:
+        return id in self.__orders
+
+    def get(self, id: int) -> Optional[Any]:
+        return self.__orders.get(id)
+
+    def get_by_cid(self, cid: int, cid_date: Optional[str] = None) -> Optional[Any]:
+        """
+        Order with the given client order id, created on <cid_date> (e.g.
+        2023-03-16) or, by default, the latest one.
+        """
+
+        with self.__lock:
+            if not (dates := self.__cids.get(cid)):
+                return None
+
+            if (id := dates.get(cid_date or max(dates))) is None:
+                return None
+
+            return self.__orders[id]
+
+    def get_by_gid(self, gid: int) -> List[Any]:
+        with self.__lock:
+            return [self.__orders[id] for id in self.__gids.get(gid, ())]
+
+    def get_by_symbol(self, symbol: str) -> List[Any]:
+        with self.__lock:
+            return [self.__orders[id] for id in self.__symbols.get(symbol, ())]
+
+    def get_all(self) -> List[Any]:
+        with self.__lock:
+            return list(self.__orders.values())
+
+    def invalidate(self) -> None:
+        self.__synced = False
+
+    def update(self, event: str, stream: Any, data: Any) -> None:
+        """
+        Apply an event of the authenticated channel: <stream> is the order (or
+        orders, for a snapshot) as sent by Bitfinex, and <data> as parsed.
+        """
+
+        with self.__lock:
+            if event == "os":
+                self.__clear()
+
+                for order, record in zip(stream, data):
+                    self.__add(order, record)
+
+                self.__synced = True
+            elif event == "oc":
+                self.__remove(stream[_ID])
+            else:
+                self.__remove(stream[_ID])
+
+                self.__add(stream, data)
+
+    def __clear(self) -> None:
+        self.__orders.clear()
+
+        self.__keys.clear()
+
+        self.__cids.clear()
+
+        self.__gids.clear()
+
+        self.__symbols.clear()
+
+    def __add(self, order: Sequence[Any], record: Any) -> None:
+        id, gid, cid, symbol = order[_ID], order[_GID], order[_CID], order[_SYMBOL]
+
+        cid_date = _get_cid_date(order[_MTS_CREATE])
+
+        self.__orders[id], self.__keys[id] = record, (gid, cid, cid_date, symbol)
+
+        self.__cids.setdefault(cid, {})[cid_date] = id
+
+        if gid is not None:
+            self.__gids.setdefault(gid, {})[id] = None
+
+        self.__symbols.setdefault(symbol, {})[id] = None
+
+    def __remove(self, id: int) -> None:
+        if (keys := self.__keys.pop(id, None)) is None:
+            return
+
+        gid, cid, cid_date, symbol = keys
+
+        del self.__orders[id]
+
+        if (dates := self.__cids[cid]).get(cid_date) == id:
+            del dates[cid_date]
+
+            if not dates:
+                del self.__cids[cid]
+
+        if gid is not None:
+            OrderStore.__discard(self.__gids, gid, id)
+
+        OrderStore.__discard(self.__symbols, symbol, id)
+
+    @staticmethod
+    def __discard(index: Dict[Any, Dict[int, None]], key: Any, id: int) -> None:
+        ids = index[key]
+
+        del ids[id]
+
+        if not ids:
+            del index[key]
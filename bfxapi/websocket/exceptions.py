@@ -31,3 +31,11 @@ class UnknownEventError(BfxBaseException):
 
 class UnknownSubscriptionError(BfxBaseException):
     pass
+
+
+class OrderRejectedError(BfxBaseException):
+    pass
+
+
+class AcknowledgementTimeoutError(BfxBaseException):
+    pass
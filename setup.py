@@ -49,6 +49,7 @@ setup(
         "bfxapi.websocket._client",
         "bfxapi.websocket._handlers",
         "bfxapi.websocket._event_emitter",
+        "bfxapi.websocket._state",
         "bfxapi.rest",
         "bfxapi.rest._interface",
         "bfxapi.rest._interfaces",
@@ -61,7 +62,13 @@ setup(
     extras_require={
         "typing": [
             "types-requests~=2.32.0.20241016",
-        ]
+        ],
+        "numpy": [
+            "numpy>=1.21",
+        ],
+        "async": [
+            "aiohttp>=3.9",
+        ],
     },
     python_requires=">=3.8",
     package_data={"bfxapi": ["py.typed"]},
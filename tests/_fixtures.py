@@ -0,0 +1,54 @@
+"""
+Records shared by the tests, as sent by Bitfinex.
+"""
+
+from typing import Any, List
+
+ORDER = [
+    1747566428,
+    1678988263842,
+    1678988263842,
+    "tBTCUSD",
+    1678988263842,
+    1678988263842,
+    0.001,
+    0.001,
+    "EXCHANGE LIMIT",
+    None,
+    None,
+    None,
+    4096,
+    "ACTIVE",
+    None,
+    None,
+    27000.0,
+    0,
+    0,
+    0,
+    None,
+    None,
+    None,
+    0,
+    0,
+    None,
+    None,
+    None,
+    "API>BFX",
+    None,
+    None,
+    {},
+]
+
+WALLET = ["exchange", "USD", 100.0, 0, 90.0, None, None]
+
+# [ID, MTS, AMOUNT, PRICE], newest first: three trades share the MTS 6
+HISTORY = [
+    [id, mts, 1.0, 100.0] for id, mts in zip(range(8, 0, -1), [8, 7, 6, 6, 6, 5, 4, 4])
+]
+
+
+def get_history(end: Any = None, limit: Any = None, **params: Any) -> List[Any]:
+    # Trades until <end> (inclusive), like the history endpoints of Bitfinex
+    trades = [trade for trade in HISTORY if end is None or trade[1] <= int(end)]
+
+    return trades[: int(limit or 120)]
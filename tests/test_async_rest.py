@@ -0,0 +1,304 @@
+"""
+Tests for AsyncBfxRestInterface, against a local aiohttp server.
+"""
+
+import asyncio
+import json
+import unittest
+from typing import Any, List
+
+from aiohttp import web
+
+from bfxapi.rest import (
+    AsyncBfxRestInterface,
+    CircuitBreaker,
+    Instrumentation,
+    RateLimiter,
+    RetryPolicy,
+)
+from bfxapi.rest._interface.async_interface import AsyncInterface
+from bfxapi.rest._interface.async_middleware import AsyncMiddleware
+from bfxapi.rest._interfaces import RestPublicEndpoints
+from bfxapi.rest.exceptions import CircuitOpenError, RequestParameterError
+from bfxapi.types import Candle, Order
+
+from ._fixtures import HISTORY, ORDER, get_history
+
+
+class _SwallowingEndpoints(RestPublicEndpoints):
+    def get_platform_status(self):
+        try:
+            return super().get_platform_status()
+        except Exception:
+            return None
+
+
+class TestAsyncBfxRestInterface(unittest.IsolatedAsyncioTestCase):
+    """Test that endpoint methods run as coroutines over aiohttp."""
+
+    async def asyncSetUp(self):
+        self.requests: List[Any] = []
+
+        self.gate = asyncio.Event()
+
+        app = web.Application()
+        app.router.add_get("/v2/candles/{key}/hist", self.__candles)
+        app.router.add_get("/v2/platform/status", self.__status)
+        app.router.add_post("/v2/auth/w/order/submit", self.__submit)
+        app.router.add_get("/v2/book/{pair}/{prec}", self.__error)
+        app.router.add_get("/v2/trades/{pair}/hist", self.__trades)
+        app.router.add_get("/v2/tickers", self.__tickers)
+        app.router.add_get("/v2/conf/{key}", self.__unavailable)
+
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+
+        self.host = f"http://127.0.0.1:{self.runner.addresses[0][1]}/v2"
+
+        self.rest = AsyncBfxRestInterface(
+            self.host,
+            "key",
+            "secret",
+            pool_size=4,
+            rate_limiter=RateLimiter({"trades": 600}),
+        )
+
+    async def asyncTearDown(self):
+        await self.rest.close()
+
+        await self.runner.cleanup()
+
+    async def __candles(self, request: web.Request) -> web.Response:
+        self.requests.append(dict(request.query))
+
+        return web.json_response([[1, 2, 3, 4, 5, 6]])
+
+    async def __status(self, request: web.Request) -> web.Response:
+        self.requests.append(request.path)
+
+        await self.gate.wait()
+
+        return web.json_response([1])
+
+    async def __submit(self, request: web.Request) -> web.Response:
+        self.requests.append((json.loads(await request.text()), request.headers))
+
+        return web.json_response(
+            [1, "on-req", None, None, [ORDER], None, "SUCCESS", "Submitted"]
+        )
+
+    async def __error(self, request: web.Request) -> web.Response:
+        return web.json_response(["error", 10020, "prec: invalid"])
+
+    async def __trades(self, request: web.Request) -> web.Response:
+        return web.json_response(get_history(**request.query))
+
+    async def __tickers(self, request: web.Request) -> web.Response:
+        self.requests.append(request.query["symbols"])
+
+        return web.json_response(
+            [[symbol, *range(10)] for symbol in request.query["symbols"].split(",")]
+        )
+
+    async def __unavailable(self, request: web.Request) -> web.Response:
+        self.requests.append(request.path)
+
+        # Only the second request gets through
+        if len(self.requests) != 2:
+            return web.Response(status=503, text="<html>Service Unavailable</html>")
+
+        return web.json_response([["BTCUSD"]])
+
+    async def test_get(self):
+        """Test that results and query parameters match the sync interface."""
+        candles = await self.rest.public.get_candles_hist("tBTCUSD", limit=10)
+
+        self.assertEqual(candles, [Candle(1, 2, 3, 4, 5, 6)])
+        self.assertEqual(self.requests, [{"limit": "10"}])
+
+    async def test_post(self):
+        """Test that authenticated requests are signed and POST_ONLY."""
+        notification = await self.rest.auth.submit_order(
+            "EXCHANGE LIMIT", "tBTCUSD", 0.001, 27000
+        )
+
+        body, headers = self.requests[0]
+
+        self.assertEqual(body["flags"] & 4096, 4096)
+        self.assertIn("bfx-signature", headers)
+        self.assertIsInstance(notification.data, Order)
+
+    async def test_swallowed_request(self):
+        """Test that an endpoint method catching its request is reported."""
+        middleware = AsyncMiddleware(self.host, session=self.rest.session)
+
+        public = AsyncInterface(_SwallowingEndpoints, middleware)
+
+        with self.assertRaisesRegex(RuntimeError, "get_platform_status"):
+            await public.get_platform_status()
+
+        self.assertEqual(self.requests, [])
+
+    async def test_concurrent_requests(self):
+        """Test that several requests can be in flight at once."""
+        statuses = [
+            asyncio.ensure_future(self.rest.public.get_platform_status())
+            for _ in range(3)
+        ]
+
+        await asyncio.sleep(0.1)
+
+        self.assertFalse(any(status.done() for status in statuses))
+
+        self.gate.set()
+
+        self.assertEqual(
+            [status.status for status in await asyncio.gather(*statuses)], [1, 1, 1]
+        )
+
+    async def test_cancellation(self):
+        """Test that pending requests can be cancelled."""
+        status = asyncio.ensure_future(self.rest.public.get_platform_status())
+
+        await asyncio.sleep(0.1)
+
+        status.cancel()
+
+        with self.assertRaises(asyncio.CancelledError):
+            await status
+
+        self.gate.set()
+
+        self.assertEqual((await self.rest.public.get_platform_status()).status, 1)
+
+    async def test_error(self):
+        """Test that errors sent by Bitfinex raise the same exceptions."""
+        with self.assertRaises(RequestParameterError):
+            await self.rest.public.get_t_book("tBTCUSD", "P9")
+
+    async def test_pagination(self):
+        """Test that paginators can be iterated with async for."""
+        for prefetch in (False, True):
+            paginator = self.rest.public.iter_t_trades(
+                "tBTCUSD", limit=3, prefetch=prefetch
+            )
+
+            self.assertEqual(
+                [trade.id async for trade in paginator], [trade[0] for trade in HISTORY]
+            )
+
+    async def test_rate_limiter(self):
+        """Test that requests over budget wait, and can be cancelled."""
+        self.gate.set()
+
+        limiter = RateLimiter({"platform": 1})
+
+        async with AsyncBfxRestInterface(self.host, rate_limiter=limiter) as rest:
+            await rest.public.get_platform_status()
+
+            status = asyncio.ensure_future(rest.public.get_platform_status())
+
+            await asyncio.sleep(0.1)
+
+            self.assertEqual(limiter.get_queue_depth("platform"), 1)
+            self.assertLess(limiter.get_budget("platform"), 0)
+
+            status.cancel()
+
+            with self.assertRaises(asyncio.CancelledError):
+                await status
+
+            self.assertEqual(limiter.get_queue_depth("platform"), 0)
+
+    async def test_cache(self):
+        """Test that identical concurrent requests are sent once, and cached."""
+        async with AsyncBfxRestInterface(self.host, cache=True) as rest:
+            statuses = [
+                asyncio.ensure_future(rest.public.get_platform_status())
+                for _ in range(3)
+            ]
+
+            await asyncio.sleep(0.1)
+
+            self.gate.set()
+
+            await asyncio.gather(*statuses)
+
+            self.assertEqual((await rest.public.get_platform_status()).status, 1)
+
+        self.assertEqual(self.requests, ["/v2/platform/status"])
+
+    async def test_coalescer(self):
+        """Test that concurrent ticker requests are sent as one tickers request."""
+        async with AsyncBfxRestInterface(self.host, coalescer=True) as rest:
+            tickers = await asyncio.gather(
+                *(rest.public.get_t_ticker(f"t{pair}") for pair in ("BTCUSD", "ETHUSD"))
+            )
+
+        self.assertEqual([ticker.bid for ticker in tickers], [0, 0])
+        self.assertEqual(self.requests, ["tBTCUSD,tETHUSD"])
+
+    async def test_retries(self):
+        """Test that GETs are retried, until the circuit breaker opens."""
+        async with AsyncBfxRestInterface(
+            self.host,
+            retry_policy=RetryPolicy(1, backoff=0),
+            circuit_breaker=CircuitBreaker(threshold=3),
+        ) as rest:
+            self.assertEqual(await rest.public.conf("pub:list:pair"), ["BTCUSD"])
+
+            # The last response (not from Bitfinex) is handed over once retried
+            with self.assertRaises(json.JSONDecodeError):
+                await rest.public.conf("pub:list:pair")
+
+            for _ in range(2):
+                with self.assertRaises(CircuitOpenError):
+                    await rest.public.conf("pub:list:pair")
+
+        self.assertEqual(len(self.requests), 5)
+
+    async def test_instrumentation(self):
+        """Test that requests are reported once their method returns."""
+        reports: List[Any] = []
+
+        async with AsyncBfxRestInterface(
+            self.host, instrumentation=Instrumentation(reports.append)
+        ) as rest:
+            await rest.public.get_candles_hist("tBTCUSD")
+
+            assert rest.instrumentation is not None
+
+            stats = rest.instrumentation.get_stats()
+
+        (metrics,) = reports
+
+        self.assertEqual((metrics.name, metrics.status), ("get_candles_hist", 200))
+        self.assertIsNotNone(metrics.connect)
+        self.assertIsNotNone(metrics.parse)
+        self.assertEqual(metrics.response_bytes, len(json.dumps([[1, 2, 3, 4, 5, 6]])))
+        self.assertEqual(stats["get_candles_hist"].count, 1)
+
+    async def test_fan_out(self):
+        """Test that calls are awaited concurrently, and returned in order."""
+        calls = [
+            (self.rest.public.get_candles_hist, (symbol,), {"limit": limit})
+            for limit, symbol in enumerate(["tBTCUSD", "tETHUSD", "tLTCUSD"], 1)
+        ]
+
+        candles = await self.rest.fan_out(calls, concurrency=2)
+
+        self.assertEqual(candles, [[Candle(1, 2, 3, 4, 5, 6)]] * 3)
+        self.assertCountEqual(
+            self.requests, [{"limit": "1"}, {"limit": "2"}, {"limit": "3"}]
+        )
+
+        indexes = [index async for index, _ in self.rest.fan_out_as_completed(calls)]
+
+        self.assertCountEqual(indexes, [0, 1, 2])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,170 @@
+"""
+Tests for the candle history store.
+"""
+
+import os
+import tempfile
+import time
+import unittest
+from typing import Any, List
+from unittest.mock import patch
+
+from pyee.base import EventEmitter
+
+from bfxapi import CandleStore
+from bfxapi.rest import BfxRestInterface
+from bfxapi.types import Candle, use_output
+
+# An hour ago, on a minute boundary
+T0 = (int(time.time()) // 60 - 60) * 60_000
+
+# 1m candles of the last hour: [MTS, OPEN, CLOSE, HIGH, LOW, VOLUME]
+CANDLES = [[T0 + i * 60_000, i, i + 1, i + 2, i - 1, 10.0] for i in range(60)]
+
+
+def _candles(endpoint: str, params: Any, **kwargs: Any) -> List[Any]:
+    # Candles within [start, end], newest first, like the endpoint of Bitfinex
+    candles = [
+        candle
+        for candle in reversed(CANDLES)
+        if int(params["start"]) <= candle[0] <= int(params["end"])
+    ]
+
+    return candles[: params["limit"]]
+
+
+class TestCandleStore(unittest.TestCase):
+    """Test that candles are fetched once, and kept across restarts."""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+        self.rest = BfxRestInterface("https://api.bitfinex.com/v2")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_sync(self):
+        """Test that only the missing time ranges are fetched."""
+        store = CandleStore(self.rest, self.directory.name, limit=25)
+
+        with patch.object(self.rest.public._m, "get", side_effect=_candles) as get:
+            self.assertEqual(store.sync("tBTCUSD", start=T0, end=T0 + 29 * 60_000), 30)
+            self.assertEqual(store.sync("tBTCUSD", start=T0, end=T0 + 29 * 60_000), 0)
+
+            requests = get.call_count
+
+            # Up to now: the candles of the last minute are never covered
+            self.assertEqual(store.sync("tBTCUSD", start=T0), 30)
+
+            self.assertEqual(
+                get.call_args_list[requests].kwargs["params"]["start"],
+                str(T0 + 29 * 60_000 + 1),
+            )
+
+        self.assertEqual(
+            store.get("tBTCUSD", start=T0 + 58 * 60_000),
+            [Candle(*candle) for candle in CANDLES[58:]],
+        )
+
+        store.close()
+
+        # A new store (e.g. after a restart) starts from the files
+        store = CandleStore(self.rest, self.directory.name)
+
+        columns = store.get_columns("tBTCUSD")
+
+        self.assertEqual(columns["mts"].tolist(), [candle[0] for candle in CANDLES])
+        self.assertEqual(columns["close"][-1], 60.0)
+        self.assertEqual(
+            sorted(os.listdir(os.path.join(self.directory.name, "tBTCUSD", "1m"))),
+            ["close", "coverage.json", "high", "low", "mts", "open", "volume"],
+        )
+
+        store.close()
+
+    def test_columnar_outputs(self):
+        """Test that candles are synced whatever the output of the client."""
+        rest = BfxRestInterface("https://api.bitfinex.com/v2", output="columns")
+
+        for name, interface in [("default", self.rest), ("columns", rest)]:
+            path = os.path.join(self.directory.name, name)
+
+            store = CandleStore(interface, path, limit=25)
+
+            with patch.object(interface.public._m, "get", side_effect=_candles):
+                with use_output("numpy"):
+                    fetched = store.sync("tBTCUSD", start=T0, end=T0 + 29 * 60_000)
+
+            self.assertEqual(fetched, 30)
+            self.assertEqual(store.get_columns("tBTCUSD")["mts"][-1], CANDLES[29][0])
+
+            store.close()
+
+    def test_websocket(self):
+        """Test that snapshots and updates are merged in place."""
+        store, wss = CandleStore(self.rest, self.directory.name), EventEmitter()
+
+        store.attach(wss)  # type: ignore[arg-type]
+
+        subscription = {"channel": "candles", "sub_id": "id", "key": "trade:1m:tBTCUSD"}
+
+        snapshot = [Candle(*candle) for candle in CANDLES[30:50]]
+
+        wss.emit("candles_snapshot", subscription, snapshot)
+
+        wss.emit(
+            "candles_update", subscription, Candle(T0 + 49 * 60_000, 1, 2, 3, 0, 5)
+        )
+
+        wss.emit(
+            "candles_update", subscription, Candle(T0 + 50 * 60_000, 2, 3, 4, 1, 6)
+        )
+
+        # Older candles are inserted before those of the snapshot
+        wss.emit("candles_snapshot", subscription, [Candle(*CANDLES[0])])
+
+        candles = store.get("tBTCUSD")
+
+        self.assertEqual(
+            [candle.mts for candle in candles],
+            [CANDLES[0][0], *(candle[0] for candle in CANDLES[30:51])],
+        )
+        self.assertEqual(candles[-2], Candle(T0 + 49 * 60_000, 1, 2, 3, 0, 5))
+
+        with patch.object(self.rest.public._m, "get", side_effect=_candles) as get:
+            store.sync("tBTCUSD", start=T0 + 30 * 60_000, end=T0 + 49 * 60_000)
+
+        get.assert_not_called()
+
+        store.close()
+
+    def test_views_across_merge(self):
+        """Test that views returned before a merge stay readable."""
+        store, wss = CandleStore(self.rest, self.directory.name), EventEmitter()
+
+        store.attach(wss)  # type: ignore[arg-type]
+
+        subscription = {"channel": "candles", "sub_id": "id", "key": "trade:1m:tBTCUSD"}
+
+        wss.emit("candles_snapshot", subscription, [Candle(*CANDLES[30])])
+
+        columns = store.get_columns("tBTCUSD")
+
+        # The columns grow twice: once appended, once rewritten
+        wss.emit("candles_update", subscription, Candle(*CANDLES[31]))
+        wss.emit("candles_snapshot", subscription, [Candle(*CANDLES[0])])
+
+        self.assertEqual(len(columns["mts"]), 1)
+        self.assertEqual(
+            store.get_columns("tBTCUSD")["mts"].tolist(),
+            [CANDLES[0][0], CANDLES[30][0], CANDLES[31][0]],
+        )
+
+        del columns
+
+        store.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+"""
+Tests for the bounded-concurrency fan-out of the REST interfaces.
+"""
+
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from bfxapi.rest import BfxRestInterface
+from bfxapi.rest.exceptions import RequestParameterError
+
+
+class TestRestFanOut(unittest.TestCase):
+    """Test the bounded-concurrency fan-out of the REST interfaces."""
+
+    def test_fan_out(self):
+        """Test that calls run concurrently, up to max_workers at once."""
+        running, peak, lock = 0, 0, threading.Lock()
+
+        def call(delay: float, value: int) -> int:
+            nonlocal running, peak
+
+            with lock:
+                running += 1
+
+                peak = max(peak, running)
+
+            time.sleep(delay)
+
+            with lock:
+                running -= 1
+
+            return value
+
+        calls = [(call, (0.05 * (4 - i), i)) for i in range(4)]
+
+        with BfxRestInterface("https://api.bitfinex.com/v2", pool_size=3) as rest:
+            self.assertEqual(rest.fan_out(calls), [0, 1, 2, 3])
+            self.assertEqual(peak, 3)
+
+            self.assertEqual(
+                [index for index, _ in rest.fan_out_as_completed(calls, max_workers=4)],
+                [3, 2, 1, 0],
+            )
+
+    def test_exceptions(self):
+        """Test that exceptions are raised, or returned on request."""
+        rest = BfxRestInterface("https://api.bitfinex.com/v2")
+
+        with patch.object(rest.session, "get") as get:
+            get.return_value.json.return_value = ["error", 10020, "symbol: invalid"]
+
+            calls = [(rest.public.get_t_ticker, ("tBTCUSD",))]
+
+            with self.assertRaises(RequestParameterError):
+                rest.fan_out(calls)
+
+            (error,) = rest.fan_out(calls, return_exceptions=True)
+
+        self.assertIsInstance(error, RequestParameterError)
+
+
+if __name__ == "__main__":
+    unittest.main()
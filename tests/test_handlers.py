@@ -0,0 +1,455 @@
+"""
+Tests for the WebSocket handlers, state and inputs.
+"""
+
+import asyncio
+import unittest
+from typing import Any, List
+
+from pyee.asyncio import AsyncIOEventEmitter
+from pyee.base import EventEmitter
+
+from bfxapi.rest import Instrumentation
+from bfxapi.types import (
+    Notification,
+    Order,
+    TradingPairBook,
+    TradingPairTrade,
+    Wallet,
+    serializers,
+    set_precision,
+    unset_precision,
+)
+from bfxapi.websocket import AccountState, OrderStore
+from bfxapi.websocket._client.bfx_websocket_inputs import BfxWebSocketInputs
+from bfxapi.websocket._client.order_acknowledgements import OrderAcknowledgements
+from bfxapi.websocket._handlers import AuthEventsHandler, PublicChannelsHandler
+from bfxapi.websocket.exceptions import AcknowledgementTimeoutError, OrderRejectedError
+
+from ._fixtures import ORDER, WALLET
+
+TRADES = {"channel": "trades", "sub_id": "id", "symbol": "tBTCUSD"}
+
+BOOK = {"channel": "book", "sub_id": "id", "symbol": "tBTCUSD", "prec": "P0"}
+
+
+def _position(id: int, amount: float) -> List[Any]:
+    # [SYMBOL, STATUS, AMOUNT, BASE_PRICE, ..., POSITION_ID (11), ...]
+    position = ["tBTCUSD", "ACTIVE", amount, 27000.0, *[None] * 16]
+
+    position[11] = id
+
+    return position
+
+
+def _order(id: int, gid: Any, cid: int, symbol: str = "tBTCUSD") -> List[Any]:
+    return [id, gid, cid, symbol, *ORDER[4:]]
+
+
+def _capture(event_emitter: EventEmitter, event: str) -> List[Any]:
+    events: List[Any] = []
+
+    event_emitter.on(event, lambda *args: events.append(args))
+
+    return events
+
+
+def _parse_in_listener(handle: Any, event_emitter: EventEmitter, event: str) -> Any:
+    # Parses a wallet from an async listener of <event>, after handling it
+    async def main() -> Any:
+        future = asyncio.get_running_loop().create_future()
+
+        async def listener(*_: Any) -> None:
+            future.set_result(serializers.Wallet.parse(*WALLET))
+
+        event_emitter.on(event, listener)
+
+        handle()
+
+        return await future
+
+    return asyncio.run(main())
+
+
+class TestPublicChannelsHandler(unittest.TestCase):
+    """Test the events emitted for public channels."""
+
+    def test_trade_execution(self):
+        """Test that trade executions are emitted as dataclasses by default."""
+        event_emitter = EventEmitter()
+        events = _capture(event_emitter, "t_trade_execution")
+
+        PublicChannelsHandler(event_emitter).handle(TRADES, ["te", [1, 2, 0.5, 100.0]])
+
+        self.assertEqual(events, [(TRADES, TradingPairTrade(1, 2, 0.5, 100.0))])
+
+    def test_output(self):
+        """Test that the output option applies to every emitted event."""
+        event_emitter = EventEmitter()
+        trades = _capture(event_emitter, "t_trade_execution")
+        snapshots = _capture(event_emitter, "t_trades_snapshot")
+
+        handler = PublicChannelsHandler(event_emitter, output="raw")
+        handler.handle(TRADES, ["te", [1, 2, 0.5, 100.0]])
+        handler.handle(TRADES, [[[1, 2, 0.5, 100.0], [3, 4, -0.5, 101.0]]])
+
+        self.assertEqual(trades[0][1], [1, 2, 0.5, 100.0])
+        self.assertEqual(snapshots[0][1], [[1, 2, 0.5, 100.0], [3, 4, -0.5, 101.0]])
+
+    def test_fixed_point(self):
+        """Test that pairs with a precision emit scaled integers."""
+        event_emitter = EventEmitter()
+        books = _capture(event_emitter, "t_book_update")
+        trades = _capture(event_emitter, "t_trade_execution")
+
+        handler = PublicChannelsHandler(event_emitter)
+
+        set_precision("BTCUSD", price=1)
+
+        try:
+            handler.handle(BOOK, [[27000.1, 2, -0.00012345]])
+            handler.handle(TRADES, ["te", [1, 2, 0.3, 27000.3]])
+            handler.handle({**BOOK, "symbol": "tETHUSD"}, [[1800.5, 1, 1.5]])
+        finally:
+            unset_precision("tBTCUSD")
+
+        self.assertEqual(books[0][1], TradingPairBook(270001, 2, -12345))
+        self.assertEqual(trades[0][1], TradingPairTrade(1, 2, 30_000_000, 270003))
+        self.assertEqual(books[1][1], TradingPairBook(1800.5, 1, 1.5))
+
+    def test_listener_output(self):
+        """Test that listeners don't inherit the output of the handler."""
+        event_emitter = AsyncIOEventEmitter()
+        handler = PublicChannelsHandler(event_emitter, output="raw")
+
+        wallet = _parse_in_listener(
+            lambda: handler.handle(TRADES, ["te", [1, 2, 0.5, 100.0]]),
+            event_emitter,
+            "t_trade_execution",
+        )
+
+        self.assertIsInstance(wallet, Wallet)
+
+
+class TestAuthEventsHandler(unittest.TestCase):
+    """Test the events emitted for the authenticated channel."""
+
+    def test_dispatch(self):
+        """Test that snapshots are emitted as lists and updates as records."""
+        event_emitter = EventEmitter()
+        snapshots = _capture(event_emitter, "wallet_snapshot")
+        updates = _capture(event_emitter, "wallet_update")
+
+        handler = AuthEventsHandler(event_emitter)
+        handler.handle("ws", [WALLET, WALLET])
+        handler.handle("ws", [])
+        handler.handle("wu", WALLET)
+        handler.handle("xx", WALLET)
+
+        self.assertEqual(len(snapshots[0][0]), 2)
+        self.assertEqual(snapshots[1][0], [])
+        self.assertEqual(updates[0][0], serializers.Wallet.parse(*WALLET))
+
+    def test_notification(self):
+        """Test that notifications are emitted by request type."""
+        event_emitter = EventEmitter()
+        requests = _capture(event_emitter, "on-req-notification")
+        others = _capture(event_emitter, "notification")
+
+        handler = AuthEventsHandler(event_emitter)
+        handler.handle("n", [1, "on-req", None, None, ORDER, None, "SUCCESS", ""])
+        handler.handle("n", [1, "ucm-test", None, None, None, None, "SUCCESS", ""])
+
+        self.assertIsInstance(requests[0][0].data, Order)
+        self.assertIsInstance(others[0][0], Notification)
+        self.assertIsNone(others[0][0].data)
+
+    def test_output(self):
+        """Test that the output option applies to authenticated events."""
+        event_emitter = EventEmitter()
+        events = _capture(event_emitter, "wallet_update")
+
+        AuthEventsHandler(event_emitter, output="namedtuple").handle("wu", WALLET)
+
+        wallet = events[0][0]
+
+        self.assertIsInstance(wallet, serializers.Wallet.get_namedtuple())
+        self.assertEqual(wallet.currency, "USD")
+        self.assertEqual(wallet.available_balance, 90.0)
+
+    def test_listener_output(self):
+        """Test that listeners don't inherit the output of the handler."""
+        event_emitter = AsyncIOEventEmitter()
+        handler = AuthEventsHandler(event_emitter, output="raw")
+
+        wallet = _parse_in_listener(
+            lambda: handler.handle("wu", WALLET), event_emitter, "wallet_update"
+        )
+
+        self.assertIsInstance(wallet, Wallet)
+
+
+class TestOrderStore(unittest.TestCase):
+    """Test the open orders kept from the authenticated channel."""
+
+    def test_indexes(self):
+        """Test that orders are indexed by id, cid, gid and symbol."""
+        store = OrderStore()
+
+        handler = AuthEventsHandler(EventEmitter(), states=[store])
+        handler.handle("os", [_order(1, 10, 100), _order(2, None, 200, "tETHUSD")])
+        handler.handle("on", _order(3, 10, 300))
+        handler.handle("ou", [*_order(3, 20, 300)[:6], 0.5, *ORDER[7:]])
+        handler.handle("oc", _order(1, 10, 100))
+        handler.handle("oc", _order(4, 10, 400))
+
+        self.assertTrue(store.synced)
+        self.assertEqual([order.id for order in store.get_all()], [2, 3])
+        self.assertEqual(store.get(3).amount, 0.5)
+        self.assertIsNone(store.get(1))
+        self.assertEqual(store.get_by_cid(200).id, 2)
+        self.assertEqual(store.get_by_cid(300, "2023-03-16").id, 3)
+        self.assertIsNone(store.get_by_cid(300, "2023-03-17"))
+        self.assertIsNone(store.get_by_cid(100))
+        self.assertEqual(store.get_by_gid(10), [])
+        self.assertEqual([order.id for order in store.get_by_gid(20)], [3])
+        self.assertEqual([order.id for order in store.get_by_symbol("tBTCUSD")], [3])
+
+    def test_reconnection(self):
+        """Test that the snapshot of a new connection replaces the orders."""
+        event_emitter, store = EventEmitter(), OrderStore()
+
+        # Listeners find the store up to date
+        event_emitter.on("order_new", lambda order: self.assertIn(order[0], store))
+
+        handler = AuthEventsHandler(event_emitter, output="raw", states=[store])
+        handler.handle("os", [_order(1, None, 100), _order(2, None, 200)])
+        handler.handle("on", _order(3, None, 300))
+
+        store.invalidate()
+
+        self.assertFalse(store.synced)
+        self.assertEqual(len(store), 3)
+
+        handler.handle("os", [_order(2, None, 200)])
+
+        self.assertTrue(store.synced)
+        self.assertEqual([order[0] for order in store.get_all()], [2])
+        self.assertIsNone(store.get_by_cid(300))
+
+
+class TestAccountState(unittest.TestCase):
+    """Test the wallets, positions and margin info kept from the channel."""
+
+    def test_snapshot(self):
+        """Test that snapshots are copies of the state at a point in time."""
+        state = AccountState()
+
+        handler = AuthEventsHandler(EventEmitter(), states=[state])
+        handler.handle("ws", [WALLET, ["margin", "BTC", 1.0, 0, 1.0, None, None]])
+        handler.handle("ps", [_position(1, 0.1), _position(2, 0.2)])
+        handler.handle("bu", [1000.0, 990.0])
+        handler.handle("fiu", ["sym", "fUSD", [0.0001, 0.0002, 30, 60]])
+        handler.handle("miu", ["base", [1.0, 0.0, 1000.0, 1001.0, 10.0]])
+        handler.handle("miu", ["sym", "tBTCUSD", [500.0, 1000.0, 0.01, 0.02]])
+
+        snapshot = state.snapshot()
+
+        handler.handle("wu", ["exchange", "USD", 50.0, 0, 40.0, None, None])
+        handler.handle("pu", _position(1, 0.3))
+        handler.handle("pc", _position(2, 0.2))
+
+        self.assertTrue(state.synced)
+        self.assertEqual(snapshot.wallets[("exchange", "USD")].balance, 100.0)
+        self.assertEqual(state.get_wallet("exchange", "USD").balance, 50.0)
+        self.assertEqual(list(snapshot.positions), [1, 2])
+        self.assertEqual(state.get_position(1).amount, 0.3)
+        self.assertIsNone(state.get_position(2))
+        self.assertEqual(snapshot.balance.aum, 1000.0)
+        self.assertEqual(state.get_funding_info("fUSD").yield_loan, 0.0001)
+        self.assertEqual(state.get_margin().margin_balance, 1000.0)
+        self.assertEqual(state.get_margin("tBTCUSD").tradable_balance, 500.0)
+
+    def test_listeners(self):
+        """Test that listeners are called with each key which changed."""
+        state, wallets, changes = AccountState(), [], []
+
+        state.add_listener(
+            ("wallet", "exchange", "USD"), lambda *args: wallets.append(args)
+        )
+        state.add_listener(None, lambda key, record: changes.append(key))
+
+        handler = AuthEventsHandler(EventEmitter(), output="raw", states=[state])
+        handler.handle("ws", [WALLET, ["margin", "BTC", 1.0, 0, 1.0, None, None]])
+        handler.handle("ps", [_position(1, 0.1)])
+        handler.handle("ws", [WALLET])
+
+        state.invalidate()
+
+        self.assertFalse(state.synced)
+
+        handler.handle("wu", ["margin", "BTC", 2.0, 0, 2.0, None, None])
+
+        self.assertEqual(len(wallets), 2)
+        self.assertEqual(wallets[0], (("wallet", "exchange", "USD"), WALLET))
+        self.assertEqual(
+            changes,
+            [
+                ("wallet", "exchange", "USD"),
+                ("wallet", "margin", "BTC"),
+                ("position", 1),
+                ("wallet", "margin", "BTC"),
+                ("wallet", "exchange", "USD"),
+                ("wallet", "margin", "BTC"),
+            ],
+        )
+
+    def test_listener_errors(self):
+        """Test that failing listeners and states are emitted on error."""
+        event_emitter, called = EventEmitter(), []
+
+        errors = _capture(event_emitter, "error")
+        updates = _capture(event_emitter, "wallet_update")
+
+        def fail(*args: Any) -> None:
+            raise ValueError(args)
+
+        # e.g. a store which can't index a record
+        store = OrderStore()
+        store.EVENTS = ("wu",)
+        store.update = fail  # type: ignore[method-assign]
+
+        for state in [
+            AccountState(),
+            AccountState(on_error=lambda error: event_emitter.emit("error", error)),
+        ]:
+            state.add_listener(None, fail)
+            state.add_listener(None, fail)
+            state.add_listener(None, lambda *args: called.append(args))
+
+            AuthEventsHandler(event_emitter, states=[store, state]).handle("wu", WALLET)
+
+        self.assertEqual(len(called), 2)
+        self.assertEqual(len(updates), 2)
+        self.assertEqual([type(error) for error, in errors], [ValueError] * 5)
+
+
+class TestWebSocketInputs(unittest.TestCase):
+    """Test the inputs sent to the authenticated channel."""
+
+    def test_order_multi_op(self):
+        """Test that operations are batched, and new orders made post-only."""
+        inputs: List[Any] = []
+
+        async def handle(event: str, data: Any) -> None:
+            inputs.append((event, data))
+
+        new = {"type": "EXCHANGE LIMIT", "symbol": "tBTCUSD", "amount": 1}
+
+        ops = [("ou", {"id": id, "price": 100, "flags": 64}) for id in range(80)]
+
+        asyncio.run(
+            BfxWebSocketInputs(handle).order_multi_op(
+                [("on", new), ("oc", {"id": 1}), *ops]
+            )
+        )
+
+        self.assertEqual([len(data) for _, data in inputs], [75, 7])
+        self.assertEqual(inputs[0][1][0], ["on", {**new, "flags": 4096}])
+        self.assertEqual(inputs[0][1][1], ["oc", {"id": 1}])
+        self.assertEqual(inputs[1][1][-1][1]["flags"], 4096 | 64)
+        self.assertNotIn("flags", new)
+
+        # Nothing is sent unless every operation is valid
+        with self.assertRaises(ValueError):
+            asyncio.run(
+                BfxWebSocketInputs(handle).order_multi_op(
+                    [*ops, ("on", {**new, "type": "EXCHANGE MARKET"})]
+                )
+            )
+
+        with self.assertRaises(ValueError):
+            asyncio.run(BfxWebSocketInputs(handle).order_multi_op([("fon", {})]))
+
+        self.assertEqual(len(inputs), 2)
+
+    def test_acknowledgements(self):
+        """Test that order inputs are acknowledged by their events."""
+        instrumentation, sent = Instrumentation(), []
+
+        acknowledgements = OrderAcknowledgements(0.05, instrumentation)
+
+        handler = AuthEventsHandler(EventEmitter(), states=[acknowledgements])
+
+        async def handle(event: str, data: Any) -> None:
+            sent.append(data)
+
+        inputs = BfxWebSocketInputs(handle, acknowledgements)
+
+        async def main() -> None:
+            new = await inputs.submit_order("LIMIT", "tBTCUSD", 1, 100, ack=True)
+            canceled = await inputs.submit_order("LIMIT", "tBTCUSD", 1, 90, ack=True)
+            update = await inputs.update_order(1, price=101, ack=True)
+            rejected = await inputs.update_order(3, price=101, ack=True)
+            cancel = await inputs.cancel_order(id=5, ack=True)
+
+            self.assertIsNone(await inputs.cancel_order(id=4))
+
+            # e.g. a post-only order which would have matched
+            handler.handle("oc", _order(2, None, sent[1]["cid"]))
+            handler.handle("on", _order(1, None, sent[0]["cid"]))
+            handler.handle("ou", _order(1, None, sent[0]["cid"]))
+            handler.handle(
+                "n", [1, "ou-req", None, None, _order(3, None, 0), 0, "ERROR", "No."]
+            )
+
+            self.assertEqual((await new).cid, sent[0]["cid"])
+            self.assertEqual((await canceled).id, 2)
+            self.assertEqual((await update).id, 1)
+
+            with self.assertRaises(OrderRejectedError):
+                await rejected
+
+            with self.assertRaises(AcknowledgementTimeoutError):
+                await cancel
+
+        asyncio.run(main())
+
+        self.assertLess(sent[0]["cid"], sent[1]["cid"])
+
+        stats = instrumentation.get_stats()
+
+        self.assertEqual(stats["submit_order"].count, 2)
+        self.assertEqual(stats["update_order"].errors, 1)
+        self.assertEqual(stats["cancel_order"].errors, 1)
+
+    def test_rejections(self):
+        """Test that wrapped orders are rejected and odd payloads ignored."""
+        acknowledgements = OrderAcknowledgements(0.05)
+
+        handler = AuthEventsHandler(EventEmitter(), states=[acknowledgements])
+
+        async def main() -> None:
+            future = acknowledgements.expect("on", "submit_order", cid=ORDER[2])
+
+            for stream in [
+                [1, "on-req", None, None, [], None, "ERROR", "x"],
+                [1, "on-req", None, None, [[1]], None, "ERROR", "x"],
+                [1, "on-req", None, None, "x", None, "ERROR", "x"],
+                [1, "fon-req", None, None, [ORDER], None, "ERROR", "x"],
+                [1, "on-req", None, None, [ORDER]],
+            ]:
+                acknowledgements.update("n", stream, None)
+
+            self.assertFalse(future.done())
+
+            handler.handle("n", [1, "on-req", None, None, [ORDER], None, "ERROR", "x"])
+
+            with self.assertRaises(OrderRejectedError):
+                await future
+
+        asyncio.run(main())
+
+
+if __name__ == "__main__":
+    unittest.main()
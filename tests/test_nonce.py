@@ -0,0 +1,80 @@
+"""
+Tests for the nonces of authenticated requests.
+"""
+
+import os
+import tempfile
+import threading
+import unittest
+from typing import List
+from unittest.mock import patch
+
+from bfxapi import NonceAllocator
+
+
+class TestNonceAllocator(unittest.TestCase):
+    """Test that nonces are strictly increasing."""
+
+    def test_threads(self):
+        """Test that concurrent threads never get equal nonces."""
+        allocator = NonceAllocator()
+
+        nonces: List[List[int]] = [[] for _ in range(8)]
+
+        def allocate(nonces: List[int]):
+            for _ in range(1000):
+                nonces.append(allocator.next())
+
+        threads = [threading.Thread(target=allocate, args=(n,)) for n in nonces]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        for sequence in nonces:
+            self.assertEqual(sequence, sorted(set(sequence)))
+
+        self.assertEqual(len(set().union(*nonces)), 8000)
+
+    def test_clock(self):
+        """Test that nonces increase when the clock stalls or goes backwards."""
+        allocator = NonceAllocator()
+
+        with patch("bfxapi._utils.nonce.time.time_ns") as time_ns:
+            time_ns.return_value = 2_000_000_000
+
+            self.assertEqual(
+                [allocator.next(), allocator.next()], [2_000_000, 2_000_001]
+            )
+
+            time_ns.return_value = 1_000_000_000
+
+            self.assertEqual(allocator.next(), 2_000_002)
+
+    def test_shared_file(self):
+        """Test that allocators sharing a file (e.g. processes) never collide."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "nonce")
+
+            first, second = NonceAllocator(path), NonceAllocator(path)
+
+            with patch("bfxapi._utils.nonce.time.time_ns", return_value=0):
+                nonces = [first.next(), second.next(), first.next(), second.next()]
+
+                first.close()
+
+                # The counter outlives the allocators (and their processes)
+                third = NonceAllocator(path)
+
+                nonces.append(third.next())
+
+            second.close()
+            third.close()
+
+            self.assertEqual(nonces, [1, 2, 3, 4, 5])
+
+
+if __name__ == "__main__":
+    unittest.main()
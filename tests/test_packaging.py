@@ -0,0 +1,58 @@
+"""
+Smoke test of the distribution built by setup.py.
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _get_packages() -> list:
+    packages = []
+
+    for path, _, files in os.walk(os.path.join(ROOT, "bfxapi")):
+        if "__init__.py" in files:
+            packages.append(os.path.relpath(path, ROOT).replace(os.sep, "."))
+
+    return sorted(packages)
+
+
+class TestPackaging(unittest.TestCase):
+    """Test that the built distribution holds every package of the source."""
+
+    def test_build(self):
+        """Test that every package can be imported from a build."""
+        with tempfile.TemporaryDirectory() as directory:
+            subprocess.run(
+                [sys.executable, "setup.py", "-q", "build_py", "-d", directory],
+                cwd=ROOT,
+                check=True,
+                capture_output=True,
+            )
+
+            # From the build only: the source tree isn't on the path
+            script = (
+                "import importlib, os, sys\n"
+                "for name in sys.argv[2:]:\n"
+                "    module = importlib.import_module(name)\n"
+                "    path = os.path.realpath(module.__file__)\n"
+                "    assert path.startswith(os.path.realpath(sys.argv[1])), path\n"
+            )
+
+            result = subprocess.run(
+                [sys.executable, "-c", script, directory, *_get_packages()],
+                cwd=directory,
+                env={**os.environ, "PYTHONPATH": directory},
+                capture_output=True,
+                text=True,
+            )
+
+            self.assertEqual(result.returncode, 0, result.stderr)
+
+
+if __name__ == "__main__":
+    unittest.main()
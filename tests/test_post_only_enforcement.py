@@ -140,7 +140,7 @@ class TestIntegrationPostOnly(unittest.IsolatedAsyncioTestCase):
         import json
         
         # Mock only at the HTTP boundary
-        with patch('bfxapi.rest._interface.middleware.requests.post') as mock_post:
+        with patch('bfxapi.rest._interface.middleware.requests.Session.post') as mock_post:
             mock_response = MagicMock()
             mock_response.json.return_value = []
             mock_post.return_value = mock_response
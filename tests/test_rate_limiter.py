@@ -0,0 +1,63 @@
+"""
+Tests for the rate limiter of the REST interfaces.
+"""
+
+import unittest
+from unittest.mock import patch
+
+from bfxapi.rest import BfxRestInterface, RateLimiter
+from bfxapi.rest.exceptions import RateLimitError
+
+
+class TestRestRateLimiter(unittest.TestCase):
+    """Test the rate limiter of the REST interfaces."""
+
+    def test_budget(self):
+        """Test that requests over the budget of their family are delayed."""
+        limiter = RateLimiter({"candles": 8})
+
+        with patch("bfxapi.rest._interface.rate_limiter.time.sleep") as sleep:
+            limiter.wait("candles/trade:1m:tBTCUSD/hist")
+            limiter.wait("candles/trade:1m:tETHUSD/hist")
+            limiter.wait("auth/r/orders/hist")
+
+            sleep.assert_not_called()
+
+            limiter.wait("candles/trade:1m:tBTCUSD/last")
+
+        self.assertAlmostEqual(sleep.call_args.args[0], 10, places=2)
+        self.assertAlmostEqual(limiter.get_budget("candles"), -1, places=2)
+        self.assertEqual(limiter.get_queue_depth("candles"), 0)
+
+    def test_rate_limit_error(self):
+        """Test that rate limit errors hold back the family of the endpoint."""
+        limiter = RateLimiter(max_delay=1)
+
+        rest = BfxRestInterface("https://api.bitfinex.com/v2", rate_limiter=limiter)
+
+        with patch.object(rest.session, "get") as get:
+            get.return_value.json.return_value = ["error", 11010, "ratelimit: error"]
+
+            with self.assertRaises(RateLimitError):
+                rest.public.get_platform_status()
+
+            with self.assertRaises(RateLimitError):
+                rest.public.get_platform_status()
+
+            get.assert_called_once()
+
+            get.return_value.json.return_value = [1]
+
+            self.assertEqual(rest.public.conf("pub:list:pair:exchange"), 1)
+
+    def test_opt_in(self):
+        """Test that the rate limiter is only enabled on request."""
+        self.assertIsNone(BfxRestInterface("https://api.bitfinex.com/v2").rate_limiter)
+
+        rest = BfxRestInterface("https://api.bitfinex.com/v2", rate_limiter=True)
+
+        self.assertIsInstance(rest.rate_limiter, RateLimiter)
+
+
+if __name__ == "__main__":
+    unittest.main()
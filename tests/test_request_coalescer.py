@@ -0,0 +1,71 @@
+"""
+Tests for the coalescing of single-ticker requests.
+"""
+
+import threading
+import unittest
+from typing import Any, Dict
+from unittest.mock import MagicMock, patch
+
+from bfxapi.rest import BfxRestInterface, RequestCoalescer
+
+
+class TestRequestCoalescer(unittest.TestCase):
+    """Test the coalescing of single-ticker requests."""
+
+    def test_batch(self):
+        """Test that concurrent ticker requests are sent as one tickers request."""
+        coalescer = RequestCoalescer(window=0.1)
+
+        rest = BfxRestInterface("https://api.bitfinex.com/v2", coalescer=coalescer)
+
+        tickers = {
+            "tBTCUSD": list(range(10)),
+            "tETHUSD": list(range(10, 20)),
+            "fUSD": list(range(16)),
+        }
+
+        def get(url: str, params: Any, **kwargs: Any) -> Any:
+            response = MagicMock()
+
+            if url.endswith("/tickers"):
+                symbols = params["symbols"].split(",")
+                # fUSD is missing from the response, and requested on its own
+                response.json.return_value = [
+                    [symbol, *tickers[symbol]] for symbol in symbols if symbol != "fUSD"
+                ]
+            else:
+                response.json.return_value = tickers[url.rsplit("/", 1)[1]]
+
+            return response
+
+        results: Dict[str, Any] = {}
+
+        def request(symbol: str):
+            if symbol.startswith("t"):
+                results[symbol] = rest.public.get_t_ticker(symbol)
+            else:
+                results[symbol] = rest.public.get_f_ticker(symbol)
+
+        with patch.object(rest.session, "get", side_effect=get) as mock:
+            threads = [
+                threading.Thread(target=request, args=(symbol,)) for symbol in tickers
+            ]
+
+            for thread in threads:
+                thread.start()
+
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(
+            [call.kwargs["url"].rsplit("/", 1)[1] for call in mock.call_args_list],
+            ["tickers", "fUSD"],
+        )
+
+        self.assertEqual(results["tETHUSD"].bid, 10)
+        self.assertEqual(results["fUSD"].frr, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+"""
+Tests for the response cache of the reference endpoints.
+"""
+
+import os
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+
+from bfxapi.rest import BfxRestInterface, ResponseCache
+
+
+class TestResponseCache(unittest.TestCase):
+    """Test the response cache of the reference endpoints."""
+
+    def test_cached_endpoints(self):
+        """Test that only the responses of reference endpoints are reused."""
+        with BfxRestInterface("https://api.bitfinex.com/v2", cache=True) as rest:
+            with patch.object(rest.session, "get") as get:
+                get.return_value.json.return_value = [["BTCUSD", "ETHUSD"]]
+
+                rest.public.conf("pub:list:pair:exchange").append("XRPUSD")
+
+                self.assertEqual(
+                    rest.public.conf("pub:list:pair:exchange"), ["BTCUSD", "ETHUSD"]
+                )
+
+                rest.public.conf("pub:list:currency")
+
+                self.assertEqual(get.call_count, 2)
+
+                get.return_value.json.return_value = [[1, 2, 3, 4, 5, 6]]
+
+                rest.public.get_candles_hist("tBTCUSD")
+                rest.public.get_candles_hist("tBTCUSD")
+
+                self.assertEqual(get.call_count, 4)
+
+    def test_expiration_and_eviction(self):
+        """Test that responses expire after their TTL, and are evicted LRU."""
+        cache = ResponseCache({"conf/": 10}, max_size=20)
+
+        with patch("bfxapi.rest._interface.response_cache.time.time") as now:
+            now.return_value = 0
+
+            cache.get("conf/a", lambda: ["aaaaa"])
+            cache.get("conf/b", lambda: ["bbbbb"])
+
+            self.assertEqual(cache.get("conf/a", lambda: None), ["aaaaa"])
+
+            cache.get("conf/c", lambda: ["ccccc"])
+
+            self.assertEqual(len(cache), 2)
+            self.assertIsNone(cache.get("conf/b", lambda: None))
+
+            now.return_value = 10
+
+            self.assertIsNone(cache.get("conf/a", lambda: None))
+
+    def test_coalescing(self):
+        """Test that identical concurrent requests are sent once."""
+        cache, gate, requests = ResponseCache(), threading.Event(), []
+
+        def request():
+            requests.append(gate.wait(5))
+
+            return [1]
+
+        threads = [
+            threading.Thread(target=cache.get, args=("platform/status", request))
+            for _ in range(4)
+        ]
+
+        for thread in threads:
+            thread.start()
+
+        gate.set()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(requests, [True])
+
+    def test_persistence(self):
+        """Test that a cache can be saved, and loaded by another process."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "cache.json")
+
+            cache = ResponseCache(path=path)
+
+            cache.get("calc/fx", lambda: [1.5], body={"ccy1": "EUR", "ccy2": "USD"})
+            cache.save()
+
+            cache = ResponseCache(path=path)
+
+            self.assertEqual(
+                cache.get("calc/fx", lambda: None, body={"ccy1": "EUR", "ccy2": "USD"}),
+                [1.5],
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
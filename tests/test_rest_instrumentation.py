@@ -0,0 +1,103 @@
+"""
+Tests for the instrumentation hooks and aggregates of the REST interfaces.
+"""
+
+import http.server
+import threading
+import unittest
+from datetime import timedelta
+from typing import Any, List
+from unittest.mock import MagicMock, patch
+
+from bfxapi.rest import BfxRestInterface, Instrumentation
+from bfxapi.rest.exceptions import RequestParameterError
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Length", "3")
+        self.end_headers()
+        self.wfile.write(b"[1]")
+
+    def log_message(self, *args):
+        pass
+
+
+class TestRestInstrumentation(unittest.TestCase):
+    """Test the instrumentation hooks and aggregates of the REST interfaces."""
+
+    def test_metrics(self):
+        """Test that requests are reported, with their endpoint method."""
+        reports: List[Any] = []
+
+        rest = BfxRestInterface(
+            "https://api.bitfinex.com/v2", instrumentation=Instrumentation()
+        )
+
+        assert rest.instrumentation is not None
+
+        rest.instrumentation.add_hook(reports.append)
+
+        response = MagicMock(status_code=200, content=b"[[1,2,3,4,5,6]]")
+
+        response.elapsed = timedelta(milliseconds=20)
+
+        with patch.object(rest.session, "get", return_value=response):
+            response.json.return_value = [[1, 2, 3, 4, 5, 6]]
+
+            rest.public.get_candles_hist("tBTCUSD")
+
+            response.json.return_value = ["error", 10020, "limit: invalid"]
+
+            with self.assertRaises(RequestParameterError):
+                rest.public.get_candles_hist("tBTCUSD", limit=100_000)
+
+        self.assertEqual(
+            [(metrics.name, metrics.error) for metrics in reports],
+            [("get_candles_hist", None), ("get_candles_hist", "RequestParameterError")],
+        )
+
+        metrics = reports[0]
+
+        self.assertEqual(metrics.endpoint, "candles/trade:1m:tBTCUSD/hist")
+        self.assertEqual((metrics.status, metrics.attempts), (200, 1))
+        self.assertEqual((metrics.response_bytes, metrics.first_byte), (15, 0.02))
+        self.assertGreaterEqual(metrics.decode, 0)
+        self.assertGreaterEqual(metrics.parse, 0)
+
+        stats = rest.instrumentation.get_stats()["get_candles_hist"]
+
+        self.assertEqual((stats.count, stats.error_rate), (2, 0.5))
+        self.assertEqual(sum(stats.histogram), 2)
+        self.assertEqual(stats.get_percentile(50), 0.01)
+
+    def test_connections(self):
+        """Test that new connections are timed, and reused ones aren't."""
+        server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+
+        reports: List[Any] = []
+
+        try:
+            with BfxRestInterface(
+                f"http://127.0.0.1:{server.server_port}/v2",
+                instrumentation=Instrumentation(reports.append),
+            ) as rest:
+                rest.public.get_platform_status()
+                rest.public.get_platform_status()
+        finally:
+            server.shutdown()
+
+            server.server_close()
+
+        self.assertIsNotNone(reports[0].connect)
+        self.assertIsNone(reports[1].connect)
+        self.assertEqual([metrics.response_bytes for metrics in reports], [3, 3])
+
+
+if __name__ == "__main__":
+    unittest.main()
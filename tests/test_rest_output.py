@@ -0,0 +1,48 @@
+"""
+Tests for the output option of the REST interfaces.
+"""
+
+import unittest
+from unittest.mock import patch
+
+from bfxapi.rest import BfxRestInterface
+from bfxapi.types import Candle, TradingPairTrade, set_precision, unset_precision
+
+
+class TestRestOutput(unittest.TestCase):
+    """Test the output option of the REST interfaces."""
+
+    def test_output(self):
+        """Test that endpoint methods use the output of their interface."""
+        rest = BfxRestInterface("https://api.bitfinex.com/v2", output="raw")
+
+        with patch.object(rest.public._m, "get", return_value=[[1, 2, 3, 4, 5, 6]]):
+            self.assertEqual(
+                rest.public.get_candles_hist("tBTCUSD"), [[1, 2, 3, 4, 5, 6]]
+            )
+
+        rest = BfxRestInterface("https://api.bitfinex.com/v2")
+
+        with patch.object(rest.public._m, "get", return_value=[[1, 2, 3, 4, 5, 6]]):
+            self.assertEqual(
+                rest.public.get_candles_hist("tBTCUSD"), [Candle(1, 2, 3, 4, 5, 6)]
+            )
+
+    def test_fixed_point(self):
+        """Test that book and trade endpoints use the precision of the pair."""
+        rest = BfxRestInterface("https://api.bitfinex.com/v2")
+
+        set_precision("tBTCUSD", price=2, amount=4)
+
+        try:
+            with patch.object(rest.public._m, "get", return_value=[[1, 2, 0.5, 0.07]]):
+                self.assertEqual(
+                    rest.public.get_t_trades("tBTCUSD"),
+                    [TradingPairTrade(1, 2, 5000, 7)],
+                )
+        finally:
+            unset_precision("tBTCUSD")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+"""
+Tests for the paginators of the history endpoints.
+"""
+
+import unittest
+from functools import partial
+from typing import Any
+from unittest.mock import patch
+
+from bfxapi.rest import BfxRestInterface
+from bfxapi.rest.exceptions import PaginationError
+from bfxapi.types import use_output
+
+from ._fixtures import HISTORY, get_history
+
+
+class TestRestPagination(unittest.TestCase):
+    """Test the paginators of the history endpoints."""
+
+    def test_records(self):
+        """Test that records are yielded once each, across page boundaries."""
+        rest = BfxRestInterface("https://api.bitfinex.com/v2")
+
+        with patch.object(rest.public._m, "get") as get:
+            get.side_effect = lambda endpoint, params, **kwargs: get_history(**params)
+
+            trades = list(rest.public.iter_t_trades("tBTCUSD", limit=3))
+
+        self.assertEqual([trade.id for trade in trades], [8, 7, 6, 5, 4, 3, 2, 1])
+        # The third page is full of trades already seen: it's requested again
+        self.assertEqual(
+            [
+                (call.kwargs["params"]["end"], call.kwargs["params"]["limit"])
+                for call in get.call_args_list
+            ],
+            [(None, 3), ("6", 3), ("6", 3), ("6", 6), ("4", 3)],
+        )
+
+    def test_pages(self):
+        """Test that pages can be prefetched, in the output of the interface."""
+        rest = BfxRestInterface("https://api.bitfinex.com/v2", output="raw")
+
+        with patch.object(rest.public._m, "get") as get:
+            get.side_effect = lambda endpoint, params, **kwargs: get_history(**params)
+
+            pages = list(
+                rest.public.iter_t_trades("tBTCUSD", limit=4, prefetch=True).pages()
+            )
+
+        self.assertEqual(pages, [HISTORY[:4], HISTORY[4:6], HISTORY[6:]])
+
+    def test_use_output(self):
+        """Test that prefetched pages are fetched in the output of the caller."""
+        rest = BfxRestInterface("https://api.bitfinex.com/v2")
+
+        with patch.object(rest.public._m, "get") as get:
+            get.side_effect = lambda endpoint, params, **kwargs: get_history(**params)
+
+            with use_output("raw"):
+                pages = list(
+                    rest.public.iter_t_trades("tBTCUSD", limit=4, prefetch=True).pages()
+                )
+
+        self.assertEqual(pages, [HISTORY[:4], HISTORY[4:6], HISTORY[6:]])
+
+    def test_timestamp_overflow(self):
+        """Test that records out of reach of any window raise an error."""
+        rest = BfxRestInterface("https://api.bitfinex.com/v2")
+
+        trades = []
+
+        with patch.object(rest.public._m, "get") as get:
+            get.side_effect = lambda endpoint, params, **kwargs: get_history(**params)
+
+            # Three trades share the MTS 6: the third one can't be reached
+            with self.assertRaises(PaginationError):
+                for trade in rest.public.iter_t_trades("tBTCUSD", limit=1):
+                    trades.append(trade.id)
+
+        self.assertEqual(trades, [8, 7, 6, 5])
+
+    def test_default_limit(self):
+        """Test that pages without a limit are probed with twice their size."""
+        rest = BfxRestInterface("https://api.bitfinex.com/v2")
+
+        def get_page(size: int, endpoint: str, params: Any, **kwargs: Any) -> Any:
+            # The endpoint returns <size> records unless told otherwise
+            return get_history(**{**params, "limit": params["limit"] or size})
+
+        for size, ids in [(3, [8, 7, 6, 5, 4, 3, 2, 1]), (1, [8, 7, 6, 5])]:
+            trades = []
+
+            with patch.object(rest.public._m, "get") as get:
+                get.side_effect = partial(get_page, size)
+
+                try:
+                    for trade in rest.public.iter_t_trades("tBTCUSD"):
+                        trades.append(trade.id)
+                except PaginationError:
+                    self.assertEqual(size, 1)
+
+            self.assertEqual(trades, ids)
+
+        self.assertEqual(
+            [call.kwargs["params"]["limit"] for call in get.call_args_list],
+            [None, *[None, 2] * 4],
+        )
+
+    def test_columnar_outputs(self):
+        """Test that columnar outputs are rejected."""
+        rest = BfxRestInterface("https://api.bitfinex.com/v2", output="columns")
+
+        with patch.object(rest.public._m, "get", return_value=HISTORY):
+            with self.assertRaises(ValueError):
+                list(rest.public.iter_t_trades("tBTCUSD"))
+
+
+if __name__ == "__main__":
+    unittest.main()
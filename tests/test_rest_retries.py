@@ -0,0 +1,124 @@
+"""
+Tests for the retry policy and the circuit breaker of the REST interfaces.
+"""
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+import requests
+
+from bfxapi.rest import BfxRestInterface, CircuitBreaker, RetryPolicy
+from bfxapi.rest.exceptions import CircuitOpenError, RequestParameterError
+
+from ._fixtures import WALLET
+
+
+class TestRestRetries(unittest.TestCase):
+    """Test the retry policy and the circuit breaker of the REST interfaces."""
+
+    def test_get(self):
+        """Test that GETs are retried on transient failures only."""
+        rest = BfxRestInterface("https://api.bitfinex.com/v2", retry_policy=True)
+
+        unavailable, ok = MagicMock(status_code=503), MagicMock(status_code=200)
+
+        ok.json.return_value = [1]
+
+        with patch.object(rest.session, "get") as get, patch(
+            "bfxapi.rest._interface.middleware.time.sleep"
+        ) as sleep:
+            get.side_effect = [requests.ConnectTimeout(), unavailable, ok]
+
+            self.assertEqual(rest.public.get_platform_status().status, 1)
+            self.assertEqual(get.call_count, 3)
+            self.assertEqual(sleep.call_count, 2)
+            self.assertEqual(get.call_args.kwargs["timeout"], (5.0, 30.0))
+
+            # Rejected requests get a 500 from Bitfinex: they aren't retried
+            get.side_effect = None
+
+            get.return_value = MagicMock(status_code=500)
+
+            get.return_value.json.return_value = ["error", 10020, "symbol: invalid"]
+
+            with self.assertRaises(RequestParameterError):
+                rest.public.get_platform_status()
+
+        self.assertEqual(get.call_count, 4)
+
+    def test_post(self):
+        """Test that POSTs are only retried on opt-in, with a fresh nonce."""
+        for retry_posts in (False, True):
+            rest = BfxRestInterface(
+                "https://api.bitfinex.com/v2",
+                "key",
+                "secret",
+                retry_policy=RetryPolicy(backoff=0, retry_posts=retry_posts),
+            )
+
+            response = MagicMock(status_code=200)
+
+            response.json.return_value = [WALLET]
+
+            with patch.object(rest.session, "post") as post:
+                post.side_effect = [requests.ConnectionError(), response]
+
+                if retry_posts:
+                    rest.auth.get_wallets()
+                else:
+                    with self.assertRaises(requests.ConnectionError):
+                        rest.auth.get_wallets()
+
+            nonces = [
+                call.kwargs["headers"]["bfx-nonce"] for call in post.call_args_list
+            ]
+
+            self.assertEqual(len(set(nonces)), 2 if retry_posts else 1)
+
+    def test_circuit_breaker(self):
+        """Test that requests fail fast while the circuit is open."""
+        breaker = CircuitBreaker(threshold=2, cooldown=10)
+
+        rest = BfxRestInterface("https://api.bitfinex.com/v2", circuit_breaker=breaker)
+
+        with patch.object(rest.session, "get") as get, patch(
+            "bfxapi.rest._interface.retry_policy.time.monotonic", return_value=0
+        ) as monotonic:
+            get.side_effect = requests.ReadTimeout()
+
+            for _ in range(2):
+                with self.assertRaises(requests.ReadTimeout):
+                    rest.public.get_platform_status()
+
+            with self.assertRaises(CircuitOpenError):
+                rest.public.get_platform_status()
+
+            self.assertEqual(get.call_count, 2)
+
+            # Once the cooldown is over, a request probes the host
+            monotonic.return_value = 10
+
+            get.side_effect, get.return_value.json.return_value = None, [1]
+
+            self.assertEqual(rest.public.get_platform_status().status, 1)
+            self.assertFalse(breaker.is_open("https://api.bitfinex.com/v2"))
+
+    def test_opt_in(self):
+        """Test that requests are sent once, with the default timeout."""
+        rest = BfxRestInterface("https://api.bitfinex.com/v2")
+
+        self.assertIsNone(rest.retry_policy)
+        self.assertIsNone(rest.circuit_breaker)
+
+        with patch.object(rest.session, "get") as get:
+            get.side_effect = requests.ConnectTimeout()
+
+            with self.assertRaises(requests.ConnectTimeout):
+                rest.public.get_platform_status()
+
+        get.assert_called_once()
+        self.assertEqual(get.call_args.kwargs["timeout"], 30)
+
+
+if __name__ == "__main__":
+    unittest.main()
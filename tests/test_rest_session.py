@@ -0,0 +1,55 @@
+"""
+Tests for the pooled session shared by the REST interfaces.
+"""
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+from requests import Session
+
+from bfxapi.rest import BfxRestInterface
+
+
+class TestRestSession(unittest.TestCase):
+    """Test the pooled session shared by the REST interfaces."""
+
+    def test_shared_session(self):
+        """Test that every interface sends its requests through one session."""
+        with BfxRestInterface("https://api.bitfinex.com/v2", pool_size=4) as rest:
+            self.assertIs(rest.public._m.session, rest.session)
+            self.assertIs(rest.auth._m.session, rest.session)
+            self.assertIs(rest.merchant._m.session, rest.session)
+            self.assertEqual(
+                rest.session.get_adapter("https://").poolmanager.connection_pool_kw[
+                    "maxsize"
+                ],
+                4,
+            )
+
+            with patch.object(rest.session, "get") as get:
+                get.return_value.json.return_value = [1]
+
+                self.assertEqual(rest.public.get_platform_status().status, 1)
+
+            self.assertEqual(
+                get.call_args.kwargs["url"],
+                "https://api.bitfinex.com/v2/platform/status",
+            )
+
+    def test_close(self):
+        """Test that only sessions created by the interface are closed."""
+        session = MagicMock(spec=Session)
+
+        BfxRestInterface("https://api.bitfinex.com/v2", session=session).close()
+
+        session.close.assert_not_called()
+
+        with patch.object(Session, "close") as close:
+            with BfxRestInterface("https://api.bitfinex.com/v2"):
+                close.assert_not_called()
+
+        close.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
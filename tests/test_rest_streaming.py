@@ -0,0 +1,71 @@
+"""
+Tests for the streaming decode of large REST responses.
+"""
+
+import unittest
+from unittest.mock import patch
+
+from bfxapi._utils.json_decoder import JSONDecoder
+from bfxapi._utils.json_stream import iter_array
+from bfxapi.rest import BfxRestInterface
+from bfxapi.rest.exceptions import RequestParameterError
+from bfxapi.types import Candle
+
+
+class TestRestStreaming(unittest.TestCase):
+    """Test the streaming decode of large REST responses."""
+
+    def test_iter_array(self):
+        """Test that elements are decoded across any chunk boundary."""
+        data = '[[1, 2.5, "caf\u00e9"], {"mtsCreate": 3}, 1234, [] ]'.encode()
+
+        for size in range(1, len(data) + 1):
+            chunks = [data[i : i + size] for i in range(0, len(data), size)]
+
+            self.assertEqual(
+                list(iter_array(chunks, JSONDecoder())),
+                [[1, 2.5, "café"], {"mts_create": 3}, 1234, []],
+            )
+
+        for data in (b"[1, 2", b'{"a": 1}', b"[1, }]"):
+            with self.assertRaises(ValueError):
+                list(iter_array([data], JSONDecoder()))
+
+    def test_iter_array_numbers(self):
+        """Test that numbers split across chunks are decoded once complete."""
+        data = b"[12.5,1e3,-7,0.25E-1]"
+
+        for size in range(1, len(data) + 1):
+            chunks = [data[i : i + size] for i in range(0, len(data), size)]
+
+            self.assertEqual(
+                list(iter_array(chunks, JSONDecoder())), [12.5, 1000.0, -7, 0.025]
+            )
+
+        for chunks in ([b"[1", b"x]"], [b"[1.", b"]"], [b"[1e"]):
+            with self.assertRaises(ValueError):
+                list(iter_array(chunks, JSONDecoder()))
+
+    def test_streaming(self):
+        """Test that streamed responses are parsed as they are downloaded."""
+        rest = BfxRestInterface("https://api.bitfinex.com/v2", streaming=True)
+
+        with patch.object(rest.session, "get") as get:
+            get.return_value.iter_content.return_value = [b"[[1,2,3,4", b",5,6]]"]
+
+            self.assertEqual(
+                rest.public.get_candles_hist("tBTCUSD"), [Candle(1, 2, 3, 4, 5, 6)]
+            )
+
+            self.assertIs(get.call_args.kwargs["stream"], True)
+
+            get.return_value.iter_content.return_value = [
+                b'["error", 10020, "limit: invalid"]'
+            ]
+
+            with self.assertRaises(RequestParameterError):
+                rest.public.get_candles_hist("tBTCUSD", limit=100_000)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,520 @@
+"""
+Tests for the generated parsers of _Serializer and _RecursiveSerializer.
+"""
+
+import pickle
+import unittest
+from dataclasses import FrozenInstanceError
+from typing import Any, List
+
+import numpy
+
+from bfxapi.types import (
+    InvoiceSubmission,
+    Notification,
+    Order,
+    PositionIncreaseInfo,
+    PulseMessage,
+    PulseProfile,
+    SymbolMarginInfo,
+    TradingPairTrade,
+    compact,
+    serializers,
+    set_default_output,
+    use_output,
+)
+from bfxapi.types.labeler import _flatten
+from bfxapi.types.serializers import _Notification
+
+from ._fixtures import ORDER
+
+PULSE_PROFILE = [
+    "d3f8c6d2",
+    1660000000000,
+    None,
+    "nickname",
+    None,
+    "picture",
+    "text",
+    None,
+    None,
+    "twitter",
+    None,
+    10,
+    5,
+    None,
+    None,
+    None,
+    1,
+]
+
+PULSE_MESSAGE = [
+    "a8b2c7e1",
+    1660000000000,
+    None,
+    "d3f8c6d2",
+    None,
+    "title",
+    "content",
+    None,
+    None,
+    1,
+    1,
+    0,
+    ["tag"],
+    [],
+    [{}],
+    3,
+    None,
+    None,
+    PULSE_PROFILE,
+    0,
+    None,
+    None,
+]
+
+
+class TestSerializerParse(unittest.TestCase):
+    """Test that generated parsers map labels to the right positions."""
+
+    def test_parse_skips_placeholders(self):
+        """Test that every label is taken from its own index."""
+        order = serializers.Order.parse(*ORDER)
+
+        self.assertIsInstance(order, Order)
+        self.assertEqual(order.id, 1747566428)
+        self.assertEqual(order.symbol, "tBTCUSD")
+        self.assertEqual(order.order_type, "EXCHANGE LIMIT")
+        self.assertEqual(order.flags, 4096)
+        self.assertEqual(order.order_status, "ACTIVE")
+        self.assertEqual(order.price, 27000.0)
+        self.assertEqual(order.routing, "API>BFX")
+        self.assertEqual(order.meta, {})
+
+    def test_parse_ignores_trailing_values(self):
+        """Test that extra values sent by the exchange are ignored."""
+        trade = serializers.TradingPairTrade.parse(1, 2, 0.5, 100.0, "extra")
+
+        self.assertEqual(trade, TradingPairTrade(id=1, mts=2, amount=0.5, price=100.0))
+
+    def test_parse_with_missing_values(self):
+        """Test that too few values raise an AssertionError."""
+        with self.assertRaises(AssertionError) as cm:
+            serializers.TradingPairTrade.parse(1, 2, 0.5)
+
+        self.assertIn("TradingPairTrade", str(cm.exception))
+
+    def test_parse_flat(self):
+        """Test that nested values are flattened before picking labels."""
+        info = serializers.SymbolMarginInfo.parse(
+            "sym", "tBTCUSD", [1.0, 2.0, 3.0, 4.0]
+        )
+
+        self.assertEqual(
+            info,
+            SymbolMarginInfo(
+                symbol="tBTCUSD",
+                tradable_balance=1.0,
+                gross_balance=2.0,
+                buy=3.0,
+                sell=4.0,
+            ),
+        )
+
+    def test_parse_recursive(self):
+        """Test that sub-serializers are applied to their labels."""
+        message = serializers.PulseMessage.parse(*PULSE_MESSAGE)
+
+        self.assertIsInstance(message, PulseMessage)
+        self.assertIsInstance(message.profile, PulseProfile)
+        self.assertEqual(message.profile.nickname, "nickname")
+        self.assertEqual(message.profile.followers, 10)
+        self.assertEqual(message.tags, ["tag"])
+
+    def test_parse_notification(self):
+        """Test that notifications parse their data with the given serializer."""
+        notification = _Notification[Order](serializers.Order).parse(
+            1678988263843, "on-req", None, None, ORDER, None, "SUCCESS", "Submitted"
+        )
+
+        self.assertIsInstance(notification, Notification)
+        self.assertEqual(notification.type, "on-req")
+        self.assertEqual(notification.status, "SUCCESS")
+        self.assertIsInstance(notification.data, Order)
+        self.assertEqual(notification.data.id, 1747566428)
+
+    def test_get_labels(self):
+        """Test that get_labels does not include placeholders."""
+        self.assertEqual(
+            serializers.TradingPairTrade.get_labels(), ["id", "mts", "amount", "price"]
+        )
+        self.assertNotIn("_PLACEHOLDER", serializers.Order.get_labels())
+
+
+class TestFlatten(unittest.TestCase):
+    """Test the iterative flattening used by flat serializers."""
+
+    def test_flatten_nested_layout(self):
+        """Test that values are flattened depth-first, in order."""
+        self.assertEqual(
+            _flatten([1, [2, [3, 4], []], 5, [[6]]], 6), [1, 2, 3, 4, 5, 6]
+        )
+
+    def test_flatten_stops_at_length(self):
+        """Test that flattening stops once enough values have been collected."""
+        self.assertEqual(_flatten([1, [2, 3], [4, [5]]], 3), [1, 2, 3])
+        self.assertEqual(_flatten([1, [2]], 5), [1, 2])
+
+    def test_flatten_deep_nesting(self):
+        """Test that nesting deeper than the recursion limit is supported."""
+        array: list = [1]
+
+        for _ in range(5_000):
+            array = [array]
+
+        self.assertEqual(_flatten(array, 1), [1])
+
+    def test_flatten_large_array(self):
+        """Test that large arrays are flattened in full."""
+        array = [[index, [index]] for index in range(100_000)]
+
+        self.assertEqual(len(_flatten(array, 200_000)), 200_000)
+
+    def test_parse_flat_nested_layout(self):
+        """Test a flat serializer whose layout is nested on more levels."""
+        info = serializers.PositionIncreaseInfo.parse(
+            [1, 2, 3, [4, 5, 6, 7]],
+            [None, None, None, None],
+            [8, None, None],
+            [9, 10, "USD", "USD"],
+        )
+
+        self.assertIsInstance(info, PositionIncreaseInfo)
+        self.assertEqual(info.max_pos, 1)
+        self.assertEqual(info.tradable_balance_base_total, 7)
+        self.assertEqual(info.funding_avail, 8)
+        self.assertEqual(info.funding_value, 9)
+        self.assertEqual(info.funding_required_currency, "USD")
+
+
+class TestCompactTypes(unittest.TestCase):
+    """Test the slotted and frozen outputs of the serializers."""
+
+    def test_compact_variant(self):
+        """Test that variants are cached, slotted and keep their fields."""
+        variant = compact(TradingPairTrade)
+
+        self.assertIs(variant, compact(TradingPairTrade))
+        self.assertIs(variant, compact(variant))
+        self.assertEqual(variant.__slots__, ("id", "mts", "amount", "price"))
+
+        trade = variant(id=1, mts=2, amount=0.5, price=100.0)
+
+        self.assertFalse(hasattr(trade, "__dict__"))
+        self.assertEqual(repr(trade), repr(TradingPairTrade(1, 2, 0.5, 100.0)))
+
+    def test_use_output_slots(self):
+        """Test that serializers build slotted instances within use_output."""
+        with use_output("slots"):
+            trade = serializers.TradingPairTrade.parse(1, 2, 0.5, 100.0)
+            message = serializers.PulseMessage.parse(*PULSE_MESSAGE)
+
+        self.assertIsInstance(trade, compact(TradingPairTrade))
+        self.assertFalse(hasattr(trade, "__dict__"))
+        self.assertIsInstance(message.profile, compact(PulseProfile))
+        self.assertIsInstance(
+            serializers.TradingPairTrade.parse(1, 2, 0.5, 100.0), TradingPairTrade
+        )
+
+    def test_use_output_frozen(self):
+        """Test that frozen instances can't be modified and can be pickled."""
+        with use_output("frozen"):
+            order = serializers.Order.parse(*ORDER)
+            notification = _Notification[Order](serializers.Order).parse(
+                1678988263843, "on-req", None, None, [ORDER], None, "SUCCESS", ""
+            )
+
+        with self.assertRaises(FrozenInstanceError):
+            order.price = 28000.0  # type: ignore[misc]
+
+        self.assertEqual(pickle.loads(pickle.dumps(order)), order)
+        self.assertIsInstance(notification.data, compact(Order, frozen=True))
+
+        with self.assertRaises(FrozenInstanceError):
+            notification.data = None  # type: ignore[misc]
+
+    def test_set_default_output(self):
+        """Test that the default output applies outside of use_output."""
+        set_default_output("slots")
+
+        try:
+            trade = serializers.TradingPairTrade.parse(1, 2, 0.5, 100.0)
+        finally:
+            set_default_output("dataclass")
+
+        self.assertIsInstance(trade, compact(TradingPairTrade))
+
+    def test_unknown_output(self):
+        """Test that unknown outputs are rejected."""
+        with self.assertRaises(ValueError):
+            set_default_output("unknown")  # type: ignore[arg-type]
+
+    def test_partial_types(self):
+        """Test that merchant types decorated with partial support variants."""
+        with use_output("frozen"):
+            invoice = InvoiceSubmission.parse(
+                {"id": "a1b2c3", "invoices": [{"amount": 1.0}]}
+            )
+
+        self.assertIsInstance(invoice, compact(InvoiceSubmission, frozen=True))
+        self.assertIsNone(invoice.payment)
+        self.assertEqual(invoice.invoices[0].amount, 1.0)
+        self.assertFalse(hasattr(invoice.invoices[0], "__dict__"))
+
+    def test_isinstance(self):
+        """Test that every output which builds objects is an instance of its type."""
+        serializer = _Notification[Order](serializers.Order)
+
+        for output in ("dataclass", "slots", "frozen", "lazy"):
+            with self.subTest(output=output), use_output(output):
+                notification = serializer.parse(
+                    1678988263843, "on-req", None, None, [ORDER], None, "SUCCESS", ""
+                )
+
+                order = serializers.Order.scale(price=2).parse(*ORDER)
+
+                self.assertIsInstance(notification, Notification)
+                self.assertIsInstance(notification.data, Order)
+                self.assertIsInstance(order, Order)
+                self.assertTrue(issubclass(type(order), Order))
+
+
+class TestTupleOutputs(unittest.TestCase):
+    """Test the namedtuple and raw outputs of the serializers."""
+
+    def test_namedtuple_output(self):
+        """Test that the namedtuple output uses the labels as field names."""
+        with use_output("namedtuple"):
+            trade = serializers.TradingPairTrade.parse(1, 2, 0.5, 100.0)
+            order = serializers.Order.parse(*ORDER)
+
+        self.assertIsInstance(trade, serializers.TradingPairTrade.get_namedtuple())
+        self.assertEqual(trade, (1, 2, 0.5, 100.0))
+        self.assertEqual(trade.price, 100.0)
+        self.assertEqual(order._fields, tuple(serializers.Order.get_labels()))
+        self.assertEqual(order.routing, "API>BFX")
+
+    def test_namedtuple_pickle(self):
+        """Test that named tuples can be pickled, though not their classes."""
+        with use_output("namedtuple"):
+            message = serializers.PulseMessage.parse(*PULSE_MESSAGE)
+
+        copy = pickle.loads(pickle.dumps(message))
+
+        self.assertEqual(copy, message)
+        self.assertIs(type(copy.profile), type(message.profile))
+
+        with self.assertRaises(pickle.PicklingError):
+            pickle.dumps(type(message))
+
+    def test_raw_output(self):
+        """Test that the raw output is the list of values without placeholders."""
+        with use_output("raw"):
+            order = serializers.Order.parse(*ORDER)
+            info = serializers.SymbolMarginInfo.parse(
+                "sym", "tBTCUSD", [1.0, 2.0, 3.0, 4.0]
+            )
+
+        self.assertEqual(len(order), len(serializers.Order.get_labels()))
+        self.assertEqual(
+            order[:4], [1747566428, 1678988263842, 1678988263842, "tBTCUSD"]
+        )
+        self.assertEqual(info, ["tBTCUSD", 1.0, 2.0, 3.0, 4.0])
+
+    def test_nested_outputs(self):
+        """Test that sub-serializers and notifications use the same output."""
+        with use_output("namedtuple"):
+            message = serializers.PulseMessage.parse(*PULSE_MESSAGE)
+
+        self.assertEqual(message.profile.nickname, "nickname")
+
+        with use_output("raw"):
+            notification = _Notification[Order](serializers.Order).parse(
+                1678988263843, "on-req", None, None, ORDER, None, "SUCCESS", ""
+            )
+
+        self.assertEqual(notification[:2], [1678988263843, "on-req"])
+        self.assertEqual(notification[3][0], 1747566428)
+
+
+class TestLazyOutput(unittest.TestCase):
+    """Test the read-only views built by the lazy output."""
+
+    def test_lazy_fields(self):
+        """Test that views expose the labels of the dataclass and nothing else."""
+        with use_output("lazy"):
+            order = serializers.Order.parse(*ORDER)
+
+        self.assertIsInstance(order, serializers.Order.get_lazy_record())
+        self.assertEqual(order.price, 27000.0)
+        self.assertEqual(order.routing, "API>BFX")
+        self.assertEqual(repr(order), repr(serializers.Order.parse(*ORDER)))
+        self.assertEqual(order, serializers.Order.get_lazy_record()(ORDER, {}))
+        self.assertFalse(hasattr(order, "_PLACEHOLDER"))
+        self.assertFalse(hasattr(order, "__dict__"))
+
+        with self.assertRaises(AttributeError):
+            order.price = 28000.0
+
+    def test_lazy_conversion(self):
+        """Test that sub-serialized fields are parsed only when they are read."""
+        with use_output("lazy"):
+            message = serializers.PulseMessage.parse(*PULSE_MESSAGE)
+            info = serializers.SymbolMarginInfo.parse(
+                "sym", "tBTCUSD", [1.0, 2.0, 3.0, 4.0]
+            )
+
+        self.assertIs(message._values[18], PULSE_PROFILE)
+        self.assertIsInstance(message.profile, PulseProfile)
+        self.assertEqual(message.profile.nickname, "nickname")
+        self.assertEqual(info.sell, 4.0)
+
+    def test_lazy_cache(self):
+        """Test that sub-serialized fields are parsed once, on first read."""
+        profiles: List[Any] = []
+
+        def parse(*values: Any) -> Any:
+            profiles.append(serializers.PulseProfile.parse(*values))
+
+            return profiles[-1]
+
+        message = serializers.PulseMessage.get_lazy_record()(
+            PULSE_MESSAGE, {"profile": parse}
+        )
+
+        self.assertIs(message.profile, message.profile)
+        self.assertEqual(len(profiles), 1)
+        self.assertFalse(hasattr(message, "__dict__"))
+
+    def test_lazy_pickle(self):
+        """Test that views are pickled with their sub-serialized fields parsed."""
+        with use_output("lazy"):
+            message = serializers.PulseMessage.parse(*PULSE_MESSAGE)
+
+        copy = pickle.loads(pickle.dumps(message))
+
+        self.assertIs(type(copy), type(message))
+        self.assertEqual(copy, message)
+        self.assertEqual(copy._parsers, {})
+        self.assertIsInstance(copy.profile, PulseProfile)
+
+    def test_lazy_missing_values(self):
+        """Test that too few values raise an AssertionError."""
+        with use_output("lazy"), self.assertRaises(AssertionError):
+            serializers.TradingPairTrade.parse(1, 2, 0.5)
+
+
+class TestFixedPoint(unittest.TestCase):
+    """Test the serializer variants which parse labels into scaled integers."""
+
+    def test_scale(self):
+        """Test that scaled labels are rounded to exact integers."""
+        serializer = serializers.TradingPairTrade.scale(price=2, amount=8)
+
+        self.assertIs(serializer, serializers.TradingPairTrade.scale(amount=8, price=2))
+        self.assertEqual(
+            serializer.parse(1, 2, -0.00012345, 27000.15),
+            TradingPairTrade(id=1, mts=2, amount=-12345, price=2700015),
+        )
+        self.assertEqual(serializers.TradingPairTrade.parse(1, 2, 0.5, 1.1).price, 1.1)
+
+    def test_scale_outputs(self):
+        """Test that scaled variants support every output."""
+        serializer = serializers.TradingPairRawBook.scale(price=1, amount=2)
+
+        with use_output("namedtuple"):
+            self.assertEqual(serializer.parse(1, 0.3, 1.5), (1, 3, 150))
+
+        with use_output("raw"):
+            self.assertEqual(serializer.parse(1, 0.3, 1.5), [1, 3, 150])
+
+        with use_output("lazy"):
+            self.assertEqual(serializer.parse(1, 0.3, 1.5).price, 3)
+
+        with use_output("columns"):
+            columns = serializer.parse_many([[1, 0.3, 1.5], [2, 0.1, -0.07]])
+
+        self.assertEqual(columns["price"].tolist(), [3, 1])
+        self.assertEqual(columns["amount"].dtype, numpy.int64)
+
+    def test_scale_unknown_label(self):
+        """Test that only existing labels can be scaled."""
+        with self.assertRaises(ValueError):
+            serializers.TradingPairTrade.scale(rate=2)
+
+
+class TestColumnarOutputs(unittest.TestCase):
+    """Test the numpy and columns outputs of parse_many."""
+
+    CANDLES = [
+        [1678988280000, 24800, 24810.5, 24820, 24790, 1.5],
+        [1678988220000, 24790, 24800, 24805, 24780, 2.25, "extra"],
+    ]
+
+    def test_parse_many(self):
+        """Test that parse_many parses each record with the current output."""
+        self.assertEqual(
+            serializers.TradingPairTrade.parse_many([[1, 2, 0.5, 100.0]]),
+            [TradingPairTrade(id=1, mts=2, amount=0.5, price=100.0)],
+        )
+
+        with use_output("raw"):
+            self.assertEqual(
+                serializers.Candle.parse_many(self.CANDLES)[1][:2],
+                [1678988220000, 24790],
+            )
+
+    def test_numpy_output(self):
+        """Test that records are decoded into a structured array of labels."""
+        with use_output("numpy"):
+            candles = serializers.Candle.parse_many(self.CANDLES)
+
+        self.assertIsInstance(candles, numpy.ndarray)
+        self.assertEqual(candles.dtype.names, tuple(serializers.Candle.get_labels()))
+        self.assertEqual(candles["mts"].dtype, numpy.int64)
+        self.assertEqual(candles["close"].tolist(), [24810.5, 24800])
+        self.assertEqual(candles["volume"].sum(), 3.75)
+
+    def test_columns_output(self):
+        """Test that columns keep strings and turn nullable numbers into NaN."""
+        ledgers = [
+            [1, "USD", None, 1678988263842, None, -1.5, 98.5, None, "fee"],
+            [2, "USD", None, 1678988263843, None, None, 97.0, None, "fee"],
+        ]
+
+        with use_output("columns"):
+            columns = serializers.Ledger.parse_many(ledgers)
+
+        self.assertIsInstance(columns, dict)
+        self.assertEqual(list(columns), serializers.Ledger.get_labels())
+        self.assertEqual(columns["currency"].tolist(), ["USD", "USD"])
+        self.assertTrue(numpy.isnan(columns["amount"][1]))
+
+    def test_columnar_objects(self):
+        """Test that nested and sub-serialized values are kept as objects."""
+        with use_output("columns"):
+            columns = serializers.PulseMessage.parse_many([PULSE_MESSAGE])
+            empty = serializers.Candle.parse_many([])
+
+        self.assertEqual(columns["tags"].dtype, object)
+        self.assertIsInstance(columns["profile"][0], PulseProfile)
+        self.assertEqual(len(empty["mts"]), 0)
+
+    def test_columnar_missing_values(self):
+        """Test that records with too few values raise an AssertionError."""
+        with use_output("numpy"), self.assertRaises(AssertionError):
+            serializers.TradingPairTrade.parse_many([[1, 2, 0.5, 100.0], [1, 2]])
+
+
+if __name__ == "__main__":
+    unittest.main()